@@ -7,6 +7,7 @@ from pathlib import Path
 from datetime import timedelta
 
 import dj_database_url
+from corsheaders.defaults import default_headers
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -116,6 +117,8 @@ CORS_ALLOWED_ORIGINS = [
     if origin.strip()
 ]
 CORS_ALLOW_CREDENTIALS = True
+# Sent by the chunked upload client.
+CORS_ALLOW_HEADERS = (*default_headers, "upload-offset")
 
 # REST Framework
 REST_FRAMEWORK = {
@@ -127,6 +130,28 @@ REST_FRAMEWORK = {
     ),
 }
 
+# Session and interview listings are cursor-paginated (`?page_size=` up to the max)
+LIST_PAGE_SIZE = int(os.environ.get("LIST_PAGE_SIZE", "20"))
+LIST_MAX_PAGE_SIZE = int(os.environ.get("LIST_MAX_PAGE_SIZE", "100"))
+
+# Per-process local-memory cache; set CACHE_URL (redis://...) to share one
+# between processes, so they all see question bank changes at once
+CACHE_URL = os.environ.get("CACHE_URL", "")
+CACHES = {
+    "default": (
+        {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": CACHE_URL}
+        if CACHE_URL
+        else {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "OPTIONS": {"MAX_ENTRIES": 1000}}
+    )
+}
+
+# Question bank listings and the index mock session questions are sampled from
+# are cached until questions change, and for at most QUESTION_BANK_CACHE_TTL
+# seconds (the bound on staleness between processes with local caches).
+# Questions from the candidate's last QUESTION_RECENT_SESSIONS sessions are avoided (0 disables)
+QUESTION_BANK_CACHE_TTL = int(os.environ.get("QUESTION_BANK_CACHE_TTL", "300"))
+QUESTION_RECENT_SESSIONS = int(os.environ.get("QUESTION_RECENT_SESSIONS", "3"))
+
 # JWT
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(hours=1),
@@ -135,9 +160,88 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
-# File uploads
-DATA_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB
-FILE_UPLOAD_MAX_MEMORY_SIZE = 104857600  # 100MB
+# File uploads. Multipart files above FILE_UPLOAD_MAX_MEMORY_SIZE are
+# spooled to a temp file rather than held in memory; large recordings should
+# use the chunked upload API instead.
+DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10MB of non-file form data
+FILE_UPLOAD_MAX_MEMORY_SIZE = 2621440  # 2.5MB
+
+# Chunked, resumable video uploads. Part files (and spooled multipart video
+# uploads) live outside MEDIA_ROOT so they are never served, but should be on
+# the same filesystem so moving a finished upload into place is a rename.
+CHUNKED_UPLOAD_DIR = os.environ.get("CHUNKED_UPLOAD_DIR", str(BASE_DIR / "upload_parts"))
+CHUNKED_UPLOAD_MAX_SIZE = int(os.environ.get("CHUNKED_UPLOAD_MAX_SIZE", str(500 * 1024 * 1024)))
+CHUNKED_UPLOAD_CHUNK_SIZE = int(os.environ.get("CHUNKED_UPLOAD_CHUNK_SIZE", str(5 * 1024 * 1024)))
+# Unfinished uploads idle this long are removed by `manage.py gc_media`.
+CHUNKED_UPLOAD_EXPIRY = int(os.environ.get("CHUNKED_UPLOAD_EXPIRY", str(24 * 3600)))
+
+# `manage.py gc_media` leaves files and blobs touched within this window alone,
+# so uploads in flight and blobs about to be re-referenced are never collected.
+MEDIA_GC_GRACE_SECONDS = int(os.environ.get("MEDIA_GC_GRACE_SECONDS", str(24 * 3600)))
+
+# Answer videos are served by `api/media/videos/...` behind signed URLs that
+# expire within VIDEO_URL_MAX_AGE seconds, and no sooner than half of it.
+# Set MEDIA_ACCEL_REDIRECT_PREFIX to an nginx `internal` location aliased to
+# MEDIA_ROOT to offload the bytes to nginx.
+VIDEO_URL_MAX_AGE = int(os.environ.get("VIDEO_URL_MAX_AGE", str(6 * 3600)))
+MEDIA_ACCEL_REDIRECT_PREFIX = os.environ.get("MEDIA_ACCEL_REDIRECT_PREFIX", "")
 
 # Groq AI
 GROQ_API_KEY = os.environ.get("GROQ_API_KEY", "")
+
+# Background analysis jobs (see `manage.py run_analysis_worker`)
+ANALYSIS_JOB_MAX_ATTEMPTS = int(os.environ.get("ANALYSIS_JOB_MAX_ATTEMPTS", "3"))
+ANALYSIS_JOB_LEASE_SECONDS = int(os.environ.get("ANALYSIS_JOB_LEASE_SECONDS", "900"))
+ANALYSIS_JOB_RETRY_DELAY = int(os.environ.get("ANALYSIS_JOB_RETRY_DELAY", "30"))
+# How often a session job re-checks for upload-time response analysis still in flight
+ANALYSIS_STRAGGLER_POLL_SECONDS = float(os.environ.get("ANALYSIS_STRAGGLER_POLL_SECONDS", "2"))
+
+# Max responses of one mock session transcribed/scored in parallel (1 = sequential)
+AI_ANALYSIS_CONCURRENCY = int(os.environ.get("AI_ANALYSIS_CONCURRENCY", "4"))
+
+# Transcript cache (keyed by media content hash); least recently used entries are evicted
+TRANSCRIPT_CACHE_MAX_ENTRIES = int(os.environ.get("TRANSCRIPT_CACHE_MAX_ENTRIES", "10000"))
+
+# Audio extraction: send Whisper a mono 16 kHz Opus track instead of the full video
+AI_AUDIO_EXTRACTION = os.environ.get("AI_AUDIO_EXTRACTION", "True").lower() in ("true", "1", "yes")
+AI_AUDIO_BITRATE = os.environ.get("AI_AUDIO_BITRATE", "24k")
+AI_AUDIO_EXTRACTION_TIMEOUT = int(os.environ.get("AI_AUDIO_EXTRACTION_TIMEOUT", "120"))
+FFMPEG_BINARY = os.environ.get("FFMPEG_BINARY", "ffmpeg")
+
+# Stored recordings are re-encoded to bounded-bitrate VP9/Opus once analyzed,
+# by `manage.py compact_media --watch` (started next to the analysis worker).
+MEDIA_COMPACTION = os.environ.get("MEDIA_COMPACTION", "True").lower() in ("true", "1", "yes")
+MEDIA_COMPACTION_VIDEO_BITRATE = os.environ.get("MEDIA_COMPACTION_VIDEO_BITRATE", "400k")
+MEDIA_COMPACTION_AUDIO_BITRATE = os.environ.get("MEDIA_COMPACTION_AUDIO_BITRATE", "32k")
+MEDIA_COMPACTION_MAX_HEIGHT = int(os.environ.get("MEDIA_COMPACTION_MAX_HEIGHT", "480"))
+MEDIA_COMPACTION_MIN_AGE = int(os.environ.get("MEDIA_COMPACTION_MIN_AGE", "3600"))
+MEDIA_COMPACTION_TIMEOUT = int(os.environ.get("MEDIA_COMPACTION_TIMEOUT", "600"))
+
+# Groq HTTP client (shared per process)
+GROQ_CONNECT_TIMEOUT = float(os.environ.get("GROQ_CONNECT_TIMEOUT", "5"))
+GROQ_READ_TIMEOUT = float(os.environ.get("GROQ_READ_TIMEOUT", "60"))
+GROQ_MAX_CONNECTIONS = int(os.environ.get("GROQ_MAX_CONNECTIONS", "20"))
+GROQ_KEEPALIVE_EXPIRY = float(os.environ.get("GROQ_KEEPALIVE_EXPIRY", "30"))
+
+# Scoring cache (keyed by a fingerprint of the rendered scoring request)
+SCORING_CACHE_TTL = int(os.environ.get("SCORING_CACHE_TTL", str(30 * 24 * 3600)))
+SCORING_CACHE_MAX_ENTRIES = int(os.environ.get("SCORING_CACHE_MAX_ENTRIES", "50000"))
+
+# Answers scored per LLM call during session analysis (1 = one call per answer)
+AI_SCORING_BATCH_SIZE = int(os.environ.get("AI_SCORING_BATCH_SIZE", "1"))
+
+# How answer confidence is derived from emotion detection: "averages" (weighted
+# per-emotion averages) or "timeline" (per-frame, discounted for instability)
+EMOTION_CONFIDENCE_SCORER = os.environ.get("EMOTION_CONFIDENCE_SCORER", "averages")
+
+# Groq rate limiting, retries and circuit breaker (limits are per process; 0 disables a limit).
+# The request default matches Groq's free-tier limit of 30 requests/minute per model. A 10-answer
+# session makes about 21 calls (10 transcriptions, 10 scorings, 1 summary), so a worker analyzes
+# roughly 1.5 sessions a minute at this default; raise it to your plan's limit.
+GROQ_REQUESTS_PER_MINUTE = int(os.environ.get("GROQ_REQUESTS_PER_MINUTE", "30"))
+GROQ_TOKENS_PER_MINUTE = int(os.environ.get("GROQ_TOKENS_PER_MINUTE", "0"))
+GROQ_MAX_RETRIES = int(os.environ.get("GROQ_MAX_RETRIES", "4"))
+GROQ_RETRY_BASE_DELAY = float(os.environ.get("GROQ_RETRY_BASE_DELAY", "1"))
+GROQ_RETRY_MAX_DELAY = float(os.environ.get("GROQ_RETRY_MAX_DELAY", "30"))
+GROQ_CIRCUIT_FAILURE_THRESHOLD = int(os.environ.get("GROQ_CIRCUIT_FAILURE_THRESHOLD", "5"))
+GROQ_CIRCUIT_RESET_SECONDS = float(os.environ.get("GROQ_CIRCUIT_RESET_SECONDS", "60"))
@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse
+from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse, AnalysisJob, TranscriptCacheEntry, ScoringCacheEntry, ChunkedUpload, MediaBlob
 
 
 @admin.register(Interview)
@@ -36,3 +36,34 @@ class MockSessionAdmin(admin.ModelAdmin):
 class MockResponseAdmin(admin.ModelAdmin):
     list_display = ("session", "question_order", "ai_score", "analysis_status", "duration", "created_at")
     list_filter = ("analysis_status",)
+
+
+@admin.register(AnalysisJob)
+class AnalysisJobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "mock_session", "mock_response", "status", "attempts", "locked_by", "available_at", "created_at")
+    list_filter = ("kind", "status")
+    readonly_fields = ("locked_by", "locked_at", "started_at", "finished_at")
+
+
+@admin.register(TranscriptCacheEntry)
+class TranscriptCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ("content_hash", "model", "response_format", "hit_count", "last_used_at")
+    search_fields = ("content_hash",)
+
+
+@admin.register(ScoringCacheEntry)
+class ScoringCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ("fingerprint", "model", "prompt_version", "hit_count", "last_used_at")
+    list_filter = ("model", "prompt_version")
+
+
+@admin.register(ChunkedUpload)
+class ChunkedUploadAdmin(admin.ModelAdmin):
+    list_display = ("filename", "user", "target", "offset", "size", "status", "updated_at")
+    list_filter = ("target", "status")
+
+
+@admin.register(MediaBlob)
+class MediaBlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "ref_count", "updated_at")
+    search_fields = ("name", "content_hash")
@@ -0,0 +1,189 @@
+import hashlib
+import json
+import logging
+import threading
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError, IntegrityError
+from django.db.models import F
+from django.utils import timezone
+
+from .models import ScoringCacheEntry, TranscriptCacheEntry
+
+logger = logging.getLogger(__name__)
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+_stats_lock = threading.Lock()
+_transcript_stats = {"hits": 0, "misses": 0}
+_scoring_stats = {"hits": 0, "misses": 0}
+
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _count(stats: dict, key: str) -> None:
+    with _stats_lock:
+        stats[key] += 1
+
+
+def _snapshot(stats: dict) -> dict:
+    with _stats_lock:
+        stats = dict(stats)
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+    return stats
+
+
+def transcript_cache_stats() -> dict:
+    """Hit/miss counters for this process since startup (or the last reset)."""
+    return _snapshot(_transcript_stats)
+
+
+def scoring_cache_stats() -> dict:
+    return _snapshot(_scoring_stats)
+
+
+def reset_transcript_cache_stats() -> None:
+    with _stats_lock:
+        _transcript_stats.update(hits=0, misses=0)
+
+
+def reset_scoring_cache_stats() -> None:
+    with _stats_lock:
+        _scoring_stats.update(hits=0, misses=0)
+
+
+def get_cached_transcript(content_hash: str, model: str, response_format: str):
+    """Return the cached transcript for this media, or None on a miss.
+
+    Cache errors are logged and treated as a miss; they never fail analysis.
+    """
+    try:
+        entry = TranscriptCacheEntry.objects.filter(
+            content_hash=content_hash, model=model, response_format=response_format
+        ).only("id", "transcript").first()
+        if entry is not None:
+            TranscriptCacheEntry.objects.filter(id=entry.id).update(
+                hit_count=F("hit_count") + 1, last_used_at=timezone.now()
+            )
+    except DatabaseError as e:
+        logger.warning(f"Transcript cache lookup failed: {e}")
+        entry = None
+
+    if entry is None:
+        _count(_transcript_stats, "misses")
+        return None
+
+    _count(_transcript_stats, "hits")
+    return entry.transcript
+
+
+def store_transcript(content_hash: str, model: str, response_format: str, transcript: str) -> None:
+    try:
+        TranscriptCacheEntry.objects.create(
+            content_hash=content_hash,
+            model=model,
+            response_format=response_format,
+            transcript=transcript,
+        )
+        _evict_least_recently_used(TranscriptCacheEntry, settings.TRANSCRIPT_CACHE_MAX_ENTRIES)
+    except IntegrityError:
+        # Another worker stored the same media first; its transcript is as good as ours.
+        pass
+    except DatabaseError as e:
+        logger.warning(f"Transcript cache store failed: {e}")
+
+
+def copy_cached_transcripts(old_hash: str, new_hash: str) -> None:
+    """Make transcripts cached for ``old_hash`` also answer for ``new_hash``.
+
+    Used when a recording is replaced by a transcoded copy of the same audio,
+    so re-analysis still hits the cache under the new file's hash.
+    """
+    if not old_hash or old_hash == new_hash:
+        return
+    try:
+        entries = TranscriptCacheEntry.objects.filter(content_hash=old_hash)
+        TranscriptCacheEntry.objects.bulk_create(
+            [
+                TranscriptCacheEntry(
+                    content_hash=new_hash,
+                    model=entry.model,
+                    response_format=entry.response_format,
+                    transcript=entry.transcript,
+                )
+                for entry in entries
+            ],
+            ignore_conflicts=True,
+        )
+    except DatabaseError as e:
+        logger.warning(f"Transcript cache copy failed: {e}")
+
+
+def scoring_fingerprint(**request) -> str:
+    """Stable hash of everything that determines a scoring response."""
+    canonical = json.dumps(request, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def get_cached_score(fingerprint: str):
+    """Return the cached, normalized score dict for ``fingerprint``, or None.
+
+    Entries older than SCORING_CACHE_TTL seconds count as a miss and are dropped.
+    """
+    try:
+        entry = ScoringCacheEntry.objects.filter(fingerprint=fingerprint).only("id", "result", "created_at").first()
+        if entry is not None:
+            expired_before = timezone.now() - timedelta(seconds=settings.SCORING_CACHE_TTL)
+            if entry.created_at < expired_before:
+                ScoringCacheEntry.objects.filter(id=entry.id).delete()
+                entry = None
+            else:
+                ScoringCacheEntry.objects.filter(id=entry.id).update(
+                    hit_count=F("hit_count") + 1, last_used_at=timezone.now()
+                )
+    except DatabaseError as e:
+        logger.warning(f"Scoring cache lookup failed: {e}")
+        entry = None
+
+    if entry is None:
+        _count(_scoring_stats, "misses")
+        return None
+
+    _count(_scoring_stats, "hits")
+    return entry.result
+
+
+def store_score(fingerprint: str, model: str, prompt_version: str, result: dict) -> None:
+    try:
+        ScoringCacheEntry.objects.create(
+            fingerprint=fingerprint,
+            model=model,
+            prompt_version=prompt_version,
+            result=result,
+        )
+        _evict_least_recently_used(ScoringCacheEntry, settings.SCORING_CACHE_MAX_ENTRIES)
+    except IntegrityError:
+        # Scored concurrently by another worker.
+        pass
+    except DatabaseError as e:
+        logger.warning(f"Scoring cache store failed: {e}")
+
+
+def _evict_least_recently_used(model, max_entries: int) -> None:
+    excess = model.objects.count() - max_entries
+    if excess <= 0:
+        return
+    stale_ids = list(
+        model.objects.order_by("last_used_at").values_list("id", flat=True)[:excess]
+    )
+    model.objects.filter(id__in=stale_ids).delete()
+    logger.info(f"Evicted {len(stale_ids)} {model._meta.verbose_name_plural}")
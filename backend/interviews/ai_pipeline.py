@@ -1,41 +1,93 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
+from django.db import connections
+from django.utils import timezone
+
+from .ai_cache import (
+    get_cached_score,
+    get_cached_transcript,
+    hash_file,
+    scoring_fingerprint,
+    store_score,
+    store_transcript,
+)
+from .emotions import analyze_emotions, session_emotion_summary
+from .groq_client import ProviderUnavailable, call_with_retries, get_groq_client
+from .media import extract_audio
+from .models import MockResponse, MockSession
+from .snapshots import write_snapshot
 
 logger = logging.getLogger(__name__)
 
 
-def get_groq_client():
-    from groq import Groq
-    api_key = settings.GROQ_API_KEY
-    if not api_key:
-        raise ValueError("GROQ_API_KEY not configured")
-    return Groq(api_key=api_key)
+TRANSCRIPTION_MODEL = "whisper-large-v3"
+TRANSCRIPTION_RESPONSE_FORMAT = "text"
 
 
-def transcribe_video(video_path: str) -> str:
-    """Transcribe video/audio using Groq Whisper API."""
-    client = get_groq_client()
+class TranscriptionFailed(RuntimeError):
+    """The recording could not be transcribed; the answer is not scored."""
+
+
+def transcribe_video(video_path: str, content_hash: str = "") -> str:
+    """Transcribe video/audio using Groq Whisper API, reusing cached transcripts.
+
+    Returns ``""`` only when the provider heard no speech. Raises
+    ProviderUnavailable when the provider is rate limiting or down, so callers
+    can retry later, and TranscriptionFailed when the file cannot be read or
+    the provider rejects it, rather than treating the answer as silent.
+    """
     try:
-        with open(video_path, "rb") as f:
-            transcription = client.audio.transcriptions.create(
-                file=(os.path.basename(video_path), f.read()),
-                model="whisper-large-v3",
-                response_format="text",
+        content_hash = content_hash or hash_file(video_path)
+    except OSError as e:
+        logger.error(f"Could not read {video_path}: {e}")
+        raise TranscriptionFailed(f"Could not read the recording: {e}") from e
+
+    cached = get_cached_transcript(content_hash, TRANSCRIPTION_MODEL, TRANSCRIPTION_RESPONSE_FORMAT)
+    if cached is not None:
+        return cached
+
+    client = get_groq_client()
+    # Whisper only needs the audio track; fall back to the original file if extraction fails.
+    audio_path = extract_audio(video_path)
+    upload_path = audio_path or video_path
+
+    def upload():
+        # Reopened per attempt so a retry resends the file from the start.
+        with open(upload_path, "rb") as f:
+            return client.audio.transcriptions.create(
+                file=(os.path.basename(upload_path), f),
+                model=TRANSCRIPTION_MODEL,
+                response_format=TRANSCRIPTION_RESPONSE_FORMAT,
             )
-        return transcription.strip() if isinstance(transcription, str) else str(transcription).strip()
+
+    try:
+        transcription = call_with_retries(upload)
+        transcript = transcription.strip() if isinstance(transcription, str) else str(transcription).strip()
+    except ProviderUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Transcription failed for {video_path}: {e}")
-        return ""
+        raise TranscriptionFailed(f"Could not transcribe the recording: {e}") from e
+    finally:
+        if audio_path:
+            os.remove(audio_path)
 
+    store_transcript(content_hash, TRANSCRIPTION_MODEL, TRANSCRIPTION_RESPONSE_FORMAT, transcript)
+    return transcript
 
-def score_response(question_text: str, transcript: str, tips: str = "") -> dict:
-    """Score an interview response using Groq LLM."""
-    client = get_groq_client()
 
-    prompt = f"""You are an expert interview coach. Analyze this interview response and provide a detailed evaluation.
+SCORING_MODEL = "llama-3.1-70b-versatile"
+# Bump whenever the scoring prompt or result normalization changes; it is part
+# of the scoring cache fingerprint, so old cached scores stop matching.
+SCORING_PROMPT_VERSION = "1"
+
+
+def render_scoring_prompt(question_text: str, transcript: str, tips: str = "") -> str:
+    return f"""You are an expert interview coach. Analyze this interview response and provide a detailed evaluation.
 
 Question: {question_text}
 
@@ -54,35 +106,179 @@ Provide your evaluation as a JSON object with these exact fields:
 
 Return ONLY valid JSON, no additional text."""
 
+
+def normalize_score_result(result: dict) -> dict:
+    return {
+        "score": max(0, min(100, float(result.get("score", 50)))),
+        "feedback": result.get("feedback", ""),
+        "strengths": result.get("strengths", []),
+        "improvements": result.get("improvements", []),
+        "communication_score": max(0, min(100, float(result.get("communication_score", 50)))),
+        "relevance_score": max(0, min(100, float(result.get("relevance_score", 50)))),
+        "structure_score": max(0, min(100, float(result.get("structure_score", 50)))),
+    }
+
+
+def score_columns(score_result: dict) -> dict:
+    """The sub-scores and lists of a score result, for their own MockResponse columns."""
+    return {
+        "communication_score": score_result.get("communication_score"),
+        "relevance_score": score_result.get("relevance_score"),
+        "structure_score": score_result.get("structure_score"),
+        "strengths": score_result.get("strengths", []),
+        "improvements": score_result.get("improvements", []),
+    }
+
+
+def _scoring_request(prompt: str, max_tokens: int = 1000) -> dict:
+    return {
+        "model": SCORING_MODEL,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": 0.3,
+        "max_tokens": max_tokens,
+        "response_format": {"type": "json_object"},
+    }
+
+
+def _estimated_tokens(request: dict) -> int:
+    prompt_chars = sum(len(m["content"]) for m in request["messages"])
+    return prompt_chars // 4 + request["max_tokens"]
+
+
+class ScoringFailed(RuntimeError):
+    """The provider answered, but no score could be made of it; the answer is not scored."""
+
+
+def score_response(question_text: str, transcript: str, tips: str = "") -> dict:
+    """Score an interview response using Groq LLM.
+
+    Identical requests are answered from the scoring cache; the returned dict
+    carries ``cache_hit`` so hit rates can be measured from ``ai_feedback``.
+    Raises ProviderUnavailable on rate limits/outages and ScoringFailed when
+    the reply is unusable, rather than scoring 0.
+    """
+    request = _scoring_request(render_scoring_prompt(question_text, transcript, tips))
+    fingerprint = scoring_fingerprint(prompt_version=SCORING_PROMPT_VERSION, **request)
+
+    cached = get_cached_score(fingerprint)
+    if cached is not None:
+        return {**cached, "cache_hit": True}
+
+    client = get_groq_client()
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=1000,
-            response_format={"type": "json_object"},
+        response = call_with_retries(
+            lambda: client.chat.completions.create(**request),
+            estimated_tokens=_estimated_tokens(request),
         )
-        result = json.loads(response.choices[0].message.content)
-        return {
-            "score": max(0, min(100, float(result.get("score", 50)))),
-            "feedback": result.get("feedback", ""),
-            "strengths": result.get("strengths", []),
-            "improvements": result.get("improvements", []),
-            "communication_score": max(0, min(100, float(result.get("communication_score", 50)))),
-            "relevance_score": max(0, min(100, float(result.get("relevance_score", 50)))),
-            "structure_score": max(0, min(100, float(result.get("structure_score", 50)))),
-        }
+        result = normalize_score_result(json.loads(response.choices[0].message.content))
+    except ProviderUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Scoring failed: {e}")
-        return {
-            "score": 0,
-            "feedback": "Could not analyze this response.",
-            "strengths": [],
-            "improvements": [],
-            "communication_score": 0,
-            "relevance_score": 0,
-            "structure_score": 0,
-        }
+        raise ScoringFailed(f"Could not score this response: {e}") from e
+
+    store_score(fingerprint, SCORING_MODEL, SCORING_PROMPT_VERSION, result)
+    return {**result, "cache_hit": False}
+
+
+def render_batch_scoring_prompt(items: list) -> str:
+    answers = ""
+    for i, item in enumerate(items, 1):
+        answers += f"\n### Answer {i}\nQuestion: {item['question_text']}\n"
+        if item.get("tips"):
+            answers += f"Tips for this question: {item['tips']}\n"
+        answers += f"Candidate's Response (transcript): {item['transcript']}\n"
+
+    return f"""You are an expert interview coach. Analyze each of these interview responses independently and provide a detailed evaluation of each.
+{answers}
+Provide your evaluation as a JSON object with a single field "results": an array with one object per answer, each with these exact fields:
+- "id": the answer number shown above
+- "score": overall score from 0-100
+- "feedback": 2-3 sentences of constructive feedback
+- "strengths": array of 2-3 specific strengths observed
+- "improvements": array of 2-3 specific areas for improvement
+- "communication_score": score from 0-100 for communication clarity
+- "relevance_score": score from 0-100 for answer relevance to the question
+- "structure_score": score from 0-100 for answer structure and organization
+
+Return ONLY valid JSON, no additional text."""
+
+
+def _validated_batch_item(raw) -> dict:
+    """Normalize one entry of a batch reply, or return None if it is malformed."""
+    if not isinstance(raw, dict):
+        return None
+    if not isinstance(raw.get("feedback"), str) or not raw["feedback"]:
+        return None
+    if not isinstance(raw.get("strengths"), list) or not isinstance(raw.get("improvements"), list):
+        return None
+    try:
+        for field in ("score", "communication_score", "relevance_score", "structure_score"):
+            float(raw[field])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return normalize_score_result(raw)
+
+
+def score_responses_batch(items: list) -> list:
+    """Score several answers of one session in a single LLM call.
+
+    ``items`` are dicts with ``question_text``, ``transcript`` and ``tips``.
+    Returns one ``score_response``-shaped dict per item, in order. Cached items
+    are skipped, and any item missing or malformed in the reply is re-scored
+    with its own ``score_response`` call; if that fails too, its slot holds
+    the ScoringFailed exception.
+    """
+    results = [None] * len(items)
+    fingerprints = []
+    pending = []
+    for i, item in enumerate(items):
+        request = _scoring_request(render_scoring_prompt(item["question_text"], item["transcript"], item.get("tips", "")))
+        fingerprint = scoring_fingerprint(prompt_version=SCORING_PROMPT_VERSION, **request)
+        fingerprints.append(fingerprint)
+        cached = get_cached_score(fingerprint)
+        if cached is not None:
+            results[i] = {**cached, "cache_hit": True}
+        else:
+            pending.append(i)
+
+    if len(pending) > 1:
+        request = _scoring_request(render_batch_scoring_prompt([items[i] for i in pending]), max_tokens=600 * len(pending))
+        client = get_groq_client()
+        try:
+            response = call_with_retries(
+                lambda: client.chat.completions.create(**request),
+                estimated_tokens=_estimated_tokens(request),
+            )
+            replies = json.loads(response.choices[0].message.content).get("results", [])
+        except ProviderUnavailable:
+            # Per-answer fallbacks would only hammer a provider that is already down.
+            raise
+        except Exception as e:
+            logger.error(f"Batch scoring failed, falling back to per-response scoring: {e}")
+            replies = []
+
+        by_id = {}
+        for raw in replies if isinstance(replies, list) else []:
+            if isinstance(raw, dict):
+                by_id[str(raw.get("id"))] = raw
+        for position, i in enumerate(pending, 1):
+            result = _validated_batch_item(by_id.get(str(position)))
+            if result is not None:
+                store_score(fingerprints[i], SCORING_MODEL, SCORING_PROMPT_VERSION, result)
+                results[i] = {**result, "cache_hit": False}
+
+    for i in pending:
+        if results[i] is None:
+            try:
+                results[i] = score_response(
+                    question_text=items[i]["question_text"],
+                    transcript=items[i]["transcript"],
+                    tips=items[i].get("tips", ""),
+                )
+            except ScoringFailed as e:
+                results[i] = e
+    return results
 
 
 def generate_behavioral_insights(responses_data: list) -> dict:
@@ -107,15 +303,15 @@ Provide your analysis as a JSON object with these exact fields:
 
 Return ONLY valid JSON, no additional text."""
 
+    request = _scoring_request(prompt)
     try:
-        response = client.chat.completions.create(
-            model="llama-3.1-70b-versatile",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.3,
-            max_tokens=1000,
-            response_format={"type": "json_object"},
+        response = call_with_retries(
+            lambda: client.chat.completions.create(**request),
+            estimated_tokens=_estimated_tokens(request),
         )
         return json.loads(response.choices[0].message.content)
+    except ProviderUnavailable:
+        raise
     except Exception as e:
         logger.error(f"Behavioral insights generation failed: {e}")
         return {
@@ -128,88 +324,231 @@ Return ONLY valid JSON, no additional text."""
         }
 
 
-def calculate_confidence_from_emotions(emotion_data: dict) -> float:
-    """Derive a confidence score from emotion detection data."""
-    if not emotion_data:
-        return 0.0
-
-    averages = emotion_data.get("averages", {})
-    if not averages:
-        return 0.0
+NO_SPEECH_RESULT = {
+    "score": 0,
+    "feedback": "No speech detected in recording.",
+    "strengths": [],
+    "improvements": ["Ensure your microphone is working", "Speak clearly"],
+}
 
-    # Confidence = high happy/neutral, low fearful/sad/angry
-    happy = averages.get("happy", 0)
-    neutral = averages.get("neutral", 0)
-    surprised = averages.get("surprised", 0)
-    fearful = averages.get("fearful", 0)
-    sad = averages.get("sad", 0)
-    angry = averages.get("angry", 0)
-    disgusted = averages.get("disgusted", 0)
 
-    positive = happy * 0.3 + neutral * 0.4 + surprised * 0.1
-    negative = fearful * 0.3 + sad * 0.2 + angry * 0.1 + disgusted * 0.1
+def analyze_response(video_path: str, question_text: str, tips: str = "", content_hash: str = "") -> dict:
+    """Transcribe and score a single recording. Never touches the MockResponse row."""
+    transcript = transcribe_video(video_path, content_hash)
+    if not transcript:
+        return {"transcript": "", "score_result": None}
 
-    confidence = min(100, max(0, (positive - negative) * 100 + 50))
-    return round(confidence, 1)
+    score_result = score_response(
+        question_text=question_text,
+        transcript=transcript,
+        tips=tips,
+    )
+    return {"transcript": transcript, "score_result": score_result}
 
 
-def analyze_mock_session(mock_session):
-    """Run full AI analysis pipeline on a mock session."""
-    responses = mock_session.responses.all().select_related("question")
-    all_scores = []
-    responses_data = []
-
-    for mock_response in responses:
-        if not mock_response.video_file:
-            continue
+def _map_concurrently(fn, items: list, max_workers: int) -> list:
+    """``[fn(item) for item in items]`` on a bounded pool; exceptions are returned, not raised."""
 
-        mock_response.analysis_status = "analyzing"
-        mock_response.save(update_fields=["analysis_status"])
+    def run(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            return e
 
+    def run_in_thread(item):
         try:
-            # Transcribe
-            video_path = mock_response.video_file.path
-            transcript = transcribe_video(video_path)
-            mock_response.transcript = transcript
-
-            # Score
-            if transcript:
-                score_result = score_response(
-                    question_text=mock_response.question.text,
-                    transcript=transcript,
-                    tips=mock_response.question.tips,
-                )
-                mock_response.ai_score = score_result["score"]
-                mock_response.ai_feedback = json.dumps(score_result)
-                all_scores.append(score_result["score"])
-
-                responses_data.append({
-                    "question": mock_response.question.text,
-                    "transcript": transcript,
-                    "score": score_result["score"],
-                })
+            return run(item)
+        finally:
+            # Cache lookups open a connection per pool thread; don't leak them.
+            connections.close_all()
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [run(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items)), thread_name_prefix="analysis") as pool:
+        return list(pool.map(run_in_thread, items))
+
+
+def run_response_analyses(tasks: list, max_workers: int = None, batch_size: int = None) -> list:
+    """Transcribe and score each task dict, at most ``max_workers`` calls at a time.
+
+    With ``batch_size`` > 1, all recordings are transcribed first and the
+    transcripts are then scored ``batch_size`` at a time via
+    ``score_responses_batch``. Results (or the raised exception) come back
+    in the same order as ``tasks``.
+    """
+    if max_workers is None:
+        max_workers = settings.AI_ANALYSIS_CONCURRENCY
+    if batch_size is None:
+        batch_size = settings.AI_SCORING_BATCH_SIZE
+
+    if batch_size <= 1:
+        return _map_concurrently(lambda task: analyze_response(**task), tasks, max_workers)
+
+    transcripts = _map_concurrently(
+        lambda task: transcribe_video(task["video_path"], task.get("content_hash", "")), tasks, max_workers
+    )
+    results = [
+        t if isinstance(t, Exception) else {"transcript": t, "score_result": None}
+        for t in transcripts
+    ]
+
+    to_score = [i for i, t in enumerate(transcripts) if t and not isinstance(t, Exception)]
+    batches = [to_score[i:i + batch_size] for i in range(0, len(to_score), batch_size)]
+    batch_results = _map_concurrently(
+        lambda batch: score_responses_batch([
+            {
+                "question_text": tasks[i]["question_text"],
+                "transcript": transcripts[i],
+                "tips": tasks[i].get("tips", ""),
+            }
+            for i in batch
+        ]),
+        batches,
+        max_workers,
+    )
+    for batch, scored in zip(batches, batch_results):
+        for position, i in enumerate(batch):
+            if isinstance(scored, Exception):
+                results[i] = scored
+            elif isinstance(scored[position], Exception):
+                results[i] = scored[position]
             else:
-                mock_response.ai_score = 0
-                mock_response.ai_feedback = json.dumps({
-                    "score": 0,
-                    "feedback": "No speech detected in recording.",
-                    "strengths": [],
-                    "improvements": ["Ensure your microphone is working", "Speak clearly"],
-                })
-
-            # Confidence from emotions
-            if mock_response.emotion_data:
-                mock_response.confidence_score = calculate_confidence_from_emotions(
-                    mock_response.emotion_data
-                )
+                results[i] = {"transcript": transcripts[i], "score_result": scored[position]}
+    return results
+
+
+def _set_analysis_status(mock_response, status: str) -> bool:
+    """Update the status unless the response was re-uploaded since it was loaded."""
+    updated = MockResponse.objects.filter(
+        id=mock_response.id, upload_version=mock_response.upload_version
+    ).update(analysis_status=status)
+    if updated:
+        MockSession.bump_progress(mock_response.session_id)
+    return bool(updated)
+
+
+def save_response_result(mock_response, result: dict) -> bool:
+    """Store a transcribe+score result on the response.
+
+    The write is conditional on ``upload_version``, so results computed for a
+    recording that has since been replaced are dropped. Returns whether the
+    result was stored.
+    """
+    transcript = result["transcript"]
+    score_result = result["score_result"]
+    if score_result is None:
+        score_result = NO_SPEECH_RESULT
+
+    fields = {
+        "transcript": transcript,
+        "ai_score": score_result["score"],
+        "ai_feedback": json.dumps(score_result),
+        **score_columns(score_result),
+        "analysis_status": "completed",
+    }
+    if mock_response.emotion_data or mock_response.emotion_timeline:
+        emotions = analyze_emotions(mock_response.emotion_data, mock_response.emotion_timeline)
+        fields["confidence_score"] = emotions["confidence"]
+        if emotions["metrics"]:
+            fields["emotion_data"] = {**mock_response.emotion_data, "metrics": emotions["metrics"]}
+    updated = MockResponse.objects.filter(
+        id=mock_response.id, upload_version=mock_response.upload_version
+    ).update(updated_at=timezone.now(), **fields)
+    if not updated:
+        logger.info(f"Discarded stale analysis for re-uploaded response {mock_response.id}")
+        return False
+
+    for name, value in fields.items():
+        setattr(mock_response, name, value)
+    MockSession.bump_progress(mock_response.session_id)
+    return True
+
+
+def analyze_uploaded_response(mock_response, version: int) -> bool:
+    """Analyze one answer right after it is uploaded.
+
+    Returns False without doing any work if the answer has been re-uploaded
+    since ``version``.
+    """
+    if mock_response.upload_version != version or not mock_response.video_file:
+        return False
+    if not _set_analysis_status(mock_response, "analyzing"):
+        return False
+
+    try:
+        result = analyze_response(
+            video_path=mock_response.video_file.path,
+            question_text=mock_response.question.text,
+            tips=mock_response.question.tips,
+            content_hash=mock_response.content_hash,
+        )
+    except ProviderUnavailable:
+        _set_analysis_status(mock_response, "pending")
+        raise
+    except Exception:
+        _set_analysis_status(mock_response, "failed")
+        raise
 
-            mock_response.analysis_status = "completed"
-            mock_response.save()
+    return save_response_result(mock_response, result)
 
-        except Exception as e:
-            logger.error(f"Analysis failed for response {mock_response.id}: {e}")
-            mock_response.analysis_status = "failed"
-            mock_response.save(update_fields=["analysis_status"])
+
+def analyze_mock_session(mock_session):
+    """Run full AI analysis pipeline on a mock session.
+
+    Responses already analyzed at upload time are reused; only the rest are
+    transcribed and scored here. If the provider is unavailable for any of
+    them, the finished responses are kept, the rest go back to "pending" and
+    ProviderUnavailable is raised so the job can be deferred; the session is
+    only marked analyzed once every response has been processed.
+    """
+    responses = list(mock_session.responses.all().select_related("question"))
+    to_analyze = [r for r in responses if r.video_file and r.analysis_status != "completed"]
+
+    for mock_response in to_analyze:
+        _set_analysis_status(mock_response, "analyzing")
+
+    # Network-bound work fans out to a thread pool; all ORM writes stay on this thread.
+    results = run_response_analyses([
+        {
+            "video_path": r.video_file.path,
+            "question_text": r.question.text,
+            "tips": r.question.tips,
+            "content_hash": r.content_hash,
+        }
+        for r in to_analyze
+    ])
+
+    deferred = []
+    for mock_response, result in zip(to_analyze, results):
+        if isinstance(result, ProviderUnavailable):
+            deferred.append(result)
+            _set_analysis_status(mock_response, "pending")
+        elif isinstance(result, Exception):
+            logger.error(f"Analysis failed for response {mock_response.id}: {result}")
+            _set_analysis_status(mock_response, "failed")
+        else:
+            save_response_result(mock_response, result)
+
+    if deferred:
+        raise ProviderUnavailable(
+            f"{len(deferred)} response(s) deferred: {deferred[0]}",
+            retry_after=max(e.retry_after for e in deferred),
+        )
+
+    # Aggregate from what is stored, which includes upload-time results.
+    responses = list(mock_session.responses.select_related("question").defer("emotion_timeline"))
+    all_scores = []
+    responses_data = []
+    for mock_response in responses:
+        if mock_response.analysis_status != "completed" or not mock_response.transcript:
+            continue
+        all_scores.append(mock_response.ai_score)
+        responses_data.append({
+            "question": mock_response.question.text,
+            "transcript": mock_response.transcript,
+            "score": mock_response.ai_score,
+        })
 
     # Generate session-level insights
     if responses_data:
@@ -221,21 +560,18 @@ def analyze_mock_session(mock_session):
     if all_scores:
         mock_session.overall_score = round(sum(all_scores) / len(all_scores), 1)
 
-    # Aggregate emotion summary
-    all_emotions = {}
-    emotion_count = 0
-    for mock_response in responses:
-        avg = mock_response.emotion_data.get("averages", {})
-        if avg:
-            emotion_count += 1
-            for emotion, value in avg.items():
-                all_emotions[emotion] = all_emotions.get(emotion, 0) + value
-
-    if emotion_count > 0:
-        mock_session.emotion_summary = {
-            emotion: round(value / emotion_count, 3)
-            for emotion, value in all_emotions.items()
-        }
+    emotion_summary = session_emotion_summary([mock_response.emotion_data for mock_response in responses])
+    if emotion_summary:
+        mock_session.emotion_summary = emotion_summary
 
     mock_session.status = "analyzed"
-    mock_session.save()
+    # Leave progress_version out of the save so a stale in-memory value can't roll it back.
+    mock_session.save(update_fields=[
+        "behavioral_insights", "overall_feedback", "overall_score", "emotion_summary", "status",
+    ])
+    try:
+        write_snapshot(mock_session.id)
+    except Exception as e:
+        # Not fatal: the first results request writes it instead.
+        logger.error(f"Could not store results snapshot for session {mock_session.id}: {e}")
+    MockSession.bump_progress(mock_session.id)
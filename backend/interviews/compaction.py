@@ -0,0 +1,105 @@
+import logging
+import os
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+
+from .ai_cache import copy_cached_transcripts, hash_file
+from .media import SNIFF_BYTES, _remove_quietly, sniff_container, transcode_video
+from .models import AnalysisJob, MockResponse, QuestionResponse
+from .storage import content_addressed_storage, release_blob
+from .uploads import AssembledUpload
+
+logger = logging.getLogger(__name__)
+
+# Keep the original unless transcoding saves at least this fraction.
+MIN_SAVINGS = 0.10
+
+
+def analysis_pending() -> bool:
+    """True while analysis work is runnable; compaction yields to it."""
+    return AnalysisJob.objects.filter(
+        status__in=AnalysisJob.ACTIVE_STATUSES, available_at__lte=timezone.now()
+    ).exists()
+
+
+def compaction_candidates(model):
+    """Recordings old enough to be compacted; mock answers only once they are analyzed."""
+    settled_before = timezone.now() - timedelta(seconds=settings.MEDIA_COMPACTION_MIN_AGE)
+    candidates = model.objects.filter(compaction_status="", updated_at__lt=settled_before).exclude(
+        Q(video_file="") | Q(video_file__isnull=True)
+    )
+    if model is MockResponse:
+        candidates = candidates.filter(analysis_status="completed")
+    return candidates.order_by("updated_at")
+
+
+def compact_next_recording() -> bool:
+    """Compact the oldest eligible recording. Returns False when there was nothing to do.
+
+    ``MediaToolUnavailable`` propagates with the recording left pending.
+    """
+    for model in (MockResponse, QuestionResponse):
+        recording = compaction_candidates(model).only("pk", "video_file", "file_size", "content_hash").first()
+        if recording is not None:
+            compact_recording(model, recording)
+            return True
+    return False
+
+
+def compact_recording(model, recording) -> str:
+    """Transcode one recording and swap its file reference. Returns the resulting compaction status.
+
+    Raises ``MediaToolUnavailable`` without marking the recording, so it is
+    retried once ffmpeg is available.
+    """
+    old_name = recording.video_file.name
+    try:
+        old_size = recording.video_file.size
+    except OSError:
+        return _mark(model, recording, old_name, "failed")
+
+    output_path = transcode_video(recording.video_file.path)
+    if output_path is None:
+        return _mark(model, recording, old_name, "failed")
+
+    new_size = os.path.getsize(output_path)
+    if new_size > old_size * (1 - MIN_SAVINGS):
+        _remove_quietly(output_path)
+        return _mark(model, recording, old_name, "skipped")
+
+    with open(output_path, "rb") as f:
+        header = f.read(SNIFF_BYTES)
+    with AssembledUpload(output_path, os.path.splitext(os.path.basename(old_name))[0] + ".webm") as content:
+        content.content_hash = hash_file(output_path)
+        new_name = content_addressed_storage.save(content.name, content)
+    _remove_quietly(output_path)
+
+    # Swap only if the answer still points at the file we transcoded; a
+    # re-upload in the meantime wins and the compacted copy is dropped.
+    swapped = model.objects.filter(pk=recording.pk, video_file=old_name).update(
+        video_file=new_name,
+        content_hash=content.content_hash,
+        file_size=new_size,
+        container=sniff_container(header),
+        original_file_size=old_size,
+        compaction_status="compacted",
+        compacted_at=timezone.now(),
+    )
+    if not swapped:
+        release_blob(new_name)
+        return ""
+    release_blob(old_name)
+    # Same audio, new bytes: keep re-analysis on the transcript cache.
+    copy_cached_transcripts(recording.content_hash, content.content_hash)
+    logger.info(f"Compacted {model.__name__} {recording.pk}: {old_size} -> {new_size} bytes")
+    return "compacted"
+
+
+def _mark(model, recording, old_name: str, status: str) -> str:
+    model.objects.filter(pk=recording.pk, video_file=old_name).update(
+        compaction_status=status, compacted_at=timezone.now()
+    )
+    return status
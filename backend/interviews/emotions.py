@@ -0,0 +1,173 @@
+import logging
+from functools import lru_cache
+
+import numpy as np
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# face-api.js expression order; packed timelines store one float32 column per emotion in this order.
+EMOTIONS = ("neutral", "happy", "sad", "angry", "fearful", "disgusted", "surprised")
+
+# Each packed row is [time, *EMOTIONS].
+ROW_WIDTH = 1 + len(EMOTIONS)
+_DTYPE = np.dtype("<f4")
+
+# Confidence = high happy/neutral, low fearful/sad/angry; one weight per emotion, in EMOTIONS order.
+CONFIDENCE_WEIGHTS = np.array([0.4, 0.3, -0.2, -0.1, -0.3, -0.1, 0.1])
+
+
+def pack_timeline(timeline) -> bytes:
+    """Pack ``[{time, emotions: {...}}, ...]`` into little-endian float32 rows.
+
+    Emotions missing from a frame are stored as 0; unknown ones are dropped.
+    Malformed frames are skipped.
+    """
+    rows = []
+    for frame in timeline or ():
+        if not isinstance(frame, dict) or not isinstance(frame.get("emotions"), dict):
+            continue
+        emotions = frame["emotions"]
+        try:
+            rows.append([float(frame.get("time", 0))] + [float(emotions.get(name, 0)) for name in EMOTIONS])
+        except (TypeError, ValueError):
+            continue
+    return np.asarray(rows, dtype=_DTYPE).tobytes()
+
+
+def unpack_timeline(data) -> np.ndarray:
+    """Inverse of pack_timeline(): an ``(frames, ROW_WIDTH)`` array of ``[time, *EMOTIONS]`` rows."""
+    return np.frombuffer(bytes(data or b""), dtype=_DTYPE).reshape(-1, ROW_WIDTH)
+
+
+def downsample(rows: np.ndarray, points: int) -> np.ndarray:
+    """Average ``rows`` into at most ``points`` evenly sized buckets."""
+    if points <= 0 or len(rows) <= points:
+        return rows
+    edges = np.arange(points + 1) * len(rows) // points
+    sums = np.add.reduceat(rows.astype(np.float64), edges[:-1], axis=0)
+    return sums / np.diff(edges)[:, None]
+
+
+def split_emotion_data(emotion_data) -> tuple:
+    """Separate the per-frame timeline from the summary fields kept in ``emotion_data``.
+
+    Returns ``(summary, packed_timeline)``.
+    """
+    if not isinstance(emotion_data, dict):
+        return {}, b""
+    summary = {key: value for key, value in emotion_data.items() if key != "timeline"}
+    return summary, pack_timeline(emotion_data.get("timeline"))
+
+
+def timeline_payload(data, points: int = 0) -> dict:
+    """Columnar representation of a packed timeline for the API."""
+    rows = downsample(unpack_timeline(data), points)
+    return {
+        "emotions": list(EMOTIONS),
+        "time": np.round(rows[:, 0], 2).tolist(),
+        "values": np.round(rows[:, 1:], 3).tolist(),
+    }
+
+
+def averages_vector(averages) -> np.ndarray:
+    """``{"happy": 0.2, ...}`` as a vector in EMOTIONS order; missing emotions are 0."""
+    averages = averages if isinstance(averages, dict) else {}
+    return np.array([float(averages.get(name) or 0) for name in EMOTIONS])
+
+
+# Confidence scoring functions, selected with the EMOTION_CONFIDENCE_SCORER setting.
+# Each takes the per-emotion averages and the ``(frames, len(EMOTIONS))`` values
+# (possibly empty) and returns a score between 0 and 100.
+
+
+def averages_confidence(averages: np.ndarray, values: np.ndarray) -> float:
+    """The original formula: weighted averages, centred on 50."""
+    return float(np.clip((averages @ CONFIDENCE_WEIGHTS) * 100 + 50, 0, 100))
+
+
+def timeline_confidence(averages: np.ndarray, values: np.ndarray) -> float:
+    """Per-frame confidence averaged over the answer, discounted by up to 20% for a jumpy expression."""
+    if len(values) < 2:
+        return averages_confidence(averages, values)
+    frame_scores = np.clip(values @ CONFIDENCE_WEIGHTS * 100 + 50, 0, 100)
+    return float(frame_scores.mean() * (0.8 + 0.2 * _stability(values.argmax(axis=1))))
+
+
+CONFIDENCE_SCORERS = {
+    "averages": averages_confidence,
+    "timeline": timeline_confidence,
+}
+
+
+@lru_cache(maxsize=None)
+def confidence_scorer(name: str):
+    """The scoring function called ``name``; an unknown name falls back to "averages" with a warning."""
+    if name not in CONFIDENCE_SCORERS:
+        logger.warning(f"Unknown emotion confidence scorer {name!r}; using 'averages'")
+        name = "averages"
+    return CONFIDENCE_SCORERS[name]
+
+
+def _stability(dominant: np.ndarray) -> float:
+    """Fraction of consecutive frames whose dominant emotion did not change."""
+    if len(dominant) < 2:
+        return 1.0
+    return 1.0 - np.count_nonzero(dominant[1:] != dominant[:-1]) / (len(dominant) - 1)
+
+
+def _by_emotion(vector: np.ndarray, digits: int = 3) -> dict:
+    return dict(zip(EMOTIONS, np.round(vector, digits).tolist()))
+
+
+def analyze_emotions(emotion_data, timeline=b"", scorer: str = None) -> dict:
+    """Confidence and expression metrics for one answer.
+
+    Confidence is scored from the client-reported ``averages`` stored in
+    ``emotion_data`` (the mean of the packed ``timeline`` stands in when none
+    were reported) together with the timeline's frames. Returns
+    ``{"confidence": float, "metrics": dict}``; ``metrics`` describe the
+    timeline and are empty without one.
+    """
+    scorer = confidence_scorer(scorer or settings.EMOTION_CONFIDENCE_SCORER)
+    reported = averages_vector((emotion_data or {}).get("averages"))
+    rows = unpack_timeline(timeline)
+    values = rows[:, 1:].astype(np.float64)
+    if not len(values):
+        # No averages at all scores a neutral 50, as the original formula did.
+        confidence = scorer(reported, values)
+        return {"confidence": round(confidence, 1), "metrics": {}}
+
+    averages = values.mean(axis=0)
+    dominant = values.argmax(axis=1)
+    transitions = int(np.count_nonzero(dominant[1:] != dominant[:-1]))
+    duration = float(rows[-1, 0] - rows[0, 0])
+    metrics = {
+        "frames": len(values),
+        "duration": round(duration, 2),
+        "averages": _by_emotion(averages),
+        "variance": _by_emotion(values.var(axis=0), 4),
+        "dominant": EMOTIONS[int(averages.argmax())],
+        "dominant_share": _by_emotion(np.bincount(dominant, minlength=len(EMOTIONS)) / len(values)),
+        "transitions": transitions,
+        "transitions_per_minute": round(transitions * 60 / duration, 2) if duration > 0 else 0.0,
+        "stability": round(_stability(dominant), 3),
+        # Mean total change in expression between consecutive frames (0 = frozen, 2 = complete swing).
+        "volatility": round(float(np.abs(np.diff(values, axis=0)).sum(axis=1).mean()), 3) if len(values) > 1 else 0.0,
+    }
+    confidence = scorer(reported if reported.any() else averages, values)
+    return {"confidence": round(confidence, 1), "metrics": metrics}
+
+
+def session_emotion_summary(emotion_data_list) -> dict:
+    """Mean of each answer's averages, over the answers that reported any.
+
+    Emotions no answer reported are left out, as before.
+    """
+    reported = [data["averages"] for data in emotion_data_list if data and data.get("averages")]
+    if not reported:
+        return {}
+    matrix = np.array([averages_vector(averages) for averages in reported])
+    present = np.array([any(name in averages for averages in reported) for name in EMOTIONS])
+    means = matrix.mean(axis=0)
+    return {name: value for name, value, keep in zip(EMOTIONS, np.round(means, 3).tolist(), present) if keep}
@@ -0,0 +1,270 @@
+import logging
+import os
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# One Groq client per process. The underlying httpx.Client is thread-safe and
+# keeps a pool of keep-alive connections, so the analysis thread pool and
+# every pipeline stage share TLS sessions instead of handshaking per call.
+_client = None
+_client_pid = None
+_lock = threading.Lock()
+
+TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class ProviderUnavailable(Exception):
+    """The AI provider is rate limiting, timing out or down; retry the work later."""
+
+    def __init__(self, message: str, retry_after: float = 0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _build_client():
+    import httpx
+    from groq import Groq
+
+    api_key = settings.GROQ_API_KEY
+    if not api_key:
+        raise ValueError("GROQ_API_KEY not configured")
+
+    timeout = httpx.Timeout(settings.GROQ_READ_TIMEOUT, connect=settings.GROQ_CONNECT_TIMEOUT)
+    http_client = httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=settings.GROQ_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GROQ_MAX_CONNECTIONS,
+            keepalive_expiry=settings.GROQ_KEEPALIVE_EXPIRY,
+        ),
+    )
+    # Retries are handled by call_with_retries so they respect the shared
+    # rate limiter and circuit breaker.
+    return Groq(api_key=api_key, timeout=timeout, http_client=http_client, max_retries=0)
+
+
+def get_groq_client():
+    """Return this process's shared Groq client, creating it on first use."""
+    global _client, _client_pid
+
+    pid = os.getpid()
+    client = _client
+    if client is not None and _client_pid == pid:
+        return client
+
+    with _lock:
+        if _client is None or _client_pid != pid:
+            _client = _build_client()
+            _client_pid = pid
+        return _client
+
+
+def reset_groq_client() -> None:
+    """Close and drop the shared client and its rate limiter/breaker state.
+
+    Tests use this after changing GROQ_* settings.
+    """
+    global _client, _client_pid
+
+    with _lock:
+        client, pid = _client, _client_pid
+        _client = None
+        _client_pid = None
+    _reset_guards()
+    if client is not None and pid == os.getpid():
+        client.close()
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously at ``per_minute`` tokens/minute."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, amount: float = 1) -> None:
+        """Block until ``amount`` tokens are available, then take them."""
+        if self.capacity <= 0:
+            return
+        # A request larger than the bucket waits for a full bucket.
+        amount = min(amount, self.capacity)
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.paused_until and self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                wait = max(self.paused_until - now, (amount - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller for ``seconds`` (e.g. after the provider returns 429)."""
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = 0.0
+
+
+class CircuitBreaker:
+    """Opens after consecutive transient failures and fails fast until ``reset_seconds`` pass."""
+
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self.lock = threading.Lock()
+
+    def before_call(self) -> None:
+        with self.lock:
+            if self.opened_at is None:
+                return
+            remaining = self.opened_at + self.reset_seconds - time.monotonic()
+            if remaining > 0 or self.trial_in_flight:
+                raise ProviderUnavailable("AI provider circuit is open", retry_after=max(remaining, 1))
+            # Half-open: let a single trial call through.
+            self.trial_in_flight = True
+
+    def record_success(self) -> None:
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self.lock:
+            self.failures += 1
+            self.trial_in_flight = False
+            if self.opened_at is not None or self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.warning(f"AI provider circuit opened after {self.failures} consecutive failures")
+                self.opened_at = time.monotonic()
+
+
+_request_bucket = None
+_token_bucket = None
+_breaker = None
+_guards_lock = threading.Lock()
+
+
+def _guards():
+    global _request_bucket, _token_bucket, _breaker
+    with _guards_lock:
+        if _breaker is None:
+            _request_bucket = TokenBucket(settings.GROQ_REQUESTS_PER_MINUTE)
+            _token_bucket = TokenBucket(settings.GROQ_TOKENS_PER_MINUTE)
+            _breaker = CircuitBreaker(
+                settings.GROQ_CIRCUIT_FAILURE_THRESHOLD, settings.GROQ_CIRCUIT_RESET_SECONDS
+            )
+        return _request_bucket, _token_bucket, _breaker
+
+
+def _reset_guards() -> None:
+    global _request_bucket, _token_bucket, _breaker, _guards_lock
+    _request_bucket = _token_bucket = _breaker = None
+    _guards_lock = threading.Lock()
+
+
+def is_transient_error(error: Exception) -> bool:
+    """Rate limits, timeouts, connection errors and 5xx responses are worth retrying."""
+    try:
+        import groq
+    except ImportError:
+        groq = None
+    if groq is not None and isinstance(error, groq.APIConnectionError):
+        return True
+    return getattr(error, "status_code", None) in TRANSIENT_STATUS_CODES
+
+
+def _retry_after_seconds(error: Exception):
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def call_with_retries(fn, estimated_tokens: int = 0):
+    """Call ``fn()`` under the shared rate limits, retrying transient provider errors.
+
+    Retries use full-jitter exponential backoff, or the provider's
+    ``Retry-After`` when it sends one. Raises ProviderUnavailable when the
+    circuit is open or retries are exhausted; other errors propagate as-is.
+    """
+    request_bucket, token_bucket, breaker = _guards()
+    max_retries = settings.GROQ_MAX_RETRIES
+
+    for attempt in range(max_retries + 1):
+        breaker.before_call()
+        request_bucket.acquire(1)
+        if estimated_tokens:
+            token_bucket.acquire(estimated_tokens)
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_transient_error(e):
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+
+            retry_after = _retry_after_seconds(e)
+            if getattr(e, "status_code", None) == 429:
+                # Everyone in this process backs off, not just this caller.
+                request_bucket.pause(retry_after or settings.GROQ_RETRY_BASE_DELAY)
+            if attempt == max_retries:
+                raise ProviderUnavailable(
+                    f"AI provider unavailable after {attempt + 1} attempts: {e}",
+                    retry_after=retry_after or 0,
+                ) from e
+
+            delay = retry_after
+            if delay is None:
+                delay = random.uniform(0, settings.GROQ_RETRY_BASE_DELAY * (2 ** attempt))
+            delay = min(delay, settings.GROQ_RETRY_MAX_DELAY)
+            logger.warning(f"Transient AI provider error ({e}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
+
+
+def _forget_client_after_fork() -> None:
+    # The child shares the parent's sockets, so drop the client without
+    # closing it; the lock may have been held mid-fork, so replace it too.
+    global _client, _client_pid, _lock
+    _client = None
+    _client_pid = None
+    _lock = threading.Lock()
+    _reset_guards()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_client_after_fork)
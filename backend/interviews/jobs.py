@@ -0,0 +1,254 @@
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .groq_client import ProviderUnavailable
+from .models import AnalysisJob, MockSession
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_analysis(mock_session) -> AnalysisJob:
+    """Queue AI analysis for a mock session, reusing any job already in flight."""
+    active = AnalysisJob.objects.filter(
+        kind="session", mock_session=mock_session, status__in=AnalysisJob.ACTIVE_STATUSES
+    )
+    existing = active.first()
+    if existing:
+        return existing
+
+    try:
+        with transaction.atomic():
+            return AnalysisJob.objects.create(
+                kind="session",
+                mock_session=mock_session,
+                max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+            )
+    except IntegrityError:
+        # Lost a race with a concurrent enqueue for the same session.
+        return active.get()
+
+
+def enqueue_response_analysis(mock_response) -> AnalysisJob:
+    """Queue analysis of a freshly uploaded answer.
+
+    A job still queued for an earlier upload of the same answer is retargeted
+    at the new ``upload_version`` instead of adding a second one; a job already
+    running for the old upload finishes, but its results are discarded.
+    """
+    queued = AnalysisJob.objects.filter(kind="response", mock_response=mock_response, status="queued")
+
+    def retarget():
+        queued.update(response_version=mock_response.upload_version, available_at=timezone.now())
+        return queued.first()
+
+    if queued.exists():
+        job = retarget()
+        if job is not None:
+            return job
+
+    try:
+        with transaction.atomic():
+            return AnalysisJob.objects.create(
+                kind="response",
+                mock_session_id=mock_response.session_id,
+                mock_response=mock_response,
+                response_version=mock_response.upload_version,
+                max_attempts=settings.ANALYSIS_JOB_MAX_ATTEMPTS,
+            )
+    except IntegrityError:
+        return retarget()
+
+
+def _claimable_jobs():
+    now = timezone.now()
+    stale_before = now - timedelta(seconds=settings.ANALYSIS_JOB_LEASE_SECONDS)
+    # Running jobs whose lease expired belong to a worker that died mid-job.
+    return AnalysisJob.objects.filter(
+        Q(status="queued", available_at__lte=now)
+        | Q(status="running", locked_at__lt=stale_before)
+    ).order_by("available_at", "created_at")
+
+
+def claim_next_job(worker_id: str):
+    """Atomically claim the next runnable job for ``worker_id``, or return None if there is none."""
+    while True:
+        with transaction.atomic():
+            job = _claimable_jobs().select_for_update(skip_locked=True).first()
+            if job is None:
+                return None
+
+            now = timezone.now()
+            if job.status == "running" and job.attempts >= job.max_attempts:
+                # The worker died on the final attempt; don't retry forever, but
+                # keep looking: other jobs may be runnable.
+                _fail(job, job.last_error or "Worker lease expired on final attempt.", locked_at=job.locked_at)
+                continue
+
+            # Compare-and-set on the observed state so backends without row locks
+            # (SQLite) still hand each job to exactly one worker.
+            claimed = AnalysisJob.objects.filter(
+                id=job.id, status=job.status, locked_at=job.locked_at
+            ).update(
+                status="running",
+                locked_by=worker_id,
+                locked_at=now,
+                started_at=now,
+                attempts=job.attempts + 1,
+            )
+            if not claimed:
+                # Another worker took it first; try the next one.
+                continue
+        break
+
+    job.refresh_from_db()
+    if job.attempts > 1:
+        logger.warning(f"Reclaimed analysis job {job.id} (attempt {job.attempts})")
+    return job
+
+
+def run_job(job: AnalysisJob, worker_id: str) -> None:
+    """Run the analysis pipeline for a claimed job and record the outcome."""
+    from .ai_pipeline import analyze_mock_session, analyze_uploaded_response
+
+    if job.kind == "session" and _response_jobs_in_flight(job):
+        # Upload-time analysis is still running; check back shortly rather
+        # than analyzing the same answers twice.
+        _requeue(job, worker_id, settings.ANALYSIS_STRAGGLER_POLL_SECONDS)
+        return
+
+    try:
+        with _held_lease(job, worker_id):
+            if job.kind == "response":
+                analyze_uploaded_response(job.mock_response, job.response_version)
+            else:
+                analyze_mock_session(job.mock_session)
+    except ProviderUnavailable as e:
+        logger.warning(f"AI provider unavailable for analysis job {job.id}; deferring: {e}")
+        _requeue(job, worker_id, max(e.retry_after, settings.ANALYSIS_JOB_RETRY_DELAY), str(e))
+        return
+    except Exception as e:
+        logger.error(f"AI analysis job {job.id} failed for mock session {job.mock_session_id}: {e}")
+        _record_failure(job, worker_id, str(e))
+        return
+
+    # Every outcome below is written only while this worker still holds the
+    # lease, so a job reclaimed by another worker keeps that worker's result.
+    finished = AnalysisJob.objects.filter(id=job.id, locked_by=worker_id).update(
+        status="succeeded",
+        finished_at=timezone.now(),
+        last_error="",
+    )
+    if not finished:
+        logger.warning(f"Analysis job {job.id} lost its lease to another worker; outcome discarded")
+
+
+def _renew_lease(job: AnalysisJob, worker_id: str) -> bool:
+    """Push the lease forward; False once another worker has reclaimed the job."""
+    return bool(
+        AnalysisJob.objects.filter(id=job.id, status="running", locked_by=worker_id).update(
+            locked_at=timezone.now()
+        )
+    )
+
+
+@contextmanager
+def _held_lease(job: AnalysisJob, worker_id: str):
+    """Renew the job's lease in the background while the body runs.
+
+    Without this a job running longer than ANALYSIS_JOB_LEASE_SECONDS would
+    look abandoned and be run a second time. Renewal stops if the job is
+    reclaimed anyway (e.g. the database was unreachable for a whole lease).
+    """
+    stop = threading.Event()
+    interval = settings.ANALYSIS_JOB_LEASE_SECONDS / 3
+
+    def heartbeat():
+        try:
+            while not stop.wait(interval):
+                try:
+                    renewed = _renew_lease(job, worker_id)
+                except Exception as e:
+                    logger.error(f"Could not renew the lease on analysis job {job.id}: {e}")
+                    continue
+                if not renewed:
+                    logger.warning(f"Analysis job {job.id} was reclaimed while running")
+                    return
+        finally:
+            connection.close()
+
+    thread = threading.Thread(target=heartbeat, name=f"lease-{job.id}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _response_jobs_in_flight(job: AnalysisJob) -> bool:
+    return AnalysisJob.objects.filter(
+        kind="response", mock_session_id=job.mock_session_id, status__in=AnalysisJob.ACTIVE_STATUSES
+    ).exists()
+
+
+def _release(job: AnalysisJob, worker_id: str, **fields) -> None:
+    """Hand a claimed job back to the queue with ``fields`` applied."""
+    try:
+        with transaction.atomic():
+            AnalysisJob.objects.filter(id=job.id, locked_by=worker_id).update(
+                status="queued", locked_by="", locked_at=None, **fields
+            )
+    except IntegrityError:
+        # A re-upload queued a newer job for this answer while this one ran.
+        AnalysisJob.objects.filter(id=job.id, locked_by=worker_id).update(
+            status="succeeded",
+            finished_at=timezone.now(),
+            last_error="Superseded by a newer upload.",
+        )
+
+
+def _requeue(job: AnalysisJob, worker_id: str, delay: float, error: str = "") -> None:
+    """Put the job back without using up an attempt; nothing about the job itself failed."""
+    _release(
+        job,
+        worker_id,
+        attempts=job.attempts - 1,
+        available_at=timezone.now() + timedelta(seconds=delay),
+        last_error=error,
+    )
+
+
+def _record_failure(job: AnalysisJob, worker_id: str, error: str) -> None:
+    now = timezone.now()
+    if job.attempts < job.max_attempts:
+        delay = settings.ANALYSIS_JOB_RETRY_DELAY * (2 ** (job.attempts - 1))
+        _release(job, worker_id, available_at=now + timedelta(seconds=delay), last_error=error)
+        return
+
+    _fail(job, error, locked_by=worker_id)
+
+
+def _fail(job: AnalysisJob, error: str, **held) -> None:
+    """Fail the job for good if it is still held as ``held`` describes.
+
+    A failed session job also moves its session to "failed", so clients can
+    tell it apart from one still waiting for analysis.
+    """
+    updated = AnalysisJob.objects.filter(id=job.id, **held).update(
+        status="failed",
+        finished_at=timezone.now(),
+        last_error=error,
+    )
+    if updated and job.kind == "session":
+        MockSession.objects.filter(id=job.mock_session_id).update(
+            status="failed",
+            overall_feedback="AI analysis could not be completed. Please try again.",
+        )
+        MockSession.bump_progress(job.mock_session_id)
@@ -0,0 +1,134 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest import mock
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from interviews import ai_pipeline
+from interviews.groq_client import reset_groq_client
+
+SCORE = {
+    "score": 72,
+    "feedback": "Clear answer with a concrete example.",
+    "strengths": ["Concrete example", "Good pacing"],
+    "improvements": ["Quantify impact", "Close with the result"],
+    "communication_score": 70,
+    "relevance_score": 75,
+    "structure_score": 68,
+}
+
+
+class LatencyInjectingClient:
+    """Stand-in for the Groq client that sleeps instead of calling the API.
+
+    Chat latency is a fixed round-trip cost plus a per-output-token cost, and
+    token usage is estimated at ~4 characters per token.
+    """
+
+    def __init__(self, transcribe_latency: float, chat_latency: float, token_latency: float = 0.0):
+        self.transcribe_latency = transcribe_latency
+        self.chat_latency = chat_latency
+        self.token_latency = token_latency
+        self.usage = {"calls": 0, "prompt_tokens": 0, "completion_tokens": 0}
+        self._lock = threading.Lock()
+        self.audio = SimpleNamespace(transcriptions=SimpleNamespace(create=self._transcribe))
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._complete))
+
+    def _transcribe(self, **kwargs):
+        time.sleep(self.transcribe_latency)
+        return "I led the migration and we shipped two weeks early."
+
+    def _complete(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        answer_ids = re.findall(r"^### Answer (\d+)$", prompt, re.MULTILINE)
+        if answer_ids:
+            content = json.dumps({"results": [{"id": i, **SCORE} for i in answer_ids]})
+        else:
+            content = json.dumps(SCORE)
+
+        prompt_tokens = len(prompt) // 4
+        completion_tokens = len(content) // 4
+        with self._lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += prompt_tokens
+            self.usage["completion_tokens"] += completion_tokens
+        time.sleep(self.chat_latency + completion_tokens * self.token_latency)
+        usage = SimpleNamespace(prompt_tokens=prompt_tokens, completion_tokens=completion_tokens)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+            usage=usage,
+        )
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-session analysis wall-clock time against a latency-injecting fake Groq client"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--responses", type=int, default=10, help="Responses per session")
+        parser.add_argument("--transcribe-latency", type=float, default=0.5, help="Seconds per transcription call")
+        parser.add_argument("--chat-latency", type=float, default=0.8, help="Round-trip seconds per scoring call")
+        parser.add_argument("--token-latency", type=float, default=0.002, help="Seconds per generated token")
+        parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 10])
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            nargs="+",
+            default=[1],
+            help="Scoring batch sizes to compare (1 = one call per answer)",
+        )
+        parser.add_argument(
+            "--rate-limits",
+            action="store_true",
+            help="Apply the configured GROQ_*_PER_MINUTE limits (off by default, so runs measure concurrency)",
+        )
+
+    def handle(self, *args, **options):
+        with tempfile.TemporaryDirectory() as tmp, ExitStack() as stack:
+            tasks = []
+            for i in range(options["responses"]):
+                path = os.path.join(tmp, f"response_{i}.webm")
+                with open(path, "wb") as f:
+                    f.write(b"\x1a\x45\xdf\xa3" + os.urandom(1024))
+                tasks.append({"video_path": path, "question_text": f"Question {i}", "tips": ""})
+
+            # Measure the provider path only: no caches, no ffmpeg.
+            stack.enter_context(mock.patch.object(ai_pipeline, "get_cached_transcript", return_value=None))
+            stack.enter_context(mock.patch.object(ai_pipeline, "get_cached_score", return_value=None))
+            stack.enter_context(mock.patch.object(ai_pipeline, "store_transcript"))
+            stack.enter_context(mock.patch.object(ai_pipeline, "store_score"))
+            stack.enter_context(mock.patch.object(ai_pipeline, "extract_audio", return_value=None))
+            if not options["rate_limits"]:
+                stack.enter_context(override_settings(GROQ_REQUESTS_PER_MINUTE=0, GROQ_TOKENS_PER_MINUTE=0))
+            stack.callback(reset_groq_client)
+
+            self.stdout.write(
+                f"{len(tasks)} responses, transcribe={options['transcribe_latency']}s, "
+                f"score={options['chat_latency']}s + {options['token_latency']}s/token per call"
+            )
+            baseline = None
+            for batch_size in options["batch_size"]:
+                for workers in options["concurrency"]:
+                    # Fresh rate limiters and circuit breaker, so no run is throttled by an earlier one.
+                    reset_groq_client()
+                    client = LatencyInjectingClient(
+                        options["transcribe_latency"], options["chat_latency"], options["token_latency"]
+                    )
+                    with mock.patch.object(ai_pipeline, "get_groq_client", return_value=client):
+                        start = time.perf_counter()
+                        ai_pipeline.run_response_analyses(tasks, max_workers=workers, batch_size=batch_size)
+                        elapsed = time.perf_counter() - start
+                    baseline = baseline or elapsed
+                    usage = client.usage
+                    self.stdout.write(
+                        f"  batch={batch_size:<3} concurrency={workers:<3} {elapsed:7.2f}s  "
+                        f"({baseline / elapsed:.1f}x)  llm_calls={usage['calls']:<3} "
+                        f"tokens={usage['prompt_tokens'] + usage['completion_tokens']} "
+                        f"(prompt {usage['prompt_tokens']}, completion {usage['completion_tokens']})"
+                    )
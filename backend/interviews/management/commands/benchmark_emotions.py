@@ -0,0 +1,87 @@
+import random
+import time
+
+from django.core.management.base import BaseCommand
+
+from interviews.emotions import EMOTIONS, analyze_emotions, pack_timeline, session_emotion_summary
+
+
+def _random_timeline(frames: int, interval: float) -> list:
+    """A timeline shaped like useFaceDetection's: one softmax-like emotion dict per sample."""
+    timeline = []
+    for i in range(frames):
+        weights = [random.random() ** 3 for _ in EMOTIONS]
+        total = sum(weights)
+        timeline.append({"time": i * interval, "emotions": {name: w / total for name, w in zip(EMOTIONS, weights)}})
+    return timeline
+
+
+def _python_metrics(timeline: list) -> dict:
+    """The same per-answer metrics computed frame by frame over the JSON dicts, for comparison."""
+    n = len(timeline)
+    sums = dict.fromkeys(EMOTIONS, 0.0)
+    squares = dict.fromkeys(EMOTIONS, 0.0)
+    dominant_counts = dict.fromkeys(EMOTIONS, 0)
+    transitions = 0
+    volatility = 0.0
+    previous = None
+    for frame in timeline:
+        emotions = frame["emotions"]
+        for name in EMOTIONS:
+            value = emotions.get(name, 0)
+            sums[name] += value
+            squares[name] += value * value
+        dominant = max(EMOTIONS, key=lambda name: emotions.get(name, 0))
+        dominant_counts[dominant] += 1
+        if previous is not None:
+            if dominant != previous[0]:
+                transitions += 1
+            volatility += sum(abs(emotions.get(name, 0) - previous[1].get(name, 0)) for name in EMOTIONS)
+        previous = (dominant, emotions)
+    averages = {name: sums[name] / n for name in EMOTIONS}
+    return {
+        "averages": averages,
+        "variance": {name: squares[name] / n - averages[name] ** 2 for name in EMOTIONS},
+        "dominant_share": {name: count / n for name, count in dominant_counts.items()},
+        "transitions": transitions,
+        "volatility": volatility / max(n - 1, 1),
+    }
+
+
+def _best_of(repeat: int, func) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-answer emotion analytics on long timelines, NumPy against a per-frame Python loop"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--frames", type=int, nargs="+", default=[90, 1800, 18000, 180000])
+        parser.add_argument("--interval", type=float, default=2.0, help="Seconds between samples")
+        parser.add_argument("--responses", type=int, default=10, help="Answers per session for the aggregate")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement; the fastest is reported")
+
+    def handle(self, *args, **options):
+        random.seed(0)
+        repeat = options["repeat"]
+        for frames in options["frames"]:
+            timeline = _random_timeline(frames, options["interval"])
+            packed = pack_timeline(timeline)
+            python = _best_of(repeat, lambda: _python_metrics(timeline))
+            vectorized = _best_of(repeat, lambda: analyze_emotions({}, packed, scorer="timeline"))
+            self.stdout.write(
+                f"  frames={frames:<7} python={python * 1000:9.2f}ms  numpy={vectorized * 1000:8.2f}ms  "
+                f"({python / vectorized:.1f}x)  packed={len(packed)} bytes"
+            )
+
+        emotion_data = [
+            {"averages": analyze_emotions({}, pack_timeline(_random_timeline(90, 2)))["metrics"]["averages"]}
+            for _ in range(options["responses"])
+        ]
+        elapsed = _best_of(repeat, lambda: session_emotion_summary(emotion_data))
+        self.stdout.write(f"  session summary over {options['responses']} answers: {elapsed * 1000:.3f}ms")
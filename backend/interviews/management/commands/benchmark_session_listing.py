@@ -0,0 +1,76 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count
+from django.test.utils import override_settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from interviews.models import MockSession
+from interviews.serializers import MockSessionListSerializer
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark listing a heavy user's mock sessions: the whole list in one response against cursor pages "
+        "and sparse fieldsets. Sessions are created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sessions", type=int, default=10000)
+        parser.add_argument("--page-size", type=int, default=20)
+
+    def handle(self, *args, **options):
+        try:
+            with override_settings(ALLOWED_HOSTS=["testserver"]), transaction.atomic():
+                self._run(options["sessions"], options["page_size"])
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _run(self, count: int, page_size: int):
+        user = User.objects.create_user(
+            email="listing-benchmark@example.com", username="listing-benchmark", password="unused-password"
+        )
+        MockSession.objects.bulk_create(
+            (MockSession(candidate=user, question_count=5) for _ in range(count)), batch_size=1000
+        )
+        client = APIClient()
+        client.force_authenticate(user)
+        self.stdout.write(f"{count} mock sessions, page size {page_size}")
+
+        def everything():
+            # The unpaginated listing as it was: every session, counted with a GROUP BY.
+            sessions = MockSession.objects.filter(candidate=user).select_related("candidate").annotate(
+                response_count=Count("responses")
+            )
+            return JSONRenderer().render(MockSessionListSerializer(sessions, many=True).data)
+
+        self._report("whole list in one response", everything)
+
+        url = f"/api/mock/sessions/?page_size={page_size}"
+        self._report("first page", lambda: client.get(url).content)
+        self._report("first page, omit=candidate", lambda: client.get(url + "&omit=candidate").content)
+        self._report("first page, fields=id,status,created_at", lambda: client.get(url + "&fields=id,status,created_at").content)
+
+        # A page deep in the listing costs the same as the first one.
+        response = client.get(url)
+        for _ in range(min(50, count // page_size - 1)):
+            response = client.get(response.data["next"])
+        deep = response.data["next"]
+        if deep:
+            self._report("page 51 (via its cursor)", lambda: client.get(deep).content)
+
+    def _report(self, label: str, fetch) -> None:
+        best, body = float("inf"), b""
+        for _ in range(3):
+            start = time.perf_counter()
+            body = fetch()
+            best = min(best, time.perf_counter() - start)
+        self.stdout.write(f"  {label:<42} {best * 1000:9.1f}ms  {len(body):>10} bytes")
@@ -0,0 +1,91 @@
+import signal
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+from interviews.compaction import analysis_pending, compact_next_recording, compaction_candidates
+from interviews.media import MediaToolUnavailable
+from interviews.models import MediaBlob, MockResponse, QuestionResponse
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):,.1f} MB"
+
+
+class Command(BaseCommand):
+    help = "Transcode stored recordings to a compact format and report storage before and after"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--report", action="store_true", help="Only print the storage report")
+        parser.add_argument("--limit", type=int, default=0, help="Compact at most this many recordings")
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="Keep running and compact recordings as they become eligible (needs MEDIA_COMPACTION)",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=5.0,
+            help="Seconds to wait while analysis jobs are pending or, with --watch, nothing is eligible",
+        )
+
+    def handle(self, *args, **options):
+        self._stopping = False
+        if options["watch"]:
+            if not settings.MEDIA_COMPACTION:
+                self.stdout.write("MEDIA_COMPACTION is off; not watching for recordings to compact")
+                return
+            # Finish the recording in hand on SIGTERM/SIGINT instead of abandoning it.
+            signal.signal(signal.SIGTERM, self._request_stop)
+            signal.signal(signal.SIGINT, self._request_stop)
+        else:
+            self.report("Before" if not options["report"] else "Storage")
+            if options["report"]:
+                return
+
+        compacted = 0
+        while not self._stopping and (not options["limit"] or compacted < options["limit"]):
+            close_old_connections()
+            # Never compete with live analysis for CPU or the provider.
+            if analysis_pending():
+                time.sleep(options["poll_interval"])
+                continue
+            try:
+                found = compact_next_recording()
+            except MediaToolUnavailable as e:
+                raise CommandError(f"{e}; stopping with the remaining recordings left pending")
+            if not found:
+                if not options["watch"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+            compacted += 1
+
+        self.stdout.write(f"Processed {compacted} recording(s)")
+        if not options["watch"]:
+            self.report("After")
+
+    def report(self, label: str) -> None:
+        self.stdout.write(f"{label}:")
+        for model in (MockResponse, QuestionResponse):
+            totals = model.objects.exclude(Q(video_file="") | Q(video_file__isnull=True)).aggregate(
+                recordings=Count("pk"),
+                current=Coalesce(Sum("file_size"), 0),
+                uploaded=Coalesce(Sum(Coalesce("original_file_size", "file_size")), 0),
+                compacted=Count("pk", filter=Q(compaction_status="compacted")),
+            )
+            pending = compaction_candidates(model).count()
+            self.stdout.write(
+                f"  {model.__name__}: {totals['recordings']} recordings, {_mb(totals['uploaded'])} as uploaded, "
+                f"{_mb(totals['current'])} now ({totals['compacted']} compacted, {pending} pending)"
+            )
+        on_disk = MediaBlob.objects.filter(ref_count__gt=0).aggregate(size=Coalesce(Sum("size"), 0))["size"]
+        self.stdout.write(f"  Blob storage on disk (after deduplication): {_mb(on_disk)}")
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
@@ -0,0 +1,197 @@
+import os
+import shutil
+import time
+import uuid
+from datetime import timedelta
+from itertools import islice
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.utils import timezone
+
+from interviews.models import ChunkedUpload, MediaBlob
+from interviews.storage import content_addressed_storage, purge_unreferenced_blobs
+from interviews.uploads import discard_part
+
+
+def _walk_files(root: str):
+    """Yield a DirEntry for every file under ``root``, one directory listing at a time."""
+    stack = [root]
+    while stack:
+        try:
+            listing = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with listing:
+            for entry in listing:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry
+
+
+def _valid_uuids(values):
+    valid = []
+    for value in values:
+        try:
+            valid.append(uuid.UUID(value))
+        except ValueError:
+            pass
+    return valid
+
+
+def _file_field_columns():
+    """(model, field name) for every FileField in the project, plus the blob table."""
+    columns = [(MediaBlob, "name")]
+    for model in apps.get_models():
+        for field in model._meta.get_fields():
+            if isinstance(field, models.FileField):
+                columns.append((model, field.name))
+    return columns
+
+
+class Command(BaseCommand):
+    help = "Delete or quarantine media files that no database row references"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dry-run", action="store_true", help="Report orphans without touching them")
+        parser.add_argument("--quarantine", metavar="DIR", help="Move orphans under DIR instead of deleting them")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Files cross-checked per query")
+        parser.add_argument("--rate", type=float, default=0, help="Max orphans removed per second (0 = unlimited)")
+        parser.add_argument(
+            "--grace-seconds",
+            type=int,
+            default=settings.MEDIA_GC_GRACE_SECONDS,
+            help="Ignore files and blobs changed more recently than this",
+        )
+
+    def handle(self, *args, **options):
+        self.options = options
+        self.removed = 0
+        self.started = time.monotonic()
+        dry_run = options["dry_run"]
+        grace = options["grace_seconds"]
+
+        blobs, blob_bytes = purge_unreferenced_blobs(content_addressed_storage, grace, dry_run=dry_run)
+        self.stdout.write(f"Unreferenced blobs: {blobs} ({blob_bytes} bytes)")
+
+        uploads, upload_bytes = self._expire_chunked_uploads(dry_run)
+        self.stdout.write(f"Abandoned chunked uploads: {uploads} ({upload_bytes} bytes)")
+        leftovers, leftover_bytes = self._sweep_upload_dir(grace, dry_run)
+        self.stdout.write(f"Leftover upload temp files: {leftovers} ({leftover_bytes} bytes)")
+
+        scanned, orphans, orphan_bytes = self._sweep(str(settings.MEDIA_ROOT), grace, dry_run)
+        verb = "would be reclaimed" if dry_run else ("quarantined" if options["quarantine"] else "reclaimed")
+        self.stdout.write(
+            f"Scanned {scanned} media files: {orphans} orphaned, {orphan_bytes} bytes {verb}"
+        )
+        total = blob_bytes + upload_bytes + leftover_bytes + orphan_bytes
+        self.stdout.write(self.style.SUCCESS(f"Total: {total} bytes {'would be ' if dry_run else ''}freed"))
+
+    def _sweep(self, root: str, grace: int, dry_run: bool):
+        columns = _file_field_columns()
+        cutoff = time.time() - grace
+        quarantine = self.options["quarantine"]
+        scanned = orphans = orphan_bytes = 0
+
+        # Never sweep the quarantine or the chunked upload parts, even if they live under MEDIA_ROOT.
+        if quarantine:
+            quarantine = os.path.abspath(quarantine)
+        excluded = tuple(
+            os.path.abspath(path) + os.sep for path in (quarantine, settings.CHUNKED_UPLOAD_DIR) if path
+        )
+        files = (entry for entry in _walk_files(root) if not os.path.abspath(entry.path).startswith(excluded))
+
+        while True:
+            batch = list(islice(files, self.options["batch_size"]))
+            if not batch:
+                break
+            scanned += len(batch)
+
+            candidates = {}
+            for entry in batch:
+                stat = entry.stat(follow_symlinks=False)
+                # Leave files that may belong to an upload still in flight.
+                if stat.st_mtime < cutoff:
+                    name = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                    candidates[name] = (entry.path, stat.st_size)
+            if not candidates:
+                continue
+
+            referenced = set()
+            for model, field in columns:
+                referenced.update(
+                    model._default_manager.filter(**{f"{field}__in": list(candidates)}).values_list(field, flat=True)
+                )
+
+            for name, (path, size) in candidates.items():
+                if name in referenced:
+                    continue
+                orphans += 1
+                orphan_bytes += size
+                if self.options["verbosity"] >= 2:
+                    self.stdout.write(f"  orphan: {name} ({size} bytes)")
+                if not dry_run:
+                    self._remove(path, name, quarantine)
+
+        return scanned, orphans, orphan_bytes
+
+    def _remove(self, path: str, name: str, quarantine) -> None:
+        rate = self.options["rate"]
+        if rate > 0:
+            delay = self.started + self.removed / rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        try:
+            if quarantine:
+                target = os.path.join(quarantine, name)
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                shutil.move(path, target)
+            else:
+                os.remove(path)
+        except FileNotFoundError:
+            return
+        self.removed += 1
+
+    def _expire_chunked_uploads(self, dry_run: bool):
+        cutoff = timezone.now() - timedelta(seconds=settings.CHUNKED_UPLOAD_EXPIRY)
+        expired = ChunkedUpload.objects.filter(status="uploading", updated_at__lt=cutoff)
+        count = freed = 0
+        for upload in expired.only("id", "offset").iterator():
+            # Re-check per row: a client may have resumed since the scan started.
+            if not dry_run and not expired.filter(id=upload.id).delete()[0]:
+                continue
+            count += 1
+            freed += upload.offset
+            if not dry_run:
+                discard_part(upload)
+        return count, freed
+
+    def _sweep_upload_dir(self, grace: int, dry_run: bool):
+        """Remove part files without an upload row and spooled uploads left by crashed workers."""
+        cutoff = time.time() - grace
+        files = (
+            entry for entry in _walk_files(settings.CHUNKED_UPLOAD_DIR)
+            if entry.stat(follow_symlinks=False).st_mtime < cutoff
+        )
+        count = freed = 0
+        while True:
+            batch = list(islice(files, self.options["batch_size"]))
+            if not batch:
+                break
+            upload_ids = [entry.name[:-len(".part")] for entry in batch if entry.name.endswith(".part")]
+            live = {
+                str(upload_id)
+                for upload_id in ChunkedUpload.objects.filter(id__in=_valid_uuids(upload_ids), status="uploading")
+                .values_list("id", flat=True)
+            }
+            for entry in batch:
+                if entry.name.endswith(".part") and entry.name[:-len(".part")] in live:
+                    continue
+                count += 1
+                freed += entry.stat(follow_symlinks=False).st_size
+                if not dry_run:
+                    self._remove(entry.path, entry.name, None)
+        return count, freed
@@ -0,0 +1,86 @@
+import os
+
+from django.core.management.base import BaseCommand
+
+from interviews.ai_cache import hash_file
+from interviews.media import SNIFF_BYTES, sniff_container
+from interviews.models import MockResponse, QuestionResponse
+from interviews.storage import BLOB_PREFIX, content_addressed_storage, release_blob, retain_blob
+from interviews.uploads import AssembledUpload
+
+
+class Command(BaseCommand):
+    help = "Move existing answer videos into content-addressed storage, storing identical files once"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200)
+        parser.add_argument("--dry-run", action="store_true", help="Report what would be migrated and saved")
+
+    def handle(self, *args, **options):
+        storage = content_addressed_storage
+        # Original name -> blob, for rows that share a file.
+        self.moved = {}
+        self.seen_hashes = set()
+        for model in (QuestionResponse, MockResponse):
+            totals = {"migrated": 0, "missing": 0, "bytes": 0, "saved": 0}
+            last_pk = None
+            while True:
+                batch = model.objects.exclude(video_file="").exclude(video_file__isnull=True).exclude(
+                    video_file__startswith=f"{BLOB_PREFIX}/"
+                ).order_by("pk")
+                if last_pk is not None:
+                    batch = batch.filter(pk__gt=last_pk)
+                batch = list(batch.values_list("pk", "video_file")[:options["batch_size"]])
+                if not batch:
+                    break
+                last_pk = batch[-1][0]
+                for pk, name in batch:
+                    self._migrate(model, pk, name, storage, totals, options["dry_run"])
+
+            verb = "Would migrate" if options["dry_run"] else "Migrated"
+            self.stdout.write(
+                f"{model.__name__}: {verb} {totals['migrated']} files ({totals['bytes']} bytes), "
+                f"{totals['saved']} bytes deduplicated, {totals['missing']} missing"
+            )
+
+    def _migrate(self, model, pk, name, storage, totals, dry_run):
+        if name in self.moved:
+            blob, metadata = self.moved[name]
+            if not dry_run and model.objects.filter(pk=pk, video_file=name).update(video_file=blob, **metadata):
+                retain_blob(blob, metadata["content_hash"], metadata["file_size"])
+            totals["migrated"] += 1
+            totals["saved"] += metadata["file_size"]
+            return
+
+        path = storage.path(name)
+        if not os.path.exists(path):
+            totals["missing"] += 1
+            return
+
+        with open(path, "rb") as f:
+            header = f.read(SNIFF_BYTES)
+        metadata = {
+            "content_hash": hash_file(path),
+            "file_size": os.path.getsize(path),
+            "container": sniff_container(header),
+        }
+        totals["migrated"] += 1
+        totals["bytes"] += metadata["file_size"]
+        if metadata["content_hash"] in self.seen_hashes:
+            totals["saved"] += metadata["file_size"]
+        self.seen_hashes.add(metadata["content_hash"])
+        if dry_run:
+            self.moved[name] = (storage.blob_name(metadata["content_hash"], name), metadata)
+            return
+
+        # Handing the original over as a temporary file makes storing it a
+        # rename; if the blob already exists the original is simply deleted.
+        with AssembledUpload(path, os.path.basename(name)) as content:
+            content.content_hash = metadata["content_hash"]
+            blob = storage.save(name, content)
+        self.moved[name] = (blob, metadata)
+        if not model.objects.filter(pk=pk, video_file=name).update(video_file=blob, **metadata):
+            # The answer was re-uploaded meanwhile; don't keep a reference for it.
+            release_blob(blob)
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,59 @@
+import os
+import signal
+import socket
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from interviews.jobs import claim_next_job, run_job
+
+
+class Command(BaseCommand):
+    help = "Process queued mock session analysis jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to sleep when the queue is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the currently runnable jobs and exit",
+        )
+        parser.add_argument(
+            "--worker-id",
+            default=f"{socket.gethostname()}:{os.getpid()}",
+            help="Identifier recorded on claimed jobs",
+        )
+
+    def handle(self, *args, **options):
+        worker_id = options["worker_id"]
+        self._stopping = False
+        # Finish the job in hand on SIGTERM/SIGINT instead of abandoning it.
+        signal.signal(signal.SIGTERM, self._request_stop)
+        signal.signal(signal.SIGINT, self._request_stop)
+
+        self.stdout.write(f"Analysis worker {worker_id} started")
+        processed = 0
+
+        while not self._stopping:
+            close_old_connections()
+            job = claim_next_job(worker_id)
+            if job is None:
+                if options["once"]:
+                    break
+                time.sleep(options["poll_interval"])
+                continue
+
+            self.stdout.write(f"  Running job {job.id} for session {job.mock_session_id} (attempt {job.attempts})")
+            run_job(job, worker_id)
+            processed += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Analysis worker {worker_id} stopped after {processed} job(s)."))
+
+    def _request_stop(self, signum, frame):
+        self._stopping = True
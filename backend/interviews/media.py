@@ -0,0 +1,165 @@
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+_stats_lock = threading.Lock()
+_extraction_stats = {"extracted": 0, "fallbacks": 0, "bytes_in": 0, "bytes_out": 0}
+
+
+def audio_extraction_stats() -> dict:
+    """Totals for this process: how many uploads were shrunk and by how much."""
+    with _stats_lock:
+        stats = dict(_extraction_stats)
+    stats["bytes_saved"] = stats["bytes_in"] - stats["bytes_out"]
+    return stats
+
+
+def _record(key: str, bytes_in: int = 0, bytes_out: int = 0) -> None:
+    with _stats_lock:
+        _extraction_stats[key] += 1
+        _extraction_stats["bytes_in"] += bytes_in
+        _extraction_stats["bytes_out"] += bytes_out
+
+
+# Enough of the header to tell the containers browsers record into apart.
+SNIFF_BYTES = 64
+
+
+def sniff_container(header: bytes) -> str:
+    """Name the container format from the first SNIFF_BYTES of a file, or "unknown"."""
+    if header.startswith(b"\x1a\x45\xdf\xa3"):
+        # EBML; the DocType element says whether it is WebM or plain Matroska.
+        return "webm" if b"webm" in header else "matroska"
+    if header[4:8] == b"ftyp":
+        return "quicktime" if header[8:12] == b"qt  " else "mp4"
+    if header.startswith(b"OggS"):
+        return "ogg"
+    if header.startswith(b"RIFF") and header[8:12] == b"AVI ":
+        return "avi"
+    return "unknown"
+
+
+def extract_audio(video_path: str):
+    """Decode the audio track of ``video_path`` into a small mono 16 kHz Opus file.
+
+    ffmpeg reads the recording from disk and writes the encoded audio to a
+    temp file, so memory use does not depend on the upload size. Returns the
+    path of the temp file (the caller deletes it), or None when extraction is
+    disabled or fails, in which case the caller should send the original.
+    """
+    if not settings.AI_AUDIO_EXTRACTION:
+        return None
+
+    ffmpeg = shutil.which(settings.FFMPEG_BINARY)
+    if ffmpeg is None:
+        logger.warning(f"{settings.FFMPEG_BINARY} not found; uploading original media for transcription")
+        _record("fallbacks")
+        return None
+
+    fd, audio_path = tempfile.mkstemp(suffix=".ogg", prefix="audio_")
+    os.close(fd)
+    command = [
+        ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", video_path,
+        "-vn", "-ac", "1", "-ar", "16000",
+        "-c:a", "libopus", "-b:a", settings.AI_AUDIO_BITRATE, "-application", "voip",
+        "-f", "ogg", audio_path,
+    ]
+    try:
+        subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=settings.AI_AUDIO_EXTRACTION_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        stderr = getattr(e, "stderr", b"") or b""
+        logger.warning(f"Audio extraction failed for {video_path}: {e} {stderr.decode(errors='replace').strip()}")
+        _remove_quietly(audio_path)
+        _record("fallbacks")
+        return None
+
+    bytes_in = os.path.getsize(video_path)
+    bytes_out = os.path.getsize(audio_path)
+    if bytes_out == 0:
+        logger.warning(f"No audio track decoded from {video_path}")
+        _remove_quietly(audio_path)
+        _record("fallbacks")
+        return None
+
+    _record("extracted", bytes_in, bytes_out)
+    logger.info(
+        f"Extracted audio from {os.path.basename(video_path)}: "
+        f"{bytes_in} -> {bytes_out} bytes ({bytes_in - bytes_out} saved)"
+    )
+    return audio_path
+
+
+class MediaToolUnavailable(RuntimeError):
+    """ffmpeg is missing or cannot be started; says nothing about the recording itself."""
+
+
+def transcode_video(video_path: str):
+    """Re-encode a stored recording as bounded-bitrate VP9/Opus WebM for long-term storage.
+
+    ffmpeg runs single-threaded at the lowest CPU priority so it never
+    starves request handling or analysis on the same host. Returns the path
+    of the temp output (the caller moves or deletes it), or None when this
+    recording could not be transcoded. Raises ``MediaToolUnavailable`` when
+    ffmpeg itself cannot be run.
+    """
+    ffmpeg = shutil.which(settings.FFMPEG_BINARY)
+    if ffmpeg is None:
+        raise MediaToolUnavailable(f"{settings.FFMPEG_BINARY} not found")
+
+    fd, output_path = tempfile.mkstemp(suffix=".webm", prefix="compact_")
+    os.close(fd)
+    bitrate = settings.MEDIA_COMPACTION_VIDEO_BITRATE
+    command = [
+        ffmpeg, "-nostdin", "-hide_banner", "-loglevel", "error", "-y",
+        "-i", video_path,
+        "-vf", f"scale=-2:'min({settings.MEDIA_COMPACTION_MAX_HEIGHT},ih)'",
+        "-c:v", "libvpx-vp9", "-b:v", bitrate, "-maxrate", bitrate, "-bufsize", bitrate,
+        "-deadline", "good", "-cpu-used", "4", "-row-mt", "0", "-threads", "1",
+        "-c:a", "libopus", "-b:a", settings.MEDIA_COMPACTION_AUDIO_BITRATE,
+        # Deterministic output, so identical recordings compact to one shared blob.
+        "-fflags", "+bitexact", "-flags:v", "+bitexact", "-flags:a", "+bitexact",
+        "-f", "webm", output_path,
+    ]
+    try:
+        subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            timeout=settings.MEDIA_COMPACTION_TIMEOUT,
+            preexec_fn=(lambda: os.nice(19)) if hasattr(os, "nice") else None,
+        )
+    except OSError as e:
+        _remove_quietly(output_path)
+        raise MediaToolUnavailable(f"Could not run {ffmpeg}: {e}") from e
+    except subprocess.SubprocessError as e:
+        stderr = getattr(e, "stderr", b"") or b""
+        logger.warning(f"Transcoding failed for {video_path}: {e} {stderr.decode(errors='replace').strip()}")
+        _remove_quietly(output_path)
+        return None
+
+    if os.path.getsize(output_path) == 0:
+        _remove_quietly(output_path)
+        return None
+    return output_path
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
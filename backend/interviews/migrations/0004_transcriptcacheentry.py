@@ -0,0 +1,49 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:49
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0003_analysisjob"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TranscriptCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "content_hash",
+                    models.CharField(
+                        help_text="SHA-256 of the uploaded media", max_length=64
+                    ),
+                ),
+                ("model", models.CharField(max_length=100)),
+                ("response_format", models.CharField(max_length=20)),
+                ("transcript", models.TextField(blank=True)),
+                ("hit_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_used_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Transcript cache entries",
+                "unique_together": {("content_hash", "model", "response_format")},
+            },
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:52
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0004_transcriptcacheentry"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ScoringCacheEntry",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="SHA-256 of the rendered scoring request",
+                        max_length=64,
+                        unique=True,
+                    ),
+                ),
+                ("model", models.CharField(max_length=100)),
+                ("prompt_version", models.CharField(max_length=20)),
+                ("result", models.JSONField(default=dict)),
+                ("hit_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True, db_index=True)),
+                (
+                    "last_used_at",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Scoring cache entries",
+            },
+        ),
+    ]
@@ -0,0 +1,71 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:56
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0005_scoringcacheentry"),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name="analysisjob",
+            name="unique_active_analysis_job",
+        ),
+        migrations.AddField(
+            model_name="analysisjob",
+            name="kind",
+            field=models.CharField(
+                choices=[("session", "Session"), ("response", "Response")],
+                default="session",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="analysisjob",
+            name="mock_response",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="analysis_jobs",
+                to="interviews.mockresponse",
+            ),
+        ),
+        migrations.AddField(
+            model_name="analysisjob",
+            name="response_version",
+            field=models.IntegerField(
+                default=0, help_text="MockResponse.upload_version this job analyzes"
+            ),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="upload_version",
+            field=models.IntegerField(
+                default=0,
+                help_text="Bumped on every upload; stale analysis results are discarded",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="analysisjob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(
+                    ("kind", "session"), ("status__in", ["queued", "running"])
+                ),
+                fields=("mock_session",),
+                name="unique_active_session_analysis_job",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="analysisjob",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("kind", "response"), ("status", "queued")),
+                fields=("mock_response",),
+                name="unique_queued_response_analysis_job",
+            ),
+        ),
+    ]
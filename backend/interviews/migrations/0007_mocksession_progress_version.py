@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 03:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0006_incremental_response_analysis"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mocksession",
+            name="progress_version",
+            field=models.IntegerField(
+                default=0,
+                help_text="Bumped whenever the session or one of its responses changes analysis state",
+            ),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0008_chunkedupload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mockresponse",
+            name="container",
+            field=models.CharField(
+                blank=True,
+                help_text="Container format sniffed from the file header",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="SHA-256 of the uploaded video",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="file_size",
+            field=models.BigIntegerField(
+                blank=True, help_text="Uploaded video size in bytes", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="container",
+            field=models.CharField(
+                blank=True,
+                help_text="Container format sniffed from the file header",
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="SHA-256 of the uploaded video",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="file_size",
+            field=models.BigIntegerField(
+                blank=True, help_text="Uploaded video size in bytes", null=True
+            ),
+        ),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:13
+
+from django.db import migrations, models
+import interviews.storage
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0009_upload_metadata"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="mockresponse",
+            name="video_file",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=interviews.storage.ContentAddressedStorage(),
+                upload_to="mock_videos/",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="questionresponse",
+            name="video_file",
+            field=models.FileField(
+                blank=True,
+                null=True,
+                storage=interviews.storage.ContentAddressedStorage(),
+                upload_to="videos/",
+            ),
+        ),
+        migrations.CreateModel(
+            name="MediaBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="Storage name, blobs/ab/cd/<sha256><ext>",
+                        max_length=255,
+                        unique=True,
+                    ),
+                ),
+                ("content_hash", models.CharField(db_index=True, max_length=64)),
+                ("size", models.BigIntegerField(default=0)),
+                ("ref_count", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["ref_count", "updated_at"],
+                        name="interviews__ref_cou_35b72b_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0010_content_addressed_media"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mockresponse",
+            name="compacted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="compaction_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("compacted", "Compacted"),
+                    ("skipped", "Skipped"),
+                    ("failed", "Failed"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="original_file_size",
+            field=models.BigIntegerField(
+                blank=True, help_text="Size as uploaded, before compaction", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="compacted_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="compaction_status",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("compacted", "Compacted"),
+                    ("skipped", "Skipped"),
+                    ("failed", "Failed"),
+                ],
+                max_length=20,
+            ),
+        ),
+        migrations.AddField(
+            model_name="questionresponse",
+            name="original_file_size",
+            field=models.BigIntegerField(
+                blank=True, help_text="Size as uploaded, before compaction", null=True
+            ),
+        ),
+    ]
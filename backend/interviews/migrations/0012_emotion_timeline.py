@@ -0,0 +1,69 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:19
+
+import struct
+
+from django.db import migrations, models
+
+# Frozen copy of the packed layout at the time of this migration (see
+# interviews.emotions): little-endian float32 rows of [time, *EMOTIONS].
+EMOTIONS = ("neutral", "happy", "sad", "angry", "fearful", "disgusted", "surprised")
+
+
+def _pack_timeline(timeline):
+    values = []
+    for frame in timeline or ():
+        if not isinstance(frame, dict) or not isinstance(frame.get("emotions"), dict):
+            continue
+        emotions = frame["emotions"]
+        try:
+            row = [float(frame.get("time", 0))] + [
+                float(emotions.get(name, 0)) for name in EMOTIONS
+            ]
+        except (TypeError, ValueError):
+            continue
+        values.extend(row)
+    return struct.pack(f"<{len(values)}f", *values)
+
+
+def split_emotion_data(emotion_data):
+    if not isinstance(emotion_data, dict):
+        return {}, b""
+    summary = {key: value for key, value in emotion_data.items() if key != "timeline"}
+    return summary, _pack_timeline(emotion_data.get("timeline"))
+
+
+def pack_existing_timelines(apps, schema_editor):
+    MockResponse = apps.get_model("interviews", "MockResponse")
+    answers = MockResponse.objects.filter(emotion_data__has_key="timeline")
+    for answer in answers.only("pk", "emotion_data").iterator(chunk_size=500):
+        summary, timeline = split_emotion_data(answer.emotion_data)
+        MockResponse.objects.filter(pk=answer.pk).update(
+            emotion_data=summary, emotion_timeline=timeline
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0011_recording_compaction"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mockresponse",
+            name="emotion_timeline",
+            field=models.BinaryField(
+                blank=True,
+                default=b"",
+                help_text="Per-frame emotions as packed float32 rows; see interviews.emotions",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="mockresponse",
+            name="emotion_data",
+            field=models.JSONField(
+                blank=True, default=dict, help_text="Averages and dominant emotion"
+            ),
+        ),
+        migrations.RunPython(pack_existing_timelines, migrations.RunPython.noop),
+    ]
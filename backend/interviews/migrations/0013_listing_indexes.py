@@ -0,0 +1,41 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0012_emotion_timeline"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="candidatesession",
+            index=models.Index(
+                fields=["candidate", "-created_at", "-id"],
+                name="interviews__candida_672e9c_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="interview",
+            index=models.Index(
+                fields=["recruiter", "-created_at", "-id"],
+                name="interviews__recruit_0b7bc7_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="interview",
+            index=models.Index(
+                fields=["status", "-created_at", "-id"],
+                name="interviews__status_fa6eeb_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="mocksession",
+            index=models.Index(
+                fields=["candidate", "-created_at", "-id"],
+                name="interviews__candida_859388_idx",
+            ),
+        ),
+    ]
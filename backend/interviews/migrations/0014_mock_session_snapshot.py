@@ -0,0 +1,42 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:36
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0013_listing_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MockSessionSnapshot",
+            fields=[
+                (
+                    "session",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="snapshot",
+                        serialize=False,
+                        to="interviews.mocksession",
+                    ),
+                ),
+                (
+                    "body",
+                    models.BinaryField(
+                        help_text="gzip-compressed JSON of the session detail; see interviews.snapshots"
+                    ),
+                ),
+                (
+                    "digest",
+                    models.CharField(
+                        help_text="SHA-256 of the uncompressed body", max_length=64
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0014_mock_session_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mockresponse",
+            name="communication_score",
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="improvements",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="relevance_score",
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="strengths",
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name="mockresponse",
+            name="structure_score",
+            field=models.FloatField(blank=True, db_index=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name="mockresponse",
+            name="ai_feedback",
+            field=models.TextField(
+                blank=True, help_text="The full scoring result as JSON"
+            ),
+        ),
+    ]
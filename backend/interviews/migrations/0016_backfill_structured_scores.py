@@ -0,0 +1,66 @@
+import json
+
+from django.db import migrations, transaction
+
+BATCH_SIZE = 500
+SCORE_FIELDS = ("communication_score", "relevance_score", "structure_score")
+LIST_FIELDS = ("strengths", "improvements")
+
+
+def _score(value):
+    try:
+        return max(0.0, min(100.0, float(value)))
+    except (TypeError, ValueError):
+        return None
+
+
+def _strings(value):
+    return [str(item) for item in value] if isinstance(value, list) else []
+
+
+def backfill_score_columns(apps, schema_editor):
+    MockResponse = apps.get_model("interviews", "MockResponse")
+    MockSessionSnapshot = apps.get_model("interviews", "MockSessionSnapshot")
+
+    answers = (
+        MockResponse.objects.exclude(ai_feedback="")
+        .filter(communication_score__isnull=True)
+        .only("pk", "ai_feedback")
+        .order_by("pk")
+    )
+    last_pk = None
+    while True:
+        batch = answers if last_pk is None else answers.filter(pk__gt=last_pk)
+        batch = list(batch[:BATCH_SIZE])
+        if not batch:
+            break
+        last_pk = batch[-1].pk
+        for answer in batch:
+            try:
+                feedback = json.loads(answer.ai_feedback)
+            except ValueError:
+                feedback = {}
+            if not isinstance(feedback, dict):
+                feedback = {}
+            for field in SCORE_FIELDS:
+                setattr(answer, field, _score(feedback.get(field)))
+            for field in LIST_FIELDS:
+                setattr(answer, field, _strings(feedback.get(field)))
+        with transaction.atomic():
+            MockResponse.objects.bulk_update(batch, SCORE_FIELDS + LIST_FIELDS)
+
+    # Stored results were rendered without the new fields; they are rewritten on first read.
+    MockSessionSnapshot.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+    # Each batch commits on its own, so a large table is not rewritten in one transaction.
+    atomic = False
+
+    dependencies = [
+        ("interviews", "0015_structured_scores"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_score_columns, migrations.RunPython.noop),
+    ]
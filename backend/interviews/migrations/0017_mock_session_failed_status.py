@@ -0,0 +1,27 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("interviews", "0016_backfill_structured_scores"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="mocksession",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("in_progress", "In Progress"),
+                    ("completed", "Completed"),
+                    ("analyzed", "Analyzed"),
+                    ("failed", "Analysis failed"),
+                ],
+                default="in_progress",
+                max_length=20,
+            ),
+        ),
+    ]
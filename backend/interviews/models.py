@@ -1,6 +1,15 @@
 import uuid
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
+
+from .storage import content_addressed_storage
+
+COMPACTION_STATUS_CHOICES = [
+    ("compacted", "Compacted"),
+    ("skipped", "Skipped"),
+    ("failed", "Failed"),
+]
 
 
 class Interview(models.Model):
@@ -24,6 +33,10 @@ class Interview(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["recruiter", "-created_at", "-id"]),
+            models.Index(fields=["status", "-created_at", "-id"]),
+        ]
 
     def __str__(self):
         return self.title
@@ -53,6 +66,7 @@ class CandidateSession(models.Model):
     class Meta:
         ordering = ["-created_at"]
         unique_together = ["interview", "candidate"]
+        indexes = [models.Index(fields=["candidate", "-created_at", "-id"])]
 
     def __str__(self):
         return f"{self.candidate} - {self.interview.title}"
@@ -66,7 +80,13 @@ class QuestionResponse(models.Model):
     question = models.ForeignKey(
         "questions.Question", on_delete=models.CASCADE, related_name="responses"
     )
-    video_file = models.FileField(upload_to="videos/", blank=True, null=True)
+    video_file = models.FileField(upload_to="videos/", storage=content_addressed_storage, blank=True, null=True)
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the uploaded video")
+    file_size = models.BigIntegerField(null=True, blank=True, help_text="Uploaded video size in bytes")
+    container = models.CharField(max_length=20, blank=True, help_text="Container format sniffed from the file header")
+    compaction_status = models.CharField(max_length=20, choices=COMPACTION_STATUS_CHOICES, blank=True)
+    original_file_size = models.BigIntegerField(null=True, blank=True, help_text="Size as uploaded, before compaction")
+    compacted_at = models.DateTimeField(null=True, blank=True)
     transcript = models.TextField(blank=True)
     ai_score = models.FloatField(null=True, blank=True)
     ai_feedback = models.TextField(blank=True)
@@ -93,6 +113,7 @@ class MockSession(models.Model):
         ("in_progress", "In Progress"),
         ("completed", "Completed"),
         ("analyzed", "Analyzed"),
+        ("failed", "Analysis failed"),
     ]
 
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -106,15 +127,24 @@ class MockSession(models.Model):
     behavioral_insights = models.JSONField(default=dict, blank=True)
     emotion_summary = models.JSONField(default=dict, blank=True)
     question_count = models.IntegerField(default=5)
+    progress_version = models.IntegerField(
+        default=0, help_text="Bumped whenever the session or one of its responses changes analysis state"
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["candidate", "-created_at", "-id"])]
 
     def __str__(self):
         return f"Mock: {self.candidate} - {self.session_type} ({self.status})"
 
+    @staticmethod
+    def bump_progress(session_id) -> None:
+        """Signal progress listeners; an atomic increment, never a read-modify-write."""
+        MockSession.objects.filter(id=session_id).update(progress_version=models.F("progress_version") + 1)
+
 
 class MockResponse(models.Model):
     ANALYSIS_STATUS_CHOICES = [
@@ -132,14 +162,32 @@ class MockResponse(models.Model):
         "questions.Question", on_delete=models.CASCADE, related_name="mock_responses"
     )
     question_order = models.IntegerField(default=0)
-    video_file = models.FileField(upload_to="mock_videos/", blank=True, null=True)
+    video_file = models.FileField(
+        upload_to="mock_videos/", storage=content_addressed_storage, blank=True, null=True
+    )
+    content_hash = models.CharField(max_length=64, blank=True, db_index=True, help_text="SHA-256 of the uploaded video")
+    file_size = models.BigIntegerField(null=True, blank=True, help_text="Uploaded video size in bytes")
+    container = models.CharField(max_length=20, blank=True, help_text="Container format sniffed from the file header")
+    compaction_status = models.CharField(max_length=20, choices=COMPACTION_STATUS_CHOICES, blank=True)
+    original_file_size = models.BigIntegerField(null=True, blank=True, help_text="Size as uploaded, before compaction")
+    compacted_at = models.DateTimeField(null=True, blank=True)
     transcript = models.TextField(blank=True)
     ai_score = models.FloatField(null=True, blank=True)
-    ai_feedback = models.TextField(blank=True)
+    ai_feedback = models.TextField(blank=True, help_text="The full scoring result as JSON")
+    # Sub-scores and lists from ai_feedback, in columns so analytics can aggregate them in SQL.
+    communication_score = models.FloatField(null=True, blank=True, db_index=True)
+    relevance_score = models.FloatField(null=True, blank=True, db_index=True)
+    structure_score = models.FloatField(null=True, blank=True, db_index=True)
+    strengths = models.JSONField(default=list, blank=True)
+    improvements = models.JSONField(default=list, blank=True)
     confidence_score = models.FloatField(null=True, blank=True)
-    emotion_data = models.JSONField(default=dict, blank=True)
+    emotion_data = models.JSONField(default=dict, blank=True, help_text="Averages and dominant emotion")
+    emotion_timeline = models.BinaryField(
+        blank=True, default=b"", help_text="Per-frame emotions as packed float32 rows; see interviews.emotions"
+    )
     duration = models.IntegerField(default=0, help_text="Recording duration in seconds")
     analysis_status = models.CharField(max_length=20, choices=ANALYSIS_STATUS_CHOICES, default="pending")
+    upload_version = models.IntegerField(default=0, help_text="Bumped on every upload; stale analysis results are discarded")
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -149,3 +197,168 @@ class MockResponse(models.Model):
 
     def __str__(self):
         return f"MockResponse: {self.session.candidate} - Q{self.question_order}"
+
+
+class MockSessionSnapshot(models.Model):
+    """The rendered results of an analyzed mock session, written once when analysis finishes."""
+
+    session = models.OneToOneField(
+        MockSession, on_delete=models.CASCADE, primary_key=True, related_name="snapshot"
+    )
+    body = models.BinaryField(help_text="gzip-compressed JSON of the session detail; see interviews.snapshots")
+    digest = models.CharField(max_length=64, help_text="SHA-256 of the uncompressed body")
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"Snapshot: {self.session_id} ({len(self.body)} bytes)"
+
+
+class AnalysisJob(models.Model):
+    KIND_CHOICES = [
+        ("session", "Session"),
+        ("response", "Response"),
+    ]
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("succeeded", "Succeeded"),
+        ("failed", "Failed"),
+    ]
+    ACTIVE_STATUSES = ("queued", "running")
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES, default="session")
+    mock_session = models.ForeignKey(
+        MockSession, on_delete=models.CASCADE, related_name="analysis_jobs"
+    )
+    mock_response = models.ForeignKey(
+        MockResponse, on_delete=models.CASCADE, null=True, blank=True, related_name="analysis_jobs"
+    )
+    response_version = models.IntegerField(default=0, help_text="MockResponse.upload_version this job analyzes")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="queued")
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=3)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(default=timezone.now, help_text="Earliest time a worker may claim the job")
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        indexes = [models.Index(fields=["status", "available_at"])]
+        constraints = [
+            # At most one queued/running session job per session, so repeated
+            # "complete" calls can never double-run the analysis.
+            models.UniqueConstraint(
+                fields=["mock_session"],
+                condition=models.Q(kind="session", status__in=["queued", "running"]),
+                name="unique_active_session_analysis_job",
+            ),
+            # A re-upload retargets the queued job; a running one may finish
+            # alongside it, but its results are discarded by upload_version.
+            models.UniqueConstraint(
+                fields=["mock_response"],
+                condition=models.Q(kind="response", status="queued"),
+                name="unique_queued_response_analysis_job",
+            ),
+        ]
+
+    def __str__(self):
+        target = self.mock_response_id if self.kind == "response" else self.mock_session_id
+        return f"AnalysisJob: {self.kind} {target} ({self.status}, attempt {self.attempts})"
+
+
+class TranscriptCacheEntry(models.Model):
+    content_hash = models.CharField(max_length=64, help_text="SHA-256 of the uploaded media")
+    model = models.CharField(max_length=100)
+    response_format = models.CharField(max_length=20)
+    transcript = models.TextField(blank=True)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name_plural = "Transcript cache entries"
+        unique_together = ["content_hash", "model", "response_format"]
+
+    def __str__(self):
+        return f"Transcript {self.content_hash[:12]} ({self.model})"
+
+
+class ScoringCacheEntry(models.Model):
+    fingerprint = models.CharField(max_length=64, unique=True, help_text="SHA-256 of the rendered scoring request")
+    model = models.CharField(max_length=100)
+    prompt_version = models.CharField(max_length=20)
+    result = models.JSONField(default=dict)
+    hit_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    last_used_at = models.DateTimeField(default=timezone.now, db_index=True)
+
+    class Meta:
+        verbose_name_plural = "Scoring cache entries"
+
+    def __str__(self):
+        return f"Score {self.fingerprint[:12]} ({self.model}, v{self.prompt_version})"
+
+
+class ChunkedUpload(models.Model):
+    """A video being uploaded in chunks; bytes accumulate in a part file on disk until finalized."""
+
+    TARGET_CHOICES = [
+        ("mock", "Mock Response"),
+        ("interview", "Interview Response"),
+    ]
+    STATUS_CHOICES = [
+        ("uploading", "Uploading"),
+        ("complete", "Complete"),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="chunked_uploads"
+    )
+    target = models.CharField(max_length=20, choices=TARGET_CHOICES)
+    mock_session = models.ForeignKey(
+        MockSession, on_delete=models.CASCADE, null=True, blank=True, related_name="chunked_uploads"
+    )
+    candidate_session = models.ForeignKey(
+        CandidateSession, on_delete=models.CASCADE, null=True, blank=True, related_name="chunked_uploads"
+    )
+    question = models.ForeignKey(
+        "questions.Question", on_delete=models.CASCADE, related_name="chunked_uploads"
+    )
+    filename = models.CharField(max_length=255)
+    size = models.BigIntegerField(help_text="Declared total size in bytes")
+    offset = models.BigIntegerField(default=0, help_text="Bytes received so far")
+    duration = models.IntegerField(default=0, help_text="Recording duration in seconds")
+    emotion_data = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="uploading")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"ChunkedUpload: {self.filename} ({self.offset}/{self.size}, {self.status})"
+
+
+class MediaBlob(models.Model):
+    """A file in ContentAddressedStorage and how many FileFields point at it."""
+
+    name = models.CharField(max_length=255, unique=True, help_text="Storage name, blobs/ab/cd/<sha256><ext>")
+    content_hash = models.CharField(max_length=64, db_index=True)
+    size = models.BigIntegerField(default=0)
+    ref_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["ref_count", "updated_at"])]
+
+    def __str__(self):
+        return f"MediaBlob: {self.name} ({self.ref_count} refs)"
@@ -0,0 +1,15 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class CreatedCursorPagination(CursorPagination):
+    """Newest first, keyed on ``created_at`` with ``id`` breaking ties.
+
+    Cursor pages stay stable while rows are added and cost the same however
+    deep the client pages, unlike offset pagination.
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size = settings.LIST_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.LIST_MAX_PAGE_SIZE
@@ -0,0 +1,258 @@
+"""Header-only inspection of uploaded recordings.
+
+Reads the container structure of WebM/Matroska and MP4/QuickTime files
+without decoding anything, to reject files that are not recordings before
+they are stored or sent for transcription, and to take the duration from the
+file rather than from the client.
+"""
+import struct
+from typing import NamedTuple, Optional
+
+from .media import SNIFF_BYTES, sniff_container
+
+# Bytes read from the start of a WebM file for its Info and Tracks elements.
+HEADER_BYTES = 64 * 1024
+# Bytes read from the end of a WebM file to find the last cluster when the
+# header has no duration (MediaRecorder writes none).
+TAIL_BYTES = 256 * 1024
+# Largest MP4 ``moov`` box read; it holds only sample tables, so this is generous.
+MAX_MOOV_BYTES = 16 * 1024 * 1024
+
+UNSUPPORTED_FORMAT = "Upload is not a supported video format (expected WebM or MP4)."
+
+# Containers probe_media() can check; anything else is rejected.
+SUPPORTED_CONTAINERS = ("webm", "matroska", "mp4", "quicktime")
+
+
+class InvalidMedia(ValueError):
+    """The upload is not a recording we can store and transcribe."""
+
+
+class MediaInfo(NamedTuple):
+    container: str
+    duration: Optional[float]  # seconds; None when the header does not say
+    has_audio: bool
+
+
+def probe_media(file) -> MediaInfo:
+    """Inspect an open binary file. Raises InvalidMedia for anything that is not a usable recording."""
+    file.seek(0)
+    header = file.read(HEADER_BYTES)
+    container = sniff_container(header[:SNIFF_BYTES])
+    try:
+        if container in ("webm", "matroska"):
+            info = _probe_matroska(file, header, container)
+        elif container in ("mp4", "quicktime"):
+            info = _probe_mp4(file, container)
+        else:
+            raise InvalidMedia(UNSUPPORTED_FORMAT)
+    except (struct.error, IndexError):
+        raise InvalidMedia(f"Upload is not a valid {container} file.")
+    finally:
+        file.seek(0)
+
+    if not info.has_audio:
+        raise InvalidMedia("Recording has no audio track.")
+    return info
+
+
+# --- Matroska / WebM ---------------------------------------------------------
+
+_SEGMENT = 0x18538067
+_INFO = 0x1549A966
+_TIMECODE_SCALE = 0x2AD7B1
+_DURATION = 0x4489
+_TRACKS = 0x1654AE6B
+_TRACK_ENTRY = 0xAE
+_TRACK_TYPE = 0x83
+_CLUSTER = 0x1F43B675
+_CLUSTER_TIMECODE = 0xE7
+_SIMPLE_BLOCK = 0xA3
+_BLOCK_GROUP = 0xA0
+_BLOCK = 0xA1
+_AUDIO_TRACK = 2
+_UNKNOWN_SIZE = -1
+
+
+def _read_vint(data: bytes, pos: int, keep_marker: bool = False):
+    """Decode an EBML variable-length integer at ``pos``. Returns ``(value, next_pos)``."""
+    first = data[pos]
+    length = 1
+    while length <= 8 and not first & (0x80 >> (length - 1)):
+        length += 1
+    if length > 8:
+        raise InvalidMedia("Corrupt EBML header.")
+    value = first if keep_marker else first & (0xFF >> length)
+    for byte in data[pos + 1:pos + length]:
+        value = (value << 8) | byte
+    if len(data) < pos + length:
+        raise IndexError(pos)
+    if not keep_marker and value == (1 << (7 * length)) - 1:
+        value = _UNKNOWN_SIZE
+    return value, pos + length
+
+
+def _elements(data: bytes, start: int, end: int):
+    """Yield ``(id, data_start, data_end)`` for the elements in ``data[start:end]``.
+
+    Elements of unknown size (live-streamed segments and clusters) extend to ``end``.
+    """
+    pos = start
+    while pos < end:
+        try:
+            element_id, pos = _read_vint(data, pos, keep_marker=True)
+            size, pos = _read_vint(data, pos)
+        except IndexError:
+            # Cut off by the end of what was read.
+            return
+        data_end = end if size == _UNKNOWN_SIZE else min(pos + size, end)
+        yield element_id, pos, data_end
+        pos = data_end
+
+
+def _uint(data: bytes) -> int:
+    return int.from_bytes(data, "big")
+
+
+def _probe_matroska(file, header: bytes, container: str) -> MediaInfo:
+    segment = next((e for e in _elements(header, 0, len(header)) if e[0] == _SEGMENT), None)
+    if segment is None:
+        raise InvalidMedia(f"Upload is not a valid {container} file.")
+
+    scale, duration, track_types = 1_000_000, None, None
+    for element_id, start, end in _elements(header, segment[1], segment[2]):
+        if element_id == _INFO:
+            for child_id, child_start, child_end in _elements(header, start, end):
+                if child_id == _TIMECODE_SCALE:
+                    scale = _uint(header[child_start:child_end])
+                elif child_id == _DURATION:
+                    fmt = ">f" if child_end - child_start == 4 else ">d"
+                    duration = struct.unpack(fmt, header[child_start:child_end])[0]
+        elif element_id == _TRACKS:
+            track_types = [
+                _uint(header[type_start:type_end])
+                for entry_id, entry_start, entry_end in _elements(header, start, end) if entry_id == _TRACK_ENTRY
+                for type_id, type_start, type_end in _elements(header, entry_start, entry_end) if type_id == _TRACK_TYPE
+            ]
+        elif element_id == _CLUSTER:
+            break
+
+    if not track_types:
+        raise InvalidMedia("Recording has no tracks.")
+    if duration is not None:
+        seconds = duration * scale / 1e9
+    else:
+        last = _last_block_timecode(file)
+        seconds = None if last is None else last * scale / 1e9
+    return MediaInfo(container, seconds, _AUDIO_TRACK in track_types)
+
+
+def _last_block_timecode(file) -> Optional[int]:
+    """Timecode of the last block in the file, from the final cluster found in its tail."""
+    file.seek(0, 2)
+    size = file.tell()
+    file.seek(max(0, size - TAIL_BYTES))
+    tail = file.read(TAIL_BYTES)
+    marker = _CLUSTER.to_bytes(4, "big")
+    pos = tail.rfind(marker)
+    while pos != -1:
+        latest = _cluster_end_timecode(tail, pos)
+        if latest is not None:
+            return latest
+        # A match inside frame data rather than a real cluster; try the one before.
+        pos = tail.rfind(marker, 0, pos)
+    return None
+
+
+def _cluster_end_timecode(data: bytes, pos: int) -> Optional[int]:
+    try:
+        _, start = _read_vint(data, pos, keep_marker=True)
+        _, start = _read_vint(data, start)
+        cluster_timecode, latest = None, None
+        for element_id, block_start, block_end in _elements(data, start, len(data)):
+            if element_id == _CLUSTER_TIMECODE:
+                cluster_timecode = _uint(data[block_start:block_end])
+            elif element_id in (_SIMPLE_BLOCK, _BLOCK_GROUP) and cluster_timecode is not None:
+                if element_id == _BLOCK_GROUP:
+                    block = next((e for e in _elements(data, block_start, block_end) if e[0] == _BLOCK), None)
+                    if block is None:
+                        continue
+                    block_start = block[1]
+                _, offset = _read_vint(data, block_start)  # track number
+                relative = struct.unpack(">h", data[offset:offset + 2])[0]
+                latest = max(latest or 0, cluster_timecode + relative)
+            elif element_id == _CLUSTER:
+                break
+        return latest if latest is not None else cluster_timecode
+    except (InvalidMedia, IndexError, struct.error):
+        return None
+
+
+# --- MP4 / QuickTime ---------------------------------------------------------
+
+
+def _boxes(data: bytes, start: int, end: int):
+    """Yield ``(type, data_start, data_end)`` for the ISO BMFF boxes in ``data[start:end]``."""
+    pos = start
+    while pos + 8 <= end:
+        size, box_type = struct.unpack(">I4s", data[pos:pos + 8])
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", data[pos + 8:pos + 16])[0]
+            header = 16
+        elif size == 0:
+            size = end - pos
+        if size < header:
+            raise InvalidMedia("Corrupt MP4 box.")
+        yield box_type, pos + header, min(pos + size, end)
+        pos += size
+
+
+def _find_moov(file) -> bytes:
+    """Walk the top-level boxes by their headers alone and return the ``moov`` payload."""
+    file.seek(0, 2)
+    size = file.tell()
+    pos = 0
+    while pos + 8 <= size:
+        file.seek(pos)
+        head = file.read(16)
+        box_size, box_type = struct.unpack(">I4s", head[:8])
+        header = 8
+        if box_size == 1:
+            box_size, header = struct.unpack(">Q", head[8:16])[0], 16
+        elif box_size == 0:
+            box_size = size - pos
+        if box_size < header:
+            raise InvalidMedia("Corrupt MP4 box.")
+        if box_type == b"moov":
+            if box_size > MAX_MOOV_BYTES:
+                raise InvalidMedia("MP4 header is too large.")
+            file.seek(pos + header)
+            return file.read(box_size - header)
+        pos += box_size
+    raise InvalidMedia("Recording is incomplete (no MP4 header found).")
+
+
+def _probe_mp4(file, container: str) -> MediaInfo:
+    moov = _find_moov(file)
+    duration, handlers = None, []
+    for box_type, start, end in _boxes(moov, 0, len(moov)):
+        if box_type == b"mvhd":
+            if moov[start] == 1:
+                timescale, length = struct.unpack(">IQ", moov[start + 20:start + 32])
+            else:
+                timescale, length = struct.unpack(">II", moov[start + 12:start + 20])
+            # Fragmented files leave the movie duration at 0.
+            if timescale and length:
+                duration = length / timescale
+        elif box_type == b"trak":
+            for mdia_type, mdia_start, mdia_end in _boxes(moov, start, end):
+                if mdia_type != b"mdia":
+                    continue
+                for hdlr_type, hdlr_start, _ in _boxes(moov, mdia_start, mdia_end):
+                    if hdlr_type == b"hdlr":
+                        handlers.append(moov[hdlr_start + 8:hdlr_start + 12])
+
+    if not handlers:
+        raise InvalidMedia("Recording has no tracks.")
+    return MediaInfo(container, duration, b"soun" in handlers)
@@ -1,11 +1,45 @@
+from django.conf import settings
 from rest_framework import serializers
-from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse
+from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse, AnalysisJob, ChunkedUpload
+from .emotions import timeline_payload
+from .probe import InvalidMedia, probe_media
+from .video_serving import video_url
 from questions.serializers import QuestionSerializer
 from accounts.serializers import UserSerializer
 
 
+def sparse_fieldset(request):
+    """``(only, omit)`` field names from ``?fields=a,b`` and ``?omit=c``; ``only`` is None when not given."""
+    def names(param):
+        return {name.strip() for name in request.query_params.get(param, "").split(",") if name.strip()}
+
+    return (names("fields") or None), names("omit")
+
+
+def field_requested(request, name: str) -> bool:
+    only, omit = sparse_fieldset(request)
+    return name not in omit and (only is None or name in only)
+
+
+class SparseFieldsetMixin:
+    """Let clients trim top-level fields with ``?fields=`` / ``?omit=``, e.g. to skip nested blobs.
+
+    Only applies to the outermost serializer (or each item of an outermost
+    list) when the request is in the context; unknown names are ignored.
+    """
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get("request")
+        parent = self.parent.parent if isinstance(self.parent, serializers.ListSerializer) else self.parent
+        if request is None or parent is not None:
+            return fields
+        return {name: field for name, field in fields.items() if field_requested(request, name)}
+
+
 class QuestionResponseSerializer(serializers.ModelSerializer):
     question_detail = QuestionSerializer(source="question", read_only=True)
+    video_file = serializers.SerializerMethodField()
 
     class Meta:
         model = QuestionResponse
@@ -16,11 +50,15 @@ class QuestionResponseSerializer(serializers.ModelSerializer):
         )
         read_only_fields = ("id", "transcript", "ai_score", "ai_feedback", "confidence_score", "created_at")
 
+    def get_video_file(self, obj):
+        return video_url("interview", obj.id) if obj.video_file else None
 
-class CandidateSessionListSerializer(serializers.ModelSerializer):
+
+class CandidateSessionListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     candidate = UserSerializer(read_only=True)
     interview_title = serializers.CharField(source="interview.title", read_only=True)
-    response_count = serializers.IntegerField(source="responses.count", read_only=True)
+    # Annotated by the view's queryset.
+    response_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = CandidateSession
@@ -30,7 +68,7 @@ class CandidateSessionListSerializer(serializers.ModelSerializer):
         )
 
 
-class CandidateSessionDetailSerializer(serializers.ModelSerializer):
+class CandidateSessionDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     candidate = UserSerializer(read_only=True)
     interview_title = serializers.CharField(source="interview.title", read_only=True)
     responses = QuestionResponseSerializer(many=True, read_only=True)
@@ -43,10 +81,11 @@ class CandidateSessionDetailSerializer(serializers.ModelSerializer):
         )
 
 
-class InterviewListSerializer(serializers.ModelSerializer):
+class InterviewListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     recruiter = UserSerializer(read_only=True)
-    question_count = serializers.IntegerField(source="questions.count", read_only=True)
-    session_count = serializers.IntegerField(source="sessions.count", read_only=True)
+    # Annotated by the view's queryset.
+    question_count = serializers.IntegerField(read_only=True)
+    session_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Interview
@@ -56,7 +95,7 @@ class InterviewListSerializer(serializers.ModelSerializer):
         )
 
 
-class InterviewDetailSerializer(serializers.ModelSerializer):
+class InterviewDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     recruiter = UserSerializer(read_only=True)
     questions_detail = QuestionSerializer(source="questions", many=True, read_only=True)
     sessions = CandidateSessionListSerializer(many=True, read_only=True)
@@ -84,33 +123,65 @@ class InterviewCreateSerializer(serializers.ModelSerializer):
         return interview
 
 
+def _validate_recording(attrs):
+    """Reject uploads that are not recordings, and take the duration from the file when it records one."""
+    try:
+        info = probe_media(attrs["video"])
+    except InvalidMedia as e:
+        raise serializers.ValidationError({"video": str(e)})
+    if info.duration is not None:
+        attrs["duration"] = round(info.duration)
+    return attrs
+
+
 class VideoUploadSerializer(serializers.Serializer):
     session_id = serializers.UUIDField()
     question_id = serializers.UUIDField()
     video = serializers.FileField()
     duration = serializers.IntegerField(required=False, default=0)
 
+    def validate(self, attrs):
+        return _validate_recording(attrs)
+
 
 class MockResponseSerializer(serializers.ModelSerializer):
     question_detail = QuestionSerializer(source="question", read_only=True)
+    video_file = serializers.SerializerMethodField()
+    emotion_timeline = serializers.SerializerMethodField()
 
     class Meta:
         model = MockResponse
         fields = (
             "id", "session", "question", "question_detail", "question_order",
             "video_file", "transcript", "ai_score", "ai_feedback",
-            "confidence_score", "emotion_data", "duration", "analysis_status",
+            "communication_score", "relevance_score", "structure_score", "strengths", "improvements",
+            "confidence_score", "emotion_data", "emotion_timeline", "duration", "analysis_status",
             "created_at",
         )
         read_only_fields = (
             "id", "transcript", "ai_score", "ai_feedback",
+            "communication_score", "relevance_score", "structure_score", "strengths", "improvements",
             "confidence_score", "analysis_status", "created_at",
         )
 
+    def get_fields(self):
+        # The per-frame timeline is opt-in; pass ``include_timeline`` in the context to send it.
+        fields = super().get_fields()
+        if not self.context.get("include_timeline"):
+            fields.pop("emotion_timeline")
+        return fields
+
+    def get_video_file(self, obj):
+        return video_url("mock", obj.id) if obj.video_file else None
 
-class MockSessionListSerializer(serializers.ModelSerializer):
+    def get_emotion_timeline(self, obj):
+        return timeline_payload(obj.emotion_timeline, self.context.get("timeline_points", 0))
+
+
+class MockSessionListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     candidate = UserSerializer(read_only=True)
-    response_count = serializers.IntegerField(source="responses.count", read_only=True)
+    # Annotated by the view's queryset.
+    response_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = MockSession
@@ -120,7 +191,7 @@ class MockSessionListSerializer(serializers.ModelSerializer):
         )
 
 
-class MockSessionDetailSerializer(serializers.ModelSerializer):
+class MockSessionDetailSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     candidate = UserSerializer(read_only=True)
     responses = MockResponseSerializer(many=True, read_only=True)
 
@@ -136,6 +207,7 @@ class MockSessionDetailSerializer(serializers.ModelSerializer):
 class MockSessionCreateSerializer(serializers.Serializer):
     session_type = serializers.ChoiceField(choices=["behavioral", "technical", "mixed"], default="behavioral")
     question_count = serializers.IntegerField(min_value=3, max_value=10, default=5)
+    balance_difficulty = serializers.BooleanField(default=False)
 
 
 class MockVideoUploadSerializer(serializers.Serializer):
@@ -144,3 +216,46 @@ class MockVideoUploadSerializer(serializers.Serializer):
     video = serializers.FileField()
     duration = serializers.IntegerField(required=False, default=0)
     emotion_data = serializers.JSONField(required=False, default=dict)
+
+    def validate(self, attrs):
+        return _validate_recording(attrs)
+
+
+class AnalysisJobSerializer(serializers.ModelSerializer):
+    job_id = serializers.UUIDField(source="id", read_only=True)
+
+    class Meta:
+        model = AnalysisJob
+        fields = (
+            "job_id", "kind", "mock_session", "mock_response", "status", "attempts", "max_attempts",
+            "last_error", "created_at", "started_at", "finished_at",
+        )
+
+
+class ChunkedUploadCreateSerializer(serializers.Serializer):
+    target = serializers.ChoiceField(choices=["mock", "interview"], default="mock")
+    session_id = serializers.UUIDField()
+    question_id = serializers.UUIDField()
+    filename = serializers.CharField(max_length=255, required=False, default="recording.webm")
+    size = serializers.IntegerField(min_value=1)
+    duration = serializers.IntegerField(required=False, default=0)
+    emotion_data = serializers.JSONField(required=False, default=dict)
+
+    def validate_size(self, value):
+        if value > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Uploads are limited to {settings.CHUNKED_UPLOAD_MAX_SIZE} bytes."
+            )
+        return value
+
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    upload_id = serializers.UUIDField(source="id", read_only=True)
+    chunk_size = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ChunkedUpload
+        fields = ("upload_id", "target", "filename", "size", "offset", "chunk_size", "status", "created_at")
+
+    def get_chunk_size(self, obj):
+        return settings.CHUNKED_UPLOAD_CHUNK_SIZE
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import MockResponse, QuestionResponse
+from .storage import release_blob
+
+
+@receiver(post_delete, sender=MockResponse)
+@receiver(post_delete, sender=QuestionResponse)
+def release_response_video(sender, instance, **kwargs):
+    if instance.video_file:
+        release_blob(instance.video_file.name)
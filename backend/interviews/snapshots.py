@@ -0,0 +1,78 @@
+"""Precomputed results of analyzed mock sessions.
+
+An analyzed session does not change until it is analyzed again, but its
+detail response nests every answer, its question and its emotion summary.
+When analysis finishes that response is rendered once and stored gzipped in
+``MockSessionSnapshot``; plain detail and results requests are then answered
+from the stored bytes with a strong ETag, or ``304 Not Modified``.
+
+Video URLs carry expiring tokens, so the snapshot stores a placeholder per
+video and fresh URLs are substituted when it is served. URLs only change
+once per ``video_serving.url_window()``, which is part of the ETag.
+"""
+import gzip
+import hashlib
+import json
+import re
+
+from django.db.models import Prefetch
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from rest_framework.renderers import JSONRenderer
+
+from .models import MockResponse, MockSession, MockSessionSnapshot
+from .serializers import MockSessionDetailSerializer
+from .video_serving import url_window, video_url
+
+# Query parameters that change the detail response; requests with any of them skip the snapshot.
+VARIANT_PARAMS = ("include", "timeline_points", "fields", "omit")
+
+_VIDEO_PLACEHOLDER = "@video:"
+_VIDEO_PLACEHOLDER_RE = re.compile(rb'"@video:([0-9a-f-]{36})"')
+
+
+def snapshot_applies(request) -> bool:
+    return not any(param in request.query_params for param in VARIANT_PARAMS)
+
+
+def write_snapshot(session_id, session=None) -> MockSessionSnapshot:
+    """Render and store the results of an analyzed session, replacing any earlier snapshot.
+
+    Pass ``session`` when it is already loaded with its candidate and answers.
+    """
+    if session is None:
+        responses = MockResponse.objects.select_related("question__category").defer("emotion_timeline")
+        session = MockSession.objects.select_related("candidate").prefetch_related(
+            Prefetch("responses", queryset=responses)
+        ).get(id=session_id)
+
+    data = MockSessionDetailSerializer(session).data
+    for response in data["responses"]:
+        if response["video_file"]:
+            response["video_file"] = f"{_VIDEO_PLACEHOLDER}{response['id']}"
+    body = JSONRenderer().render(data)
+
+    snapshot, _ = MockSessionSnapshot.objects.update_or_create(
+        session_id=session_id,
+        defaults={"body": gzip.compress(body), "digest": hashlib.sha256(body).hexdigest()},
+    )
+    return snapshot
+
+
+def discard_snapshot(session_id) -> None:
+    MockSessionSnapshot.objects.filter(session_id=session_id).delete()
+
+
+def _sign_videos(match) -> bytes:
+    return json.dumps(video_url("mock", match[1].decode())).encode()
+
+
+def snapshot_response(request, snapshot: MockSessionSnapshot) -> HttpResponse:
+    etag = f'"{snapshot.digest[:32]}-{url_window():x}"'
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        body = _VIDEO_PLACEHOLDER_RE.sub(_sign_videos, gzip.decompress(snapshot.body))
+        response = HttpResponse(body, content_type="application/json")
+    response["ETag"] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
@@ -0,0 +1,169 @@
+import hashlib
+import logging
+import os
+import tempfile
+import uuid
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.move import file_move_safe
+from django.core.files.storage import FileSystemStorage
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "blobs"
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """Stores each file once, under ``blobs/ab/cd/<sha256><ext>``.
+
+    Saving content that is already stored writes nothing and only adds a
+    reference to its MediaBlob row. Uploads from HashingFileUploadHandler and
+    chunked uploads carry a precomputed ``content_hash``; anything else is
+    hashed while it is written. The ``upload_to`` directory of the field is
+    ignored.
+    """
+
+    def blob_name(self, content_hash: str, original_name: str) -> str:
+        ext = os.path.splitext(original_name)[1].lower()
+        return f"{BLOB_PREFIX}/{content_hash[:2]}/{content_hash[2:4]}/{content_hash}{ext}"
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+
+        content_hash = getattr(content, "content_hash", "")
+        staged_path = None
+        if not content_hash:
+            if hasattr(content, "temporary_file_path"):
+                content_hash = _hash_path(content.temporary_file_path())
+            else:
+                staged_path, content_hash = self._stage(content)
+
+        blob = self.blob_name(content_hash, name)
+        created = retain_blob(blob, content_hash, content.size)
+        if created or not self.exists(blob):
+            self._write_blob(blob, content, staged_path)
+        elif staged_path:
+            os.remove(staged_path)
+        return blob
+
+    def _stage(self, content):
+        """Copy ``content`` into a temp file next to the blobs, hashing it on the way."""
+        directory = self.path(BLOB_PREFIX)
+        os.makedirs(directory, exist_ok=True)
+        digest = hashlib.sha256()
+        fd, staged_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            for chunk in content.chunks():
+                digest.update(chunk)
+                f.write(chunk)
+        return staged_path, digest.hexdigest()
+
+    def _write_blob(self, blob: str, content, staged_path=None) -> None:
+        full_path = self.path(blob)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        # Writers racing on the same blob have identical bytes, so whoever
+        # renames last wins harmlessly.
+        if staged_path:
+            os.replace(staged_path, full_path)
+        elif hasattr(content, "temporary_file_path"):
+            file_move_safe(content.temporary_file_path(), full_path, allow_overwrite=True)
+        else:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(full_path), suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                for chunk in content.chunks():
+                    f.write(chunk)
+            os.replace(tmp_path, full_path)
+        if self.file_permissions_mode is not None:
+            os.chmod(full_path, self.file_permissions_mode)
+
+
+def _hash_path(path: str) -> str:
+    from .ai_cache import hash_file
+
+    return hash_file(path)
+
+
+def is_blob(name: str) -> bool:
+    return bool(name) and name.startswith(BLOB_PREFIX + "/")
+
+
+def retain_blob(name: str, content_hash: str, size: int) -> bool:
+    """Add a reference to a blob, creating its row if needed. Returns whether it was created."""
+    from .models import MediaBlob
+
+    if MediaBlob.objects.filter(name=name).update(ref_count=F("ref_count") + 1, updated_at=timezone.now()):
+        return False
+    try:
+        with transaction.atomic():
+            MediaBlob.objects.create(name=name, content_hash=content_hash, size=size, ref_count=1)
+        return True
+    except IntegrityError:
+        MediaBlob.objects.filter(name=name).update(ref_count=F("ref_count") + 1, updated_at=timezone.now())
+        return False
+
+
+def release_blob(name: str) -> None:
+    """Drop a reference to a blob. Unreferenced blobs are removed by purge_unreferenced_blobs()."""
+    from .models import MediaBlob
+
+    if not is_blob(name):
+        return
+    MediaBlob.objects.filter(name=name, ref_count__gt=0).update(
+        ref_count=F("ref_count") - 1, updated_at=timezone.now()
+    )
+
+
+def purge_unreferenced_blobs(storage, grace_seconds: int, dry_run: bool = False):
+    """Delete blobs that have had no references for ``grace_seconds``. Returns ``(count, bytes)``.
+
+    The grace period keeps a blob whose last reference was just dropped
+    available to an identical upload that is about to reference it again.
+    An upload of the same content can still race with the purge, so the file
+    is moved aside before its row is deleted: if the row turns out to be
+    referenced again the file is moved back, and otherwise only the moved
+    copy is removed, never a file the upload has just written under the name.
+    """
+    from .models import MediaBlob
+
+    cutoff = timezone.now() - timedelta(seconds=grace_seconds)
+    count = freed = 0
+    for blob_id, name, size in MediaBlob.objects.filter(ref_count=0, updated_at__lt=cutoff).values_list(
+        "id", "name", "size"
+    ).iterator():
+        if dry_run:
+            count, freed = count + 1, freed + size
+            continue
+        tombstone = _move_aside(storage.path(name))
+        # Conditional delete: a concurrent upload may have re-referenced it.
+        deleted, _ = MediaBlob.objects.filter(id=blob_id, ref_count=0).delete()
+        if not deleted:
+            if tombstone:
+                # Any copy the upload wrote meanwhile has the same bytes.
+                os.replace(tombstone, storage.path(name))
+            continue
+        if tombstone:
+            os.remove(tombstone)
+        count, freed = count + 1, freed + size
+    if count:
+        logger.info(f"Purged {count} unreferenced media blobs ({freed} bytes)")
+    return count, freed
+
+
+def _move_aside(path: str):
+    """Rename ``path`` to a unique tombstone next to it. Returns the tombstone, or None if there was no file."""
+    tombstone = f"{path}.{uuid.uuid4().hex}.purging"
+    try:
+        os.rename(path, tombstone)
+    except FileNotFoundError:
+        return None
+    return tombstone
+
+
+content_addressed_storage = ContentAddressedStorage()
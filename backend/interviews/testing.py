@@ -0,0 +1,62 @@
+"""Query-count assertions for list and detail endpoints.
+
+An endpoint whose serializer reads a relation per row issues one more query
+for every row it returns. These helpers measure the query count of a request
+at two result sizes and fail if it grew, so an N+1 shows up as soon as it is
+written rather than when a heavy account hits it. ``QueryBudgetTests`` in
+``interviews.tests`` runs them over the API.
+"""
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.test.utils import CaptureQueriesContext
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def _describe(queries) -> str:
+    return "\n".join(f"  {i}. {query['sql']}" for i, query in enumerate(queries, 1))
+
+
+@contextmanager
+def query_budget(max_queries: int, using: str = DEFAULT_DB_ALIAS):
+    """Fail if the block runs more than ``max_queries`` queries."""
+    with CaptureQueriesContext(connections[using]) as context:
+        yield context
+    if len(context) > max_queries:
+        raise QueryBudgetExceeded(
+            f"{len(context)} queries run, budget is {max_queries}:\n{_describe(context.captured_queries)}"
+        )
+
+
+def count_queries(func, using: str = DEFAULT_DB_ALIAS):
+    """Run ``func()`` and return ``(result, captured queries)``."""
+    with CaptureQueriesContext(connections[using]) as context:
+        result = func()
+    return result, context.captured_queries
+
+
+def assert_queries_constant(fetch, grow, sizes=(2, 8), using: str = DEFAULT_DB_ALIAS) -> int:
+    """Fail if ``fetch()`` runs more queries once ``grow(n)`` has added more rows.
+
+    ``grow(n)`` must leave ``n`` rows for ``fetch`` to return (it is called
+    with increasing sizes, so it can add the difference). ``fetch`` is called
+    once per size, after a warm-up call that absorbs one-off queries such as
+    loading content types. Returns the query count.
+    """
+    counts = []
+    for size in sizes:
+        grow(size)
+        fetch()
+        _, queries = count_queries(fetch, using)
+        counts.append((size, queries))
+
+    (first_size, first), (last_size, last) = counts[0], counts[-1]
+    if len(last) != len(first):
+        raise QueryBudgetExceeded(
+            f"Query count grows with result size: {len(first)} queries for {first_size} rows, "
+            f"{len(last)} for {last_size} rows. Queries at {last_size} rows:\n{_describe(last)}"
+        )
+    return len(first)
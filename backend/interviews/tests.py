@@ -1,3 +1,989 @@
-from django.test import TestCase
+import io
+import itertools
+import json
+import os
+import shutil
+import struct
+import tempfile
+import time
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from questions.models import Question, QuestionCategory
+
+from . import ai_cache, ai_pipeline, storage
+from .compaction import compact_recording
+from .emotions import (
+    EMOTIONS, analyze_emotions, averages_confidence, confidence_scorer, pack_timeline, split_emotion_data,
+    timeline_payload, unpack_timeline,
+)
+from .groq_client import ProviderUnavailable, call_with_retries, reset_groq_client
+from .jobs import claim_next_job, enqueue_analysis, run_job
+from .models import (
+    AnalysisJob, CandidateSession, ChunkedUpload, Interview, MediaBlob, MockResponse, MockSession,
+    MockSessionSnapshot, QuestionResponse, ScoringCacheEntry, TranscriptCacheEntry,
+)
+from .probe import UNSUPPORTED_FORMAT, InvalidMedia, probe_media
+from .snapshots import write_snapshot
+from .testing import assert_queries_constant
+from .uploads import write_chunk
+from .video_serving import parse_range
+
+NO_CACHE = {"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+
+_serial = itertools.count()
+
+
+def make_user(role="candidate"):
+    n = next(_serial)
+    return User.objects.create_user(
+        email=f"user{n}@example.com", username=f"user{n}", password="unused-password", role=role
+    )
+
+
+def make_question(category):
+    return Question.objects.create(category=category, text=f"Question {next(_serial)}")
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+# Without a cache, so cached endpoints are measured building their responses.
+@override_settings(CACHES=NO_CACHE)
+class QueryBudgetTests(TestCase):
+    """List and detail endpoints run the same number of queries however many rows they return."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = QuestionCategory.objects.create(name="Budget")
+        cls.recruiter = make_user("recruiter")
+        cls.candidate = make_user()
+        cls.timeline = pack_timeline([{"time": t, "emotions": {"neutral": 1.0}} for t in range(30)])
+
+    def setUp(self):
+        self.as_recruiter = client_for(self.recruiter)
+        self.as_candidate = client_for(self.candidate)
+
+    def assertConstantQueries(self, client, url, queryset, make):
+        def fetch():
+            response = client.get(url)
+            self.assertEqual(response.status_code, 200, f"GET {url}")
+
+        def grow(n):
+            for _ in range(n - queryset.count()):
+                make()
+
+        assert_queries_constant(fetch, grow)
+
+    def _question(self):
+        return make_question(self.category)
+
+    def _interview(self):
+        interview = Interview.objects.create(title="Budget interview", recruiter=self.recruiter, status="active")
+        interview.questions.add(self._question(), self._question())
+        CandidateSession.objects.create(interview=interview, candidate=make_user())
+        return interview
+
+    def _candidate_session(self):
+        session = CandidateSession.objects.create(interview=self._interview(), candidate=self.candidate)
+        QuestionResponse.objects.create(session=session, question=self._question())
+        return session
+
+    def _mock_answer(self, session, **fields):
+        return MockResponse.objects.create(
+            session=session, question=self._question(), question_order=session.responses.count(),
+            emotion_data={"averages": {"neutral": 1.0}}, emotion_timeline=self.timeline, **fields,
+        )
+
+    def _mock_session(self):
+        session = MockSession.objects.create(candidate=self.candidate, question_count=1)
+        self._mock_answer(session)
+        return session
+
+    def test_interview_list(self):
+        self.assertConstantQueries(
+            self.as_recruiter, "/api/interviews/", Interview.objects.filter(recruiter=self.recruiter), self._interview
+        )
+
+    def test_interview_detail_sessions(self):
+        interview = self._interview()
+        self.assertConstantQueries(
+            self.as_recruiter, f"/api/interviews/{interview.id}/", interview.sessions.all(),
+            lambda: CandidateSession.objects.create(interview=interview, candidate=make_user()),
+        )
+
+    def test_interview_detail_questions(self):
+        interview = self._interview()
+        self.assertConstantQueries(
+            self.as_recruiter, f"/api/interviews/{interview.id}/", interview.questions.all(),
+            lambda: interview.questions.add(self._question()),
+        )
+
+    def test_candidate_session_list(self):
+        for role, client, queryset in (
+            ("recruiter", self.as_recruiter, CandidateSession.objects.filter(interview__recruiter=self.recruiter)),
+            ("candidate", self.as_candidate, CandidateSession.objects.filter(candidate=self.candidate)),
+        ):
+            with self.subTest(role=role):
+                self.assertConstantQueries(client, "/api/sessions/", queryset, self._candidate_session)
+
+    def test_candidate_session_detail(self):
+        session = self._candidate_session()
+        self.assertConstantQueries(
+            self.as_candidate, f"/api/sessions/{session.id}/", session.responses.all(),
+            lambda: QuestionResponse.objects.create(session=session, question=self._question()),
+        )
+
+    def test_mock_session_list(self):
+        self.assertConstantQueries(
+            self.as_candidate, "/api/mock/sessions/", MockSession.objects.filter(candidate=self.candidate),
+            self._mock_session,
+        )
+
+    def test_mock_session_detail_and_results(self):
+        for suffix in ("", "results/", "results/?include=timeline&timeline_points=10"):
+            with self.subTest(suffix=suffix):
+                session = MockSession.objects.create(candidate=self.candidate, question_count=1)
+                self.assertConstantQueries(
+                    self.as_candidate, f"/api/mock/sessions/{session.id}/{suffix}", session.responses.all(),
+                    lambda: self._mock_answer(session),
+                )
+
+    def test_mock_score_analytics(self):
+        def scored_answer():
+            session = MockSession.objects.create(candidate=self.candidate, question_count=1)
+            self._mock_answer(session, analysis_status="completed", ai_score=60, communication_score=70)
+
+        self.assertConstantQueries(
+            self.as_candidate, "/api/mock/analytics/scores/",
+            MockResponse.objects.filter(session__candidate=self.candidate).values("question").distinct(),
+            scored_answer,
+        )
+
+    def test_question_list(self):
+        self.assertConstantQueries(
+            self.as_candidate, "/api/questions/", Question.objects.filter(category=self.category), self._question
+        )
+
+    def test_question_category_list(self):
+        def category():
+            created = QuestionCategory.objects.create(name=f"Budget {next(_serial)}")
+            make_question(created)
+            make_question(created)
+
+        self.assertConstantQueries(
+            self.as_candidate, "/api/questions/categories/", QuestionCategory.objects.filter(name__startswith="Budget "),
+            category,
+        )
+
+
+class AnalysisJobQueueTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.candidate = make_user()
+
+    def _session(self):
+        return MockSession.objects.create(candidate=self.candidate, question_count=1, status="completed")
+
+    def _expire_lease(self, job):
+        AnalysisJob.objects.filter(id=job.id).update(
+            locked_at=timezone.now() - timedelta(seconds=settings.ANALYSIS_JOB_LEASE_SECONDS + 1)
+        )
+
+    def test_enqueue_reuses_the_job_in_flight(self):
+        session = self._session()
+        self.assertEqual(enqueue_analysis(session), enqueue_analysis(session))
+        self.assertEqual(AnalysisJob.objects.count(), 1)
+
+    def test_claimed_job_is_leased_to_one_worker(self):
+        job = enqueue_analysis(self._session())
+
+        claimed = claim_next_job("worker-a")
+        self.assertEqual(claimed.id, job.id)
+        self.assertEqual((claimed.status, claimed.locked_by, claimed.attempts), ("running", "worker-a", 1))
+        self.assertIsNone(claim_next_job("worker-b"))
+
+    def test_expired_lease_is_reclaimed(self):
+        job = enqueue_analysis(self._session())
+        claim_next_job("worker-a")
+        self._expire_lease(job)
+
+        reclaimed = claim_next_job("worker-b")
+        self.assertEqual(reclaimed.id, job.id)
+        self.assertEqual((reclaimed.locked_by, reclaimed.attempts), ("worker-b", 2))
+
+    def test_expired_final_attempt_fails_and_claiming_continues(self):
+        stale_session = self._session()
+        stale = enqueue_analysis(stale_session)
+        AnalysisJob.objects.filter(id=stale.id).update(
+            status="running", attempts=stale.max_attempts, locked_by="dead-worker", locked_at=timezone.now()
+        )
+        self._expire_lease(stale)
+        fresh = enqueue_analysis(self._session())
+        AnalysisJob.objects.filter(id=fresh.id).update(available_at=timezone.now() + timedelta(microseconds=1))
+
+        self.assertEqual(claim_next_job("worker-a").id, fresh.id)
+        stale.refresh_from_db()
+        stale_session.refresh_from_db()
+        self.assertEqual(stale.status, "failed")
+        self.assertEqual(stale_session.status, "failed")
+
+    def test_failed_attempt_is_requeued_with_backoff(self):
+        job = enqueue_analysis(self._session())
+        claimed = claim_next_job("worker-a")
+        with mock.patch("interviews.ai_pipeline.analyze_mock_session", side_effect=RuntimeError("boom")):
+            run_job(claimed, "worker-a")
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts, job.last_error, job.locked_by), ("queued", 1, "boom", ""))
+        self.assertGreater(job.available_at, timezone.now())
+        self.assertIsNone(claim_next_job("worker-a"))
+
+    def test_provider_outage_requeues_without_using_an_attempt(self):
+        job = enqueue_analysis(self._session())
+        claimed = claim_next_job("worker-a")
+        outage = ProviderUnavailable("rate limited", retry_after=120)
+        with mock.patch("interviews.ai_pipeline.analyze_mock_session", side_effect=outage):
+            run_job(claimed, "worker-a")
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), ("queued", 0))
+        self.assertGreater(job.available_at, timezone.now() + timedelta(seconds=100))
+
+    def test_last_failed_attempt_fails_the_session(self):
+        session = self._session()
+        job = enqueue_analysis(session)
+        AnalysisJob.objects.filter(id=job.id).update(attempts=job.max_attempts - 1)
+        claimed = claim_next_job("worker-a")
+        with mock.patch("interviews.ai_pipeline.analyze_mock_session", side_effect=RuntimeError("boom")):
+            run_job(claimed, "worker-a")
+
+        job.refresh_from_db()
+        session.refresh_from_db()
+        self.assertEqual(job.status, "failed")
+        self.assertEqual(session.status, "failed")
+        self.assertEqual(session.progress_version, 1)
+
+    def test_successful_job_is_finished(self):
+        job = enqueue_analysis(self._session())
+        with mock.patch("interviews.ai_pipeline.analyze_mock_session"):
+            run_job(claim_next_job("worker-a"), "worker-a")
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, "succeeded")
+        self.assertIsNotNone(job.finished_at)
+
+    def test_lease_is_renewed_while_the_job_runs(self):
+        enqueue_analysis(self._session())
+        claimed = claim_next_job("worker-a")
+        with override_settings(ANALYSIS_JOB_LEASE_SECONDS=0.03), \
+                mock.patch("interviews.jobs._renew_lease", return_value=True) as renew, \
+                mock.patch("interviews.ai_pipeline.analyze_mock_session", side_effect=lambda s: time.sleep(0.1)):
+            run_job(claimed, "worker-a")
+
+        self.assertGreater(renew.call_count, 1)
+        renew.assert_called_with(claimed, "worker-a")
+
+    def test_reclaimed_job_keeps_the_new_workers_outcome(self):
+        job = enqueue_analysis(self._session())
+        claimed = claim_next_job("worker-a")
+
+        def reclaimed_meanwhile(session):
+            self._expire_lease(job)
+            claim_next_job("worker-b")
+
+        with mock.patch("interviews.ai_pipeline.analyze_mock_session", side_effect=reclaimed_meanwhile):
+            run_job(claimed, "worker-a")
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by, job.attempts), ("running", "worker-b", 2))
+
+
+# The first chunk is checked for a video header before the rest is accepted.
+FIRST_CHUNK = (b"\x1a\x45\xdf\xa3\x42\x82\x84webm").ljust(100, b"\0")
+
+
+@override_settings(CHUNKED_UPLOAD_CHUNK_SIZE=100)
+class ChunkedUploadTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.candidate = make_user()
+        category = QuestionCategory.objects.create(name="Uploads")
+        cls.session = MockSession.objects.create(candidate=cls.candidate, question_count=1)
+        cls.answer = MockResponse.objects.create(session=cls.session, question=make_question(category))
+
+    def setUp(self):
+        part_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, part_dir, ignore_errors=True)
+        self.enterContext(override_settings(CHUNKED_UPLOAD_DIR=part_dir))
+        self.client = client_for(self.candidate)
+        response = self.client.post(
+            "/api/uploads/",
+            {"session_id": str(self.session.id), "question_id": str(self.answer.question_id), "size": 200},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.upload_id = response.data["upload_id"]
+
+    def put_chunk(self, offset, data):
+        return self.client.put(
+            f"/api/uploads/{self.upload_id}/", data, content_type="application/octet-stream",
+            HTTP_UPLOAD_OFFSET=str(offset),
+        )
+
+    def test_chunks_advance_the_offset(self):
+        self.assertEqual(self.put_chunk(0, FIRST_CHUNK).data["offset"], 100)
+        self.assertEqual(self.put_chunk(100, b"b" * 100).data["offset"], 200)
+        self.assertEqual(ChunkedUpload.objects.get(id=self.upload_id).offset, 200)
+
+    def test_duplicate_chunk_is_refused_with_the_current_offset(self):
+        self.put_chunk(0, FIRST_CHUNK)
+
+        response = self.put_chunk(0, FIRST_CHUNK)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["offset"], 100)
+        self.assertEqual(ChunkedUpload.objects.get(id=self.upload_id).offset, 100)
+
+    def test_chunk_written_concurrently_by_another_request_loses(self):
+        def other_request_wins(upload, offset, stream, length):
+            received = write_chunk(upload, offset, stream, length)
+            ChunkedUpload.objects.filter(id=upload.id).update(offset=offset + received)
+            return received
+
+        with mock.patch("interviews.views.write_chunk", side_effect=other_request_wins):
+            response = self.put_chunk(0, FIRST_CHUNK)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["offset"], 100)
+
+    def test_oversized_chunk_is_refused(self):
+        response = self.put_chunk(0, FIRST_CHUNK + b"a")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(ChunkedUpload.objects.get(id=self.upload_id).offset, 0)
+
+    def test_upload_that_is_not_a_video_is_dropped(self):
+        response = self.put_chunk(0, b"plain text " * 9)
+        self.assertEqual(response.status_code, 415)
+        self.assertFalse(ChunkedUpload.objects.filter(id=self.upload_id).exists())
+
+    def test_incomplete_upload_cannot_be_completed(self):
+        self.put_chunk(0, FIRST_CHUNK)
+
+        response = self.client.post(f"/api/uploads/{self.upload_id}/complete/")
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["offset"], 100)
+
+    def test_upload_that_fails_the_probe_is_dropped(self):
+        self.put_chunk(0, FIRST_CHUNK)
+        self.put_chunk(100, b"b" * 100)
+
+        response = self.client.post(f"/api/uploads/{self.upload_id}/complete/")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(ChunkedUpload.objects.filter(id=self.upload_id).exists())
+        self.assertFalse(MockResponse.objects.get(id=self.answer.id).video_file)
+
+    def test_completing_after_the_answer_is_gone_drops_the_upload(self):
+        self.put_chunk(0, FIRST_CHUNK)
+        self.put_chunk(100, b"b" * 100)
+        MockResponse.objects.filter(id=self.answer.id).delete()
+
+        with mock.patch("interviews.views.probe_media", return_value=mock.Mock(duration=None)):
+            response = self.client.post(f"/api/uploads/{self.upload_id}/complete/")
+        self.assertEqual(response.status_code, 404)
+        self.assertFalse(ChunkedUpload.objects.filter(id=self.upload_id).exists())
+
+    def test_interview_upload_must_target_a_question_of_the_interview(self):
+        interview = Interview.objects.create(title="Backend", recruiter=make_user("recruiter"))
+        interview.questions.add(self.answer.question)
+        session = CandidateSession.objects.create(interview=interview, candidate=self.candidate)
+        other = make_question(self.answer.question.category)
+
+        def create(question):
+            return self.client.post(
+                "/api/uploads/",
+                {"target": "interview", "session_id": str(session.id), "question_id": str(question.id), "size": 200},
+                format="json",
+            )
+
+        self.assertEqual(create(other).status_code, 404)
+        self.assertEqual(create(self.answer.question).status_code, 201)
+        self.assertEqual(ChunkedUpload.objects.filter(candidate_session=session).count(), 1)
+
+
+class MediaBlobTests(TestCase):
+    def setUp(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        self.storage = storage.ContentAddressedStorage(location=location)
+
+    def save(self, data):
+        return self.storage.save("answer.webm", ContentFile(data, "answer.webm"))
+
+    def refs(self, name):
+        return MediaBlob.objects.filter(name=name).values_list("ref_count", flat=True).first()
+
+    def purge(self):
+        return storage.purge_unreferenced_blobs(self.storage, grace_seconds=0)
+
+    def test_identical_content_is_stored_once(self):
+        first, second = self.save(b"same bytes"), self.save(b"same bytes")
+
+        self.assertEqual(first, second)
+        self.assertTrue(first.startswith("blobs/"))
+        self.assertEqual(self.refs(first), 2)
+        self.assertNotEqual(self.save(b"other bytes"), first)
+
+    def test_release_drops_one_reference(self):
+        name = self.save(b"same bytes")
+        self.save(b"same bytes")
+
+        storage.release_blob(name)
+        self.assertEqual(self.refs(name), 1)
+        storage.release_blob(name)
+        storage.release_blob(name)
+        self.assertEqual(self.refs(name), 0)
+
+    def test_purge_removes_only_unreferenced_blobs(self):
+        kept, dropped = self.save(b"kept"), self.save(b"dropped")
+        storage.release_blob(dropped)
+
+        self.assertEqual(self.purge(), (1, len(b"dropped")))
+        self.assertTrue(self.storage.exists(kept))
+        self.assertFalse(self.storage.exists(dropped))
+        self.assertIsNone(self.refs(dropped))
+
+    def test_purge_respects_the_grace_period(self):
+        name = self.save(b"recent")
+        storage.release_blob(name)
+
+        self.assertEqual(storage.purge_unreferenced_blobs(self.storage, grace_seconds=3600), (0, 0))
+        self.assertTrue(self.storage.exists(name))
+
+    def test_blob_referenced_again_during_purge_is_kept(self):
+        name = self.save(b"racing")
+        storage.release_blob(name)
+        move_aside = storage._move_aside
+
+        def upload_meanwhile(path):
+            tombstone = move_aside(path)
+            self.save(b"racing")
+            return tombstone
+
+        with mock.patch.object(storage, "_move_aside", upload_meanwhile):
+            self.assertEqual(self.purge(), (0, 0))
+        self.assertEqual(self.refs(name), 1)
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b"racing")
+
+    def test_blob_recreated_during_purge_is_kept(self):
+        name = self.save(b"racing")
+        storage.release_blob(name)
+        remove = storage.os.remove
+
+        def upload_then_remove(path):
+            self.save(b"racing")
+            remove(path)
+
+        with mock.patch.object(storage.os, "remove", upload_then_remove):
+            self.assertEqual(self.purge(), (1, len(b"racing")))
+        self.assertEqual(self.refs(name), 1)
+        self.assertTrue(self.storage.exists(name))
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_satisfiable_ranges(self):
+        cases = {
+            "bytes=0-99": (0, 99),
+            "bytes=500-": (500, 999),
+            "bytes=900-5000": (900, 999),
+            "bytes=-100": (900, 999),
+            "bytes=-5000": (0, 999),
+            "bytes=999-999": (999, 999),
+        }
+        for header, expected in cases.items():
+            with self.subTest(header=header):
+                self.assertEqual(parse_range(header, 1000), expected)
+
+    def test_ignored_headers_serve_everything(self):
+        for header in (None, "", "bytes=-", "bytes=0-1,5-6", "items=0-1", "bytes=a-b"):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_range(header, 1000))
+
+    def test_unsatisfiable_ranges(self):
+        for header in ("bytes=1000-", "bytes=5-2", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(ValueError):
+                    parse_range(header, 1000)
+
+
+class SnapshotETagTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.candidate = make_user()
+        category = QuestionCategory.objects.create(name="Snapshots")
+        cls.session = MockSession.objects.create(
+            candidate=cls.candidate, question_count=1, status="analyzed", overall_score=70
+        )
+        MockResponse.objects.create(
+            session=cls.session, question=make_question(category), analysis_status="completed", ai_score=70
+        )
+
+    def setUp(self):
+        self.client = client_for(self.candidate)
+        self.url = f"/api/mock/sessions/{self.session.id}/results/"
+
+    def test_results_are_stored_and_revalidated(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertTrue(MockSessionSnapshot.objects.filter(session=self.session).exists())
+
+        cached = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(cached.status_code, 304)
+        self.assertEqual(cached["ETag"], first["ETag"])
+
+    def test_etag_changes_with_the_content(self):
+        etag = self.client.get(self.url)["ETag"]
+        MockSession.objects.filter(id=self.session.id).update(overall_score=90)
+        write_snapshot(self.session.id)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_etag_changes_with_the_video_url_window(self):
+        etag = self.client.get(self.url)["ETag"]
+        with mock.patch("interviews.snapshots.url_window", return_value=0):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_variant_requests_skip_the_snapshot(self):
+        response = self.client.get(self.url, {"include": "timeline"})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+
+
+class ProviderError(Exception):
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = mock.Mock(headers=headers or {})
+
+
+def fake_groq(transcribe=None, chat=None):
+    """A stand-in for the Groq client; each argument is the side effect of that endpoint."""
+    client = mock.Mock()
+    client.audio.transcriptions.create.side_effect = transcribe
+    client.chat.completions.create.side_effect = chat
+    return client
+
+
+class TranscriptionFailureTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = QuestionCategory.objects.create(name="Transcription")
+        cls.question = make_question(category)
+        cls.session = MockSession.objects.create(candidate=make_user(), question_count=1)
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=media_root))
+        self.enterContext(mock.patch("interviews.ai_pipeline.extract_audio", return_value=None))
+        self.answer = MockResponse.objects.create(session=self.session, question=self.question)
+        self.answer.video_file.save("answer.webm", ContentFile(b"recording bytes"))
+
+    def analyze(self, client):
+        with mock.patch("interviews.ai_pipeline.get_groq_client", return_value=client):
+            return ai_pipeline.analyze_uploaded_response(self.answer, self.answer.upload_version)
+
+    def test_rejected_upload_fails_the_answer(self):
+        with self.assertRaises(ai_pipeline.TranscriptionFailed):
+            self.analyze(fake_groq(transcribe=ProviderError(413)))
+
+        self.answer.refresh_from_db()
+        self.assertEqual(self.answer.analysis_status, "failed")
+        self.assertIsNone(self.answer.ai_score)
+
+    def test_unreadable_file_fails_the_answer(self):
+        self.answer.content_hash = ""
+        with mock.patch("interviews.ai_pipeline.hash_file", side_effect=OSError("gone")):
+            with self.assertRaises(ai_pipeline.TranscriptionFailed):
+                self.analyze(fake_groq())
+
+        self.answer.refresh_from_db()
+        self.assertEqual(self.answer.analysis_status, "failed")
+
+    def test_silent_recording_scores_no_speech(self):
+        self.assertTrue(self.analyze(fake_groq(transcribe=["  "])))
+
+        self.answer.refresh_from_db()
+        self.assertEqual((self.answer.analysis_status, self.answer.ai_score), ("completed", 0))
+
+
+@override_settings(
+    GROQ_REQUESTS_PER_MINUTE=0,
+    GROQ_TOKENS_PER_MINUTE=0,
+    GROQ_MAX_RETRIES=2,
+    GROQ_RETRY_BASE_DELAY=0,
+    GROQ_CIRCUIT_FAILURE_THRESHOLD=3,
+    GROQ_CIRCUIT_RESET_SECONDS=60,
+)
+class CallWithRetriesTests(SimpleTestCase):
+    def setUp(self):
+        reset_groq_client()
+        self.addCleanup(reset_groq_client)
+        self.sleep = self.enterContext(mock.patch("interviews.groq_client.time.sleep"))
+
+    def test_transient_errors_are_retried(self):
+        fn = mock.Mock(side_effect=[ProviderError(503), ProviderError(429), "ok"])
+
+        self.assertEqual(call_with_retries(fn), "ok")
+        self.assertEqual(fn.call_count, 3)
+
+    def test_other_errors_are_not_retried(self):
+        fn = mock.Mock(side_effect=ProviderError(400))
+
+        with self.assertRaises(ProviderError):
+            call_with_retries(fn)
+        self.assertEqual(fn.call_count, 1)
+
+    def test_exhausted_retries_raise_provider_unavailable(self):
+        fn = mock.Mock(side_effect=ProviderError(503, {"retry-after": "7"}))
+
+        with self.assertRaises(ProviderUnavailable) as raised:
+            call_with_retries(fn)
+        self.assertEqual(fn.call_count, 3)
+        self.assertEqual(raised.exception.retry_after, 7)
+        self.sleep.assert_called_with(7)
+
+    def test_breaker_opens_after_consecutive_failures(self):
+        failing = mock.Mock(side_effect=ProviderError(502))
+        with self.assertRaises(ProviderUnavailable):
+            call_with_retries(failing)
+
+        succeeding = mock.Mock(return_value="ok")
+        with self.assertRaisesMessage(ProviderUnavailable, "circuit is open"):
+            call_with_retries(succeeding)
+        succeeding.assert_not_called()
+
+    @override_settings(GROQ_CIRCUIT_RESET_SECONDS=0)
+    def test_breaker_lets_a_trial_call_through_after_the_reset_period(self):
+        with self.assertRaises(ProviderUnavailable):
+            call_with_retries(mock.Mock(side_effect=ProviderError(502)))
+
+        self.assertEqual(call_with_retries(mock.Mock(return_value="ok")), "ok")
+        self.assertEqual(call_with_retries(mock.Mock(return_value="again")), "again")
+
+
+class ListingTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.recruiter = make_user("recruiter")
+        cls.candidate = make_user()
+        for status in ("active", "active", "draft"):
+            interview = Interview.objects.create(title=f"Interview {status}", recruiter=cls.recruiter, status=status)
+        CandidateSession.objects.create(interview=interview, candidate=cls.candidate, status="completed")
+
+    def setUp(self):
+        self.client = client_for(self.recruiter)
+
+    def test_cursor_pages_cover_every_row_once_newest_first(self):
+        first = self.client.get("/api/interviews/", {"page_size": 2}).data
+        self.assertEqual(len(first["results"]), 2)
+        second = self.client.get(first["next"]).data
+        self.assertIsNone(second["next"])
+
+        ids = [row["id"] for row in first["results"] + second["results"]]
+        expected = Interview.objects.order_by("-created_at", "-id").values_list("id", flat=True)
+        self.assertEqual(ids, [str(pk) for pk in expected])
+
+    def test_fields_keeps_only_the_requested_fields(self):
+        rows = self.client.get("/api/interviews/", {"fields": "id,title"}).data["results"]
+        self.assertEqual(set(rows[0]), {"id", "title"})
+
+    def test_omit_drops_fields(self):
+        rows = self.client.get("/api/sessions/", {"omit": "candidate"}).data["results"]
+        self.assertNotIn("candidate", rows[0])
+        self.assertIn("status", rows[0])
+
+    def test_dashboard_summary_counts(self):
+        self.assertEqual(
+            self.client.get("/api/dashboard/summary/").data,
+            {
+                "interviews": {"total": 3, "active": 2},
+                "sessions": {"total": 1, "in_progress": 0, "completed": 1},
+            },
+        )
+        self.assertEqual(client_for(self.candidate).get("/api/dashboard/summary/").data["interviews"]["total"], 2)
+
+
+class CompactionTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        category = QuestionCategory.objects.create(name="Compaction")
+        cls.session = MockSession.objects.create(candidate=make_user(), question_count=1)
+        cls.question = make_question(category)
+
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root, ignore_errors=True)
+        self.enterContext(override_settings(MEDIA_ROOT=self.media_root))
+        self.answer = MockResponse.objects.create(
+            session=self.session, question=self.question, analysis_status="completed"
+        )
+        self.answer.video_file.save("answer.webm", ContentFile(b"\x1a\x45\xdf\xa3" + b"x" * 1000))
+        MockResponse.objects.filter(id=self.answer.id).update(content_hash="original-hash")
+        self.answer.refresh_from_db()
+
+    def transcode(self, path):
+        output = os.path.join(self.media_root, "transcoded.webm")
+        with open(output, "wb") as f:
+            f.write(b"\x1a\x45\xdf\xa3small")
+        return output
+
+    def test_compacted_recording_keeps_its_cached_transcript(self):
+        key = (ai_pipeline.TRANSCRIPTION_MODEL, ai_pipeline.TRANSCRIPTION_RESPONSE_FORMAT)
+        ai_cache.store_transcript("original-hash", *key, "cached words")
+
+        with mock.patch("interviews.compaction.transcode_video", side_effect=self.transcode):
+            self.assertEqual(compact_recording(MockResponse, self.answer), "compacted")
+
+        self.answer.refresh_from_db()
+        self.assertNotEqual(self.answer.content_hash, "original-hash")
+        self.assertEqual(ai_cache.get_cached_transcript(self.answer.content_hash, *key), "cached words")
+
+
+class PackedTimelineTests(SimpleTestCase):
+    def test_round_trip(self):
+        timeline = [
+            {"time": 0.5, "emotions": {"happy": 0.75, "neutral": 0.25}},
+            {"time": 1.0, "emotions": {"sad": 1.0, "unknown": 0.5}},
+        ]
+        rows = unpack_timeline(pack_timeline(timeline))
+
+        self.assertEqual(rows.shape, (2, 1 + len(EMOTIONS)))
+        self.assertEqual(rows[0].tolist(), [0.5, 0.25, 0.75, 0, 0, 0, 0, 0])
+        self.assertEqual(rows[1].tolist(), [1.0, 0, 0, 1.0, 0, 0, 0, 0])
+
+    def test_malformed_frames_are_skipped(self):
+        packed = pack_timeline([None, {"time": 1}, {"time": "soon", "emotions": {}}, {"time": 2, "emotions": {}}])
+        self.assertEqual(unpack_timeline(packed)[:, 0].tolist(), [2.0])
+
+    def test_empty_timeline(self):
+        self.assertEqual(pack_timeline(None), b"")
+        self.assertEqual(unpack_timeline(b"").shape, (0, 1 + len(EMOTIONS)))
+
+    def test_split_keeps_the_summary_in_emotion_data(self):
+        summary, packed = split_emotion_data({"averages": {"happy": 1.0}, "timeline": [{"time": 0, "emotions": {}}]})
+        self.assertEqual(summary, {"averages": {"happy": 1.0}})
+        self.assertEqual(len(unpack_timeline(packed)), 1)
+
+    def test_payload_is_columnar_and_downsampled(self):
+        payload = timeline_payload(frames("happy", "happy", "sad", "sad"), points=2)
+
+        self.assertEqual(payload["emotions"], list(EMOTIONS))
+        self.assertEqual(payload["time"], [0.5, 2.5])
+        self.assertEqual([row[EMOTIONS.index("sad")] for row in payload["values"]], [0.0, 1.0])
+
+
+def frames(*emotions):
+    """A timeline with one frame per second, each fully showing the given emotion."""
+    return pack_timeline([{"time": t, "emotions": {name: 1.0}} for t, name in enumerate(emotions)])
+
+
+class EmotionAnalysisTests(SimpleTestCase):
+    def test_answer_without_emotions_scores_a_neutral_50(self):
+        self.assertEqual(analyze_emotions({"averages": {}}, scorer="averages"), {"confidence": 50.0, "metrics": {}})
+        self.assertEqual(analyze_emotions({"averages": {}}, scorer="timeline")["confidence"], 50.0)
+
+    def test_reported_averages_are_weighted(self):
+        result = analyze_emotions({"averages": {"happy": 1.0}}, frames("fearful", "fearful"), scorer="averages")
+        self.assertEqual(result["confidence"], 80.0)
+
+    def test_timeline_mean_stands_in_for_missing_averages(self):
+        self.assertEqual(analyze_emotions({}, frames("neutral", "neutral"), scorer="averages")["confidence"], 90.0)
+
+    def test_timeline_scorer_discounts_a_jumpy_expression(self):
+        steady = analyze_emotions({}, frames("neutral", "neutral", "fearful", "fearful"), scorer="timeline")
+        jumpy = analyze_emotions({}, frames("neutral", "fearful", "neutral", "fearful"), scorer="timeline")
+
+        self.assertEqual(steady["metrics"]["transitions"], 1)
+        self.assertEqual(jumpy["metrics"]["transitions"], 3)
+        self.assertEqual(jumpy["metrics"]["stability"], 0.0)
+        # Frames score 90 and 20: a mean of 55, less up to 20% for instability.
+        self.assertAlmostEqual(steady["confidence"], 55 * (0.8 + 0.2 * 2 / 3), places=1)
+        self.assertEqual(jumpy["confidence"], 44.0)
+
+    def test_unknown_scorer_falls_back_to_averages(self):
+        with self.assertLogs("interviews.emotions", "WARNING"):
+            self.assertIs(confidence_scorer("no-such-scorer"), averages_confidence)
+
+
+def chat_reply(payload):
+    return mock.Mock(choices=[mock.Mock(message=mock.Mock(content=json.dumps(payload)))])
+
+
+SCORE = {
+    "score": 72, "feedback": "Clear and well organized.", "strengths": ["Structure"], "improvements": ["Examples"],
+    "communication_score": 70, "relevance_score": 75, "structure_score": 71,
+}
+
+
+@override_settings(GROQ_REQUESTS_PER_MINUTE=0, GROQ_TOKENS_PER_MINUTE=0)
+class ScoringCacheTests(TestCase):
+    def setUp(self):
+        reset_groq_client()
+        self.addCleanup(reset_groq_client)
+
+    def score(self, client, transcript="I led the migration."):
+        with mock.patch("interviews.ai_pipeline.get_groq_client", return_value=client):
+            return ai_pipeline.score_response("Tell me about a project.", transcript)
+
+    def test_identical_request_is_answered_from_the_cache(self):
+        client = fake_groq(chat=[chat_reply(SCORE)])
+
+        self.assertFalse(self.score(client)["cache_hit"])
+        cached = self.score(client)
+        self.assertTrue(cached["cache_hit"])
+        self.assertEqual(cached["score"], 72)
+        self.assertEqual(client.chat.completions.create.call_count, 1)
+
+    def test_different_transcript_misses(self):
+        client = fake_groq(chat=[chat_reply(SCORE), chat_reply({**SCORE, "score": 40})])
+        self.score(client)
+
+        self.assertEqual(self.score(client, "I fixed a typo.")["score"], 40)
+
+    def test_expired_entry_is_rescored(self):
+        client = fake_groq(chat=[chat_reply(SCORE), chat_reply({**SCORE, "score": 90})])
+        self.score(client)
+        ScoringCacheEntry.objects.update(
+            created_at=timezone.now() - timedelta(seconds=settings.SCORING_CACHE_TTL + 1)
+        )
+
+        self.assertEqual(self.score(client)["score"], 90)
+        self.assertEqual(ScoringCacheEntry.objects.count(), 1)
+
+    @override_settings(SCORING_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        for fingerprint in ("a", "b"):
+            ai_cache.store_score(fingerprint, "model", "1", SCORE)
+        ScoringCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(hours=1))
+        ai_cache.get_cached_score("a")
+
+        ai_cache.store_score("c", "model", "1", SCORE)
+        self.assertEqual(set(ScoringCacheEntry.objects.values_list("fingerprint", flat=True)), {"a", "c"})
+
+
+@override_settings(GROQ_REQUESTS_PER_MINUTE=0, GROQ_TOKENS_PER_MINUTE=0)
+class TranscriptCacheTests(TestCase):
+    def setUp(self):
+        reset_groq_client()
+        self.addCleanup(reset_groq_client)
+        self.enterContext(mock.patch("interviews.ai_pipeline.extract_audio", return_value=None))
+        ai_cache.reset_transcript_cache_stats()
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        self.video_path = os.path.join(directory, "answer.webm")
+        with open(self.video_path, "wb") as f:
+            f.write(b"recording bytes")
+
+    def transcribe(self, client):
+        with mock.patch("interviews.ai_pipeline.get_groq_client", return_value=client):
+            return ai_pipeline.transcribe_video(self.video_path)
+
+    def test_same_recording_is_transcribed_once(self):
+        client = fake_groq(transcribe=[" I led the migration. "])
+
+        self.assertEqual(self.transcribe(client), "I led the migration.")
+        self.assertEqual(self.transcribe(client), "I led the migration.")
+        self.assertEqual(client.audio.transcriptions.create.call_count, 1)
+        self.assertEqual(ai_cache.transcript_cache_stats(), {"hits": 1, "misses": 1, "hit_rate": 0.5})
+        self.assertEqual(TranscriptCacheEntry.objects.get().hit_count, 1)
+
+    def test_changed_recording_misses(self):
+        client = fake_groq(transcribe=["First take.", "Second take."])
+        self.transcribe(client)
+        with open(self.video_path, "ab") as f:
+            f.write(b" re-recorded")
+
+        self.assertEqual(self.transcribe(client), "Second take.")
+
+    @override_settings(TRANSCRIPT_CACHE_MAX_ENTRIES=2)
+    def test_least_recently_used_entry_is_evicted(self):
+        for content_hash in ("a", "b"):
+            ai_cache.store_transcript(content_hash, "model", "text", "words")
+        TranscriptCacheEntry.objects.update(last_used_at=timezone.now() - timedelta(hours=1))
+        ai_cache.get_cached_transcript("a", "model", "text")
+
+        ai_cache.store_transcript("c", "model", "text", "words")
+        self.assertEqual(set(TranscriptCacheEntry.objects.values_list("content_hash", flat=True)), {"a", "c"})
+
+
+def ebml(element_id, payload=b""):
+    """One EBML element with an 8-byte size field."""
+    size = b"\x01" + len(payload).to_bytes(7, "big")
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, "big") + size + payload
+
+
+def webm(track_types=(1, 2), duration=None, clusters=b""):
+    info = ebml(0x2AD7B1, (1_000_000).to_bytes(3, "big"))
+    if duration is not None:
+        info += ebml(0x4489, struct.pack(">f", duration))
+    tracks = b"".join(ebml(0xAE, ebml(0x83, bytes([kind]))) for kind in track_types)
+    segment = ebml(0x1549A966, info) + ebml(0x1654AE6B, tracks) + clusters
+    return ebml(0x1A45DFA3, ebml(0x4282, b"webm")) + ebml(0x18538067, segment)
+
+
+def box(box_type, payload=b""):
+    return struct.pack(">I4s", 8 + len(payload), box_type) + payload
+
+
+def mp4(handlers=(b"vide", b"soun"), seconds=3):
+    mvhd = box(b"mvhd", bytes(12) + struct.pack(">II", 1000, seconds * 1000))
+    traks = b"".join(box(b"trak", box(b"mdia", box(b"hdlr", bytes(8) + handler))) for handler in handlers)
+    return box(b"ftyp", b"isom" + bytes(4)) + box(b"moov", mvhd + traks)
+
+
+class ProbeMediaTests(SimpleTestCase):
+    def probe(self, data):
+        return probe_media(io.BytesIO(data))
+
+    def test_webm_duration_comes_from_the_header(self):
+        self.assertEqual(self.probe(webm(duration=2500.0)), ("webm", 2.5, True))
+
+    def test_webm_without_a_duration_is_timed_by_its_last_block(self):
+        block = ebml(0xA3, b"\x81" + struct.pack(">h", 500) + b"\x80frame")
+        cluster = ebml(0x1F43B675, ebml(0xE7, (3000).to_bytes(2, "big")) + block)
+
+        self.assertEqual(self.probe(webm(clusters=cluster)).duration, 3.5)
+
+    def test_mp4(self):
+        self.assertEqual(self.probe(mp4()), ("mp4", 3.0, True))
+
+    def test_recording_without_audio_is_rejected(self):
+        for data in (webm(track_types=(1,)), mp4(handlers=(b"vide",))):
+            with self.assertRaisesMessage(InvalidMedia, "no audio track"):
+                self.probe(data)
+
+    def test_mp4_without_a_header_is_rejected(self):
+        with self.assertRaisesMessage(InvalidMedia, "no MP4 header"):
+            self.probe(box(b"ftyp", b"isom" + bytes(4)) + box(b"mdat", b"frames"))
+
+    def test_truncated_webm_is_rejected(self):
+        with self.assertRaises(InvalidMedia):
+            self.probe(webm()[:40])
+
+    def test_other_files_are_rejected(self):
+        with self.assertRaisesMessage(InvalidMedia, UNSUPPORTED_FORMAT):
+            self.probe(b"plain text, not a recording")
@@ -0,0 +1,60 @@
+import hashlib
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.files.uploadedfile import TemporaryUploadedFile, UploadedFile
+from django.core.files.uploadhandler import FileUploadHandler
+
+from .media import SNIFF_BYTES, sniff_container
+
+
+class SpooledVideoFile(TemporaryUploadedFile):
+    """A TemporaryUploadedFile created in CHUNKED_UPLOAD_DIR instead of FILE_UPLOAD_TEMP_DIR."""
+
+    def __init__(self, name, content_type, size, charset, content_type_extra=None):
+        os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+        _, ext = os.path.splitext(name)
+        file = tempfile.NamedTemporaryFile(suffix=".upload" + ext, dir=settings.CHUNKED_UPLOAD_DIR)
+        UploadedFile.__init__(self, file, name, content_type, size, charset, content_type_extra)
+
+
+class HashingFileUploadHandler(FileUploadHandler):
+    """Stream each uploaded file to disk, hashing, counting and sniffing it on the way.
+
+    The temp file sits next to the chunked upload parts, on the same
+    filesystem as MEDIA_ROOT, so saving it through a FileField is a rename
+    rather than a second copy. The finished file carries ``content_hash``,
+    ``size`` and ``container`` attributes for the view to store.
+    """
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file = SpooledVideoFile(self.file_name, self.content_type, 0, self.charset, self.content_type_extra)
+        self.digest = hashlib.sha256()
+        self.header = b""
+
+    def receive_data_chunk(self, raw_data, start):
+        self.digest.update(raw_data)
+        if len(self.header) < SNIFF_BYTES:
+            self.header += raw_data[:SNIFF_BYTES - len(self.header)]
+        self.file.write(raw_data)
+
+    def file_complete(self, file_size):
+        self.file.seek(0)
+        self.file.size = file_size
+        self.file.content_hash = self.digest.hexdigest()
+        self.file.container = sniff_container(self.header)
+        return self.file
+
+    def upload_interrupted(self):
+        if hasattr(self, "file"):
+            self.file.close()
+
+
+class HashingUploadMixin:
+    """Use HashingFileUploadHandler for multipart uploads to this view."""
+
+    def initialize_request(self, request, *args, **kwargs):
+        request.upload_handlers = [HashingFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
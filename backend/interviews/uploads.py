@@ -0,0 +1,88 @@
+import hashlib
+import logging
+import os
+
+from django.conf import settings
+from django.core.files import File
+
+from .ai_cache import HASH_CHUNK_SIZE
+from .media import SNIFF_BYTES, sniff_container
+
+logger = logging.getLogger(__name__)
+
+COPY_BUFFER_SIZE = 64 * 1024
+
+
+class AssembledUpload(File):
+    """A finished part file, handed to storage like a TemporaryUploadedFile.
+
+    FileSystemStorage moves files that expose ``temporary_file_path()``
+    instead of copying them, so attaching a finished upload is a rename.
+    """
+
+    def __init__(self, path: str, name: str):
+        super().__init__(open(path, "rb"), name=name)
+        self._path = path
+
+    def temporary_file_path(self) -> str:
+        return self._path
+
+
+def part_path(upload) -> str:
+    return os.path.join(settings.CHUNKED_UPLOAD_DIR, f"{upload.id}.part")
+
+
+def write_chunk(upload, offset: int, stream, length: int) -> int:
+    """Copy up to ``length`` bytes from ``stream`` into the part file at ``offset``.
+
+    The body is copied through a small fixed buffer, so memory use does not
+    depend on the chunk size. Writing at an explicit offset (rather than
+    appending) makes a retried chunk overwrite its earlier partial attempt.
+    Returns the number of bytes actually received, which is less than
+    ``length`` if the client disconnected mid-chunk.
+    """
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+    fd = os.open(part_path(upload), os.O_RDWR | os.O_CREAT, 0o600)
+    remaining = length
+    with os.fdopen(fd, "r+b") as f:
+        f.seek(offset)
+        while remaining > 0:
+            data = stream.read(min(COPY_BUFFER_SIZE, remaining))
+            if not data:
+                break
+            f.write(data)
+            remaining -= len(data)
+    return length - remaining
+
+
+def assemble(upload) -> AssembledUpload:
+    """Return the finished upload as a File, trimmed to the declared size.
+
+    Chunks can come from different workers, so the content hash is computed
+    here in one read pass rather than while the chunks are written.
+    """
+    path = part_path(upload)
+    # A retried chunk may have left bytes past the end from an earlier attempt.
+    os.truncate(path, upload.size)
+
+    digest = hashlib.sha256()
+    header = b""
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            if not header:
+                header = chunk[:SNIFF_BYTES]
+            digest.update(chunk)
+
+    assembled = AssembledUpload(path, upload.filename)
+    assembled.content_hash = digest.hexdigest()
+    assembled.container = sniff_container(header)
+    return assembled
+
+
+def discard_part(upload) -> None:
+    try:
+        os.remove(part_path(upload))
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning(f"Could not remove part file for upload {upload.id}: {e}")
@@ -3,6 +3,7 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     InterviewViewSet,
     CandidateSessionViewSet,
+    DashboardSummaryView,
     VideoUploadView,
     SessionCompleteView,
     MockSessionListCreateView,
@@ -10,6 +11,13 @@ from .views import (
     MockVideoUploadView,
     MockSessionCompleteView,
     MockSessionResultsView,
+    MockSessionAnalysisView,
+    MockSessionProgressView,
+    MockScoreAnalyticsView,
+    ChunkedUploadCreateView,
+    ChunkedUploadView,
+    ChunkedUploadCompleteView,
+    ResponseVideoView,
 )
 
 router = DefaultRouter()
@@ -19,11 +27,20 @@ router.register("sessions", CandidateSessionViewSet, basename="session")
 urlpatterns = [
     path("", include(router.urls)),
     path("upload-video/", VideoUploadView.as_view(), name="upload-video"),
+    path("dashboard/summary/", DashboardSummaryView.as_view(), name="dashboard-summary"),
     path("sessions/<uuid:session_id>/complete/", SessionCompleteView.as_view(), name="session-complete"),
+    # Resumable chunked uploads (mock and interview answers)
+    path("uploads/", ChunkedUploadCreateView.as_view(), name="chunked-uploads"),
+    path("uploads/<uuid:upload_id>/", ChunkedUploadView.as_view(), name="chunked-upload-detail"),
+    path("uploads/<uuid:upload_id>/complete/", ChunkedUploadCompleteView.as_view(), name="chunked-upload-complete"),
+    path("media/videos/<str:kind>/<uuid:response_id>/", ResponseVideoView.as_view(), name="response-video"),
     # Mock interview endpoints
     path("mock/sessions/", MockSessionListCreateView.as_view(), name="mock-sessions"),
     path("mock/sessions/<uuid:session_id>/", MockSessionDetailView.as_view(), name="mock-session-detail"),
     path("mock/upload-video/", MockVideoUploadView.as_view(), name="mock-upload-video"),
     path("mock/sessions/<uuid:session_id>/complete/", MockSessionCompleteView.as_view(), name="mock-session-complete"),
     path("mock/sessions/<uuid:session_id>/results/", MockSessionResultsView.as_view(), name="mock-session-results"),
+    path("mock/sessions/<uuid:session_id>/analysis/", MockSessionAnalysisView.as_view(), name="mock-session-analysis"),
+    path("mock/sessions/<uuid:session_id>/progress/", MockSessionProgressView.as_view(), name="mock-session-progress"),
+    path("mock/analytics/scores/", MockScoreAnalyticsView.as_view(), name="mock-score-analytics"),
 ]
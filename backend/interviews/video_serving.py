@@ -0,0 +1,180 @@
+import mimetypes
+import os
+import re
+import time
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core import signing
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseRedirect
+from django.urls import reverse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe
+
+
+def url_window() -> int:
+    """Start of the current video URL window, in seconds since the epoch.
+
+    Tokens are stamped with the window start rather than the current second,
+    so a response listing videos is byte-identical for half of
+    VIDEO_URL_MAX_AGE (and can be revalidated by ETag) while every URL in it
+    stays valid for at least that long.
+    """
+    window = max(settings.VIDEO_URL_MAX_AGE // 2, 1)
+    return int(time.time()) // window * window
+
+
+class _WindowedSigner(signing.TimestampSigner):
+    def timestamp(self):
+        return signing.b62_encode(url_window())
+
+
+_signer = _WindowedSigner(salt="interviews.video")
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def video_url(kind: str, response_id) -> str:
+    """Path of the video endpoint for a response, with a signed, expiring access token.
+
+    ``<video>`` elements cannot send an Authorization header, so API output
+    hands out these capability URLs instead of raw media URLs.
+    """
+    signed = _signer.sign(f"{kind}:{response_id}")
+    token = signed.split(":", 2)[2]  # drop the value, keep "timestamp:signature"
+    path = reverse("response-video", kwargs={"kind": kind, "response_id": response_id})
+    return f"{path}?token={token}"
+
+
+def check_video_token(token: str, kind: str, response_id) -> bool:
+    try:
+        _signer.unsign(f"{kind}:{response_id}:{token}", max_age=settings.VIDEO_URL_MAX_AGE)
+    except signing.BadSignature:
+        return False
+    return True
+
+
+class FileRange:
+    """Read-limited view of an open file, starting at ``start``.
+
+    Exposes ``fileno()`` so WSGI servers with ``wsgi.file_wrapper`` (gunicorn)
+    can sendfile() the range from the current offset straight from the page
+    cache; other servers fall back to ``read()``, which stops at the range end.
+    """
+
+    def __init__(self, file, start: int, length: int):
+        file.seek(start)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size: int = -1) -> bytes:
+        if self.remaining <= 0:
+            return b""
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+def parse_range(header: str, size: int):
+    """Return ``(start, end)`` (inclusive) for a single-range header, or None to serve everything.
+
+    Raises ValueError when the range cannot be satisfied. Multi-range and
+    malformed headers are ignored, as RFC 9110 allows.
+    """
+    match = RANGE_RE.match(header or "")
+    if match is None:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the last N bytes.
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or end < start:
+        raise ValueError("range not satisfiable")
+    return start, end
+
+
+def _if_range_matches(request, etag: str, last_modified: int) -> bool:
+    if_range = request.headers.get("If-Range")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/"')):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def _with_headers(response, headers: dict):
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+
+def serve_video(request, field_file, content_hash: str = ""):
+    """Serve a stored video with Range, ETag and Last-Modified support.
+
+    With MEDIA_ACCEL_REDIRECT_PREFIX set, the bytes are left to nginx via
+    X-Accel-Redirect after the permission and freshness checks here.
+    """
+    try:
+        path = field_file.path
+    except NotImplementedError:
+        # Remote storage serves ranges itself.
+        return HttpResponseRedirect(field_file.url)
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise Http404("Video file is missing.")
+
+    size = stat.st_size
+    last_modified = int(stat.st_mtime)
+    etag = f'"{content_hash}"' if content_hash else f'"{stat.st_mtime_ns:x}-{size:x}"'
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Accept-Ranges": "bytes",
+        "Cache-Control": f"private, max-age={settings.VIDEO_URL_MAX_AGE}",
+    }
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        # 304 Not Modified or 412 Precondition Failed.
+        return _with_headers(response, headers)
+
+    content_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+    if settings.MEDIA_ACCEL_REDIRECT_PREFIX:
+        response = HttpResponse(content_type=content_type)
+        response["X-Accel-Redirect"] = settings.MEDIA_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + quote(field_file.name)
+        return _with_headers(response, headers)
+
+    byte_range = None
+    if _if_range_matches(request, etag, last_modified):
+        try:
+            byte_range = parse_range(request.headers.get("Range"), size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return _with_headers(response, headers)
+
+    if byte_range is None:
+        response = FileResponse(open(path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = FileResponse(
+            FileRange(open(path, "rb"), start, end - start + 1), status=206, content_type=content_type
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = str(end - start + 1)
+    return _with_headers(response, headers)
@@ -1,11 +1,19 @@
 import logging
+import os
+
+from django.conf import settings
+from django.http import HttpResponseNotModified
+from django.db import transaction
+from django.db.models import Avg, Count, F, OuterRef, Prefetch, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework import viewsets, generics, permissions, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse
+from .models import Interview, CandidateSession, QuestionResponse, MockSession, MockResponse, MockSessionSnapshot, AnalysisJob, ChunkedUpload
 from .serializers import (
     InterviewListSerializer,
     InterviewDetailSerializer,
@@ -17,20 +25,73 @@ from .serializers import (
     MockSessionDetailSerializer,
     MockSessionCreateSerializer,
     MockVideoUploadSerializer,
+    AnalysisJobSerializer,
+    ChunkedUploadCreateSerializer,
+    ChunkedUploadSerializer,
+    field_requested,
 )
+from .jobs import enqueue_analysis, enqueue_response_analysis
+from .pagination import CreatedCursorPagination
 from .permissions import IsRecruiter, IsRecruiterOrReadOnly
+from .snapshots import discard_snapshot, snapshot_applies, snapshot_response, write_snapshot
+from .emotions import split_emotion_data
+from .media import SNIFF_BYTES, sniff_container
+from .probe import SUPPORTED_CONTAINERS, UNSUPPORTED_FORMAT, InvalidMedia, probe_media
+from .upload_handlers import HashingUploadMixin
+from .storage import release_blob
+from .uploads import assemble, discard_part, part_path, write_chunk
+from .video_serving import check_video_token, serve_video
+from questions.models import Question
+from questions.sampling import sample_questions
 
 logger = logging.getLogger(__name__)
 
 
+def _subquery_count(model, field: str):
+    """Number of ``model`` rows whose ``field`` is the outer row, as a correlated subquery.
+
+    Unlike Count() over joins, several of these on one queryset don't
+    multiply each other's rows, and there is no GROUP BY over the whole
+    table before a page is cut from it.
+    """
+    counts = model.objects.filter(**{field: OuterRef("pk")}).order_by().values(field).annotate(n=Count("*")).values("n")
+    return Coalesce(Subquery(counts), 0)
+
+
+def _candidate_sessions():
+    """Candidate sessions with what the list serializer reads joined or annotated."""
+    return CandidateSession.objects.select_related("candidate", "interview").annotate(
+        response_count=_subquery_count(QuestionResponse, "session")
+    )
+
+
+def _candidate_sessions_with_responses():
+    """Candidate sessions with their answers and each answer's question prefetched."""
+    return CandidateSession.objects.select_related("candidate", "interview").prefetch_related(
+        Prefetch("responses", queryset=QuestionResponse.objects.select_related("question__category"))
+    )
+
+
 class InterviewViewSet(viewsets.ModelViewSet):
     permission_classes = [IsRecruiterOrReadOnly]
+    pagination_class = CreatedCursorPagination
 
     def get_queryset(self):
         user = self.request.user
         if user.role == "recruiter":
-            return Interview.objects.filter(recruiter=user).prefetch_related("questions", "sessions")
-        return Interview.objects.filter(status="active").prefetch_related("questions")
+            interviews = Interview.objects.filter(recruiter=user)
+        else:
+            interviews = Interview.objects.filter(status="active")
+        interviews = interviews.select_related("recruiter")
+        if self.action == "retrieve":
+            return interviews.prefetch_related(
+                Prefetch("questions", queryset=Question.objects.select_related("category")),
+                Prefetch("sessions", queryset=_candidate_sessions()),
+            )
+        return interviews.annotate(
+            question_count=_subquery_count(Interview.questions.through, "interview"),
+            session_count=_subquery_count(CandidateSession, "interview"),
+        )
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -40,18 +101,46 @@ class InterviewViewSet(viewsets.ModelViewSet):
         return InterviewListSerializer
 
 
+class DashboardSummaryView(APIView):
+    """Counts behind the dashboard stats, so clients need not page through every listing."""
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        if user.role == "recruiter":
+            interviews = Interview.objects.filter(recruiter=user)
+            sessions = CandidateSession.objects.filter(interview__recruiter=user)
+        else:
+            interviews = Interview.objects.filter(status="active")
+            sessions = CandidateSession.objects.filter(candidate=user)
+
+        return Response({
+            "interviews": interviews.aggregate(
+                total=Count("id"),
+                active=Count("id", filter=Q(status="active")),
+            ),
+            "sessions": sessions.aggregate(
+                total=Count("id"),
+                in_progress=Count("id", filter=Q(status="in_progress")),
+                completed=Count("id", filter=Q(status__in=("completed", "reviewed"))),
+            ),
+        })
+
+
 class CandidateSessionViewSet(viewsets.ModelViewSet):
     http_method_names = ["get", "post", "head", "options"]
+    pagination_class = CreatedCursorPagination
 
     def get_queryset(self):
         user = self.request.user
+        if self.action == "retrieve" and field_requested(self.request, "responses"):
+            sessions = _candidate_sessions_with_responses()
+        else:
+            sessions = _candidate_sessions()
         if user.role == "recruiter":
-            return CandidateSession.objects.filter(
-                interview__recruiter=user
-            ).select_related("candidate", "interview").prefetch_related("responses")
-        return CandidateSession.objects.filter(
-            candidate=user
-        ).select_related("candidate", "interview").prefetch_related("responses")
+            return sessions.filter(interview__recruiter=user)
+        return sessions.filter(candidate=user)
 
     def get_serializer_class(self):
         if self.action == "retrieve":
@@ -80,12 +169,12 @@ class CandidateSessionViewSet(viewsets.ModelViewSet):
             session.save()
 
         return Response(
-            CandidateSessionDetailSerializer(session).data,
+            CandidateSessionDetailSerializer(_candidate_sessions_with_responses().get(id=session.id)).data,
             status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
         )
 
 
-class VideoUploadView(APIView):
+class VideoUploadView(HashingUploadMixin, APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
@@ -107,11 +196,7 @@ class VideoUploadView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        response, created = QuestionResponse.objects.update_or_create(
-            session=session,
-            question_id=question_id,
-            defaults={"video_file": video, "duration": duration},
-        )
+        response = _attach_interview_video(session, question_id, video, duration)
 
         return Response(
             {"id": str(response.id), "message": "Video uploaded successfully."},
@@ -119,6 +204,32 @@ class VideoUploadView(APIView):
         )
 
 
+def _video_metadata(video) -> dict:
+    """Hash, size and container recorded by the upload handler (or the chunked upload)."""
+    return {
+        "content_hash": getattr(video, "content_hash", ""),
+        "file_size": video.size,
+        "container": getattr(video, "container", ""),
+        # A new recording starts uncompacted.
+        "compaction_status": "",
+        "original_file_size": None,
+        "compacted_at": None,
+    }
+
+
+def _attach_interview_video(session, question_id, video, duration) -> QuestionResponse:
+    previous = QuestionResponse.objects.filter(session=session, question_id=question_id).values_list(
+        "video_file", flat=True
+    ).first()
+    response, created = QuestionResponse.objects.update_or_create(
+        session=session,
+        question_id=question_id,
+        defaults={"video_file": video, "duration": duration, **_video_metadata(video)},
+    )
+    release_blob(previous)
+    return response
+
+
 class SessionCompleteView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -138,18 +249,33 @@ class SessionCompleteView(APIView):
         session.save()
 
         return Response(
-            CandidateSessionDetailSerializer(session).data,
+            CandidateSessionDetailSerializer(_candidate_sessions_with_responses().get(id=session.id)).data,
             status=status.HTTP_200_OK,
         )
 
 
+def _recent_question_ids(user) -> list:
+    """Questions asked in the candidate's last QUESTION_RECENT_SESSIONS mock sessions."""
+    if settings.QUESTION_RECENT_SESSIONS <= 0:
+        return []
+    recent = MockSession.objects.filter(candidate=user).order_by("-created_at", "-id").values("id")
+    return list(
+        MockResponse.objects.filter(session__in=recent[:settings.QUESTION_RECENT_SESSIONS])
+        .values_list("question_id", flat=True)
+    )
+
+
 class MockSessionListCreateView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        sessions = MockSession.objects.filter(candidate=request.user)
-        serializer = MockSessionListSerializer(sessions, many=True)
-        return Response(serializer.data)
+        sessions = MockSession.objects.filter(candidate=request.user).select_related("candidate").annotate(
+            response_count=_subquery_count(MockResponse, "session")
+        )
+        paginator = CreatedCursorPagination()
+        page = paginator.paginate_queryset(sessions, request, view=self)
+        serializer = MockSessionListSerializer(page, many=True, context={"request": request})
+        return paginator.get_paginated_response(serializer.data)
 
     def post(self, request):
         serializer = MockSessionCreateSerializer(data=request.data)
@@ -158,21 +284,12 @@ class MockSessionListCreateView(APIView):
         session_type = serializer.validated_data["session_type"]
         question_count = serializer.validated_data["question_count"]
 
-        from questions.models import Question
-
-        # Filter questions by category based on session_type
-        questions_qs = Question.objects.filter(is_active=True)
-        if session_type == "behavioral":
-            questions_qs = questions_qs.filter(
-                category__name__in=["Behavioral", "Communication"]
-            )
-        elif session_type == "technical":
-            questions_qs = questions_qs.filter(
-                category__name__in=["Technical", "Problem Solving", "System Design"]
-            )
-        # "mixed" uses all categories
-
-        questions_list = list(questions_qs.order_by("?")[:question_count])
+        questions_list = sample_questions(
+            session_type,
+            question_count,
+            balance_difficulty=serializer.validated_data["balance_difficulty"],
+            avoid=_recent_question_ids(request.user),
+        )
 
         if not questions_list:
             return Response(
@@ -186,35 +303,77 @@ class MockSessionListCreateView(APIView):
             question_count=len(questions_list),
         )
 
-        for i, q in enumerate(questions_list):
-            MockResponse.objects.create(
-                session=mock_session,
-                question=q,
-                question_order=i,
-            )
+        MockResponse.objects.bulk_create(
+            MockResponse(session=mock_session, question=q, question_order=i)
+            for i, q in enumerate(questions_list)
+        )
 
         return Response(
-            MockSessionDetailSerializer(mock_session).data,
+            MockSessionDetailSerializer(_mock_sessions_with_responses().get(id=mock_session.id)).data,
             status=status.HTTP_201_CREATED,
         )
 
 
+def _timeline_context(request) -> dict:
+    """Serializer context for ``?include=timeline&timeline_points=N``; raises ValueError on a bad count."""
+    include = "timeline" in request.query_params.get("include", "").split(",")
+    points = int(request.query_params.get("timeline_points", 0))
+    if points < 0:
+        raise ValueError(points)
+    return {"include_timeline": include, "timeline_points": points}
+
+
+def _mock_sessions_with_responses(include_timeline: bool = False, include_responses: bool = True):
+    """Mock sessions with their answers prefetched, leaving the packed timeline unloaded unless asked for."""
+    sessions = MockSession.objects.select_related("candidate")
+    if not include_responses:
+        return sessions
+    responses = MockResponse.objects.select_related("question__category")
+    if not include_timeline:
+        responses = responses.defer("emotion_timeline")
+    return sessions.prefetch_related(Prefetch("responses", queryset=responses))
+
+
+def _mock_session_detail(request, session_id):
+    if snapshot_applies(request):
+        snapshot = MockSessionSnapshot.objects.filter(
+            session_id=session_id, session__candidate=request.user, session__status="analyzed"
+        ).first()
+        if snapshot is not None:
+            return snapshot_response(request, snapshot)
+
+    try:
+        context = _timeline_context(request)
+    except ValueError:
+        return Response(
+            {"error": "timeline_points must be a non-negative integer."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    try:
+        session = _mock_sessions_with_responses(
+            context["include_timeline"], field_requested(request, "responses")
+        ).get(id=session_id, candidate=request.user)
+    except MockSession.DoesNotExist:
+        return Response(
+            {"error": "Mock session not found."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+
+    if session.status == "analyzed" and snapshot_applies(request):
+        # Analyzed before snapshots were kept, or writing it failed: store it now.
+        return snapshot_response(request, write_snapshot(session.id, session))
+    return Response(MockSessionDetailSerializer(session, context={"request": request, **context}).data)
+
+
 class MockSessionDetailView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, session_id):
-        try:
-            session = MockSession.objects.get(id=session_id, candidate=request.user)
-        except MockSession.DoesNotExist:
-            return Response(
-                {"error": "Mock session not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        return _mock_session_detail(request, session_id)
 
-        return Response(MockSessionDetailSerializer(session).data)
 
-
-class MockVideoUploadView(APIView):
+class MockVideoUploadView(HashingUploadMixin, APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def post(self, request):
@@ -238,7 +397,7 @@ class MockVideoUploadView(APIView):
             )
 
         try:
-            mock_response = MockResponse.objects.get(
+            mock_response = MockResponse.objects.defer("emotion_timeline").get(
                 session=mock_session, question_id=question_id
             )
         except MockResponse.DoesNotExist:
@@ -247,10 +406,7 @@ class MockVideoUploadView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        mock_response.video_file = video
-        mock_response.duration = duration
-        mock_response.emotion_data = emotion_data
-        mock_response.save()
+        _attach_mock_video(mock_response, video, duration, emotion_data)
 
         return Response(
             {"id": str(mock_response.id), "message": "Video uploaded successfully."},
@@ -258,6 +414,27 @@ class MockVideoUploadView(APIView):
         )
 
 
+def _attach_mock_video(mock_response, video, duration, emotion_data) -> None:
+    previous = mock_response.video_file.name
+    mock_response.video_file = video
+    for name, value in _video_metadata(video).items():
+        setattr(mock_response, name, value)
+    mock_response.duration = duration
+    # Only the summary stays in the JSON column; the per-frame timeline is packed separately.
+    mock_response.emotion_data, mock_response.emotion_timeline = split_emotion_data(emotion_data)
+    mock_response.analysis_status = "pending"
+    mock_response.upload_version = F("upload_version") + 1
+    mock_response.save()
+    mock_response.refresh_from_db(fields=["upload_version"])
+    # Re-uploading identical bytes adds and drops a reference to the same blob.
+    release_blob(previous)
+    discard_snapshot(mock_response.session_id)
+    MockSession.bump_progress(mock_response.session_id)
+
+    # Start transcribing and scoring this answer while the candidate records the next.
+    enqueue_response_analysis(mock_response)
+
+
 class MockSessionCompleteView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
@@ -274,34 +451,389 @@ class MockSessionCompleteView(APIView):
 
         mock_session.status = "completed"
         mock_session.completed_at = timezone.now()
-        mock_session.save()
+        mock_session.save(update_fields=["status", "completed_at"])
+        discard_snapshot(mock_session.id)
+        MockSession.bump_progress(mock_session.id)
 
-        # Run AI analysis synchronously
-        try:
-            from .ai_pipeline import analyze_mock_session
-            analyze_mock_session(mock_session)
-        except Exception as e:
-            logger.error(f"AI analysis failed for mock session {session_id}: {e}")
-            # Still return results even if AI fails
-            mock_session.overall_feedback = "AI analysis could not be completed. Please try again."
-            mock_session.save()
+        # Analysis runs in `manage.py run_analysis_worker`; poll the job for progress.
+        job = enqueue_analysis(mock_session)
+        return Response(AnalysisJobSerializer(job).data, status=status.HTTP_202_ACCEPTED)
 
-        mock_session.refresh_from_db()
-        return Response(MockSessionDetailSerializer(mock_session).data)
+
+class MockSessionAnalysisView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, session_id):
+        job = AnalysisJob.objects.filter(
+            kind="session", mock_session_id=session_id, mock_session__candidate=request.user
+        ).order_by("-created_at").first()
+        if job is None:
+            return Response(
+                {"error": "No analysis has been requested for this session."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response(AnalysisJobSerializer(job).data)
 
 
 class MockSessionResultsView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, session_id):
-        try:
-            mock_session = MockSession.objects.get(
-                id=session_id, candidate=request.user
-            )
-        except MockSession.DoesNotExist:
+        return _mock_session_detail(request, session_id)
+
+
+# Scores averaged by the analytics endpoint, and the ai_score histogram buckets (the last includes 100).
+ANALYTICS_SCORE_FIELDS = ("ai_score", "communication_score", "relevance_score", "structure_score", "confidence_score")
+ANALYTICS_SCORE_BUCKETS = ((0, 20), (20, 40), (40, 60), (60, 80), (80, 100))
+
+
+def _score_aggregates() -> dict:
+    aggregates = {"count": Count("id")}
+    for field in ANALYTICS_SCORE_FIELDS:
+        aggregates[f"avg_{field}"] = Avg(field)
+    for low, high in ANALYTICS_SCORE_BUCKETS:
+        below = Q(ai_score__lte=high) if high == 100 else Q(ai_score__lt=high)
+        aggregates[f"bucket_{low}"] = Count("id", filter=Q(ai_score__gte=low) & below)
+    return aggregates
+
+
+def _score_summary(row: dict) -> dict:
+    return {
+        "count": row["count"],
+        "averages": {
+            field: None if row[f"avg_{field}"] is None else round(row[f"avg_{field}"], 1)
+            for field in ANALYTICS_SCORE_FIELDS
+        },
+        "distribution": [
+            {"min": low, "max": high, "count": row[f"bucket_{low}"]} for low, high in ANALYTICS_SCORE_BUCKETS
+        ],
+    }
+
+
+class MockScoreAnalyticsView(APIView):
+    """Score averages and ai_score distributions over analyzed mock answers, per user and per question.
+
+    Everything is aggregated in the database from the score columns. Candidates
+    see their own answers and staff see everyone's; ``?session_type=`` narrows
+    to one kind of session.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        answers = MockResponse.objects.filter(analysis_status="completed", ai_score__isnull=False)
+        if not request.user.is_staff:
+            answers = answers.filter(session__candidate=request.user)
+        session_type = request.query_params.get("session_type")
+        if session_type:
+            if session_type not in dict(MockSession.SESSION_TYPE_CHOICES):
+                return Response(
+                    {"error": "session_type must be one of behavioral, technical, mixed."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            answers = answers.filter(session__session_type=session_type)
+
+        aggregates = _score_aggregates()
+        users = answers.values("session__candidate", "session__candidate__email").annotate(**aggregates).order_by(
+            "session__candidate__email"
+        )
+        questions = answers.values("question", "question__text", "question__category__name").annotate(
+            **aggregates
+        ).order_by("-count", "question")
+
+        return Response({
+            "overall": _score_summary(answers.aggregate(**aggregates)),
+            "users": [
+                {"id": row["session__candidate"], "email": row["session__candidate__email"], **_score_summary(row)}
+                for row in users
+            ],
+            "questions": [
+                {
+                    "id": row["question"],
+                    "text": row["question__text"],
+                    "category": row["question__category__name"],
+                    **_score_summary(row),
+                }
+                for row in questions
+            ],
+        })
+
+
+def _mock_progress_payload(session_id, version: int) -> dict:
+    session = MockSession.objects.filter(id=session_id).values("status", "overall_score").first()
+    job = AnalysisJob.objects.filter(kind="session", mock_session_id=session_id).order_by("-created_at").values(
+        "status", "last_error"
+    ).first()
+    responses = MockResponse.objects.filter(session_id=session_id).order_by("question_order").values(
+        "id", "question_order", "analysis_status", "ai_score"
+    )
+    return {
+        "version": version,
+        "status": session["status"],
+        "overall_score": session["overall_score"],
+        "analysis_job": job,
+        "responses": [{**r, "id": str(r["id"])} for r in responses],
+    }
+
+
+class MockSessionProgressView(APIView):
+    """Analysis progress for a mock session, for clients polling every few seconds.
+
+    Each request answers at once. ``MockSession.progress_version`` is the
+    ETag: when it matches ``If-None-Match``, or is no newer than the ``since``
+    version the client last saw, the response is ``304 Not Modified`` and
+    costs a single-column primary-key lookup. The full payload is only built
+    when the version has moved.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, session_id):
+        version = MockSession.objects.filter(
+            id=session_id, candidate=request.user
+        ).values_list("progress_version", flat=True).first()
+        if version is None:
             return Response(
                 {"error": "Mock session not found."},
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        return Response(MockSessionDetailSerializer(mock_session).data)
+        try:
+            since = int(request.query_params.get("since", -1))
+        except ValueError:
+            since = -1
+
+        etag = f'"progress-{version}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            if version <= since:
+                response = HttpResponseNotModified()
+            else:
+                response = Response(_mock_progress_payload(session_id, version))
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+
+class ChunkedUploadCreateView(APIView):
+    """Start a resumable upload of an answer's video.
+
+    Protocol: POST here with the total ``size``, then PUT raw bytes to
+    ``uploads/<id>/`` with an ``Upload-Offset`` header (at most
+    ``chunk_size`` bytes per request), then POST ``uploads/<id>/complete/``.
+    After a dropped connection, GET ``uploads/<id>/`` and resume from the
+    returned ``offset``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = ChunkedUploadCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        upload = ChunkedUpload(
+            user=request.user,
+            target=data["target"],
+            question_id=data["question_id"],
+            filename=os.path.basename(data["filename"]) or "recording.webm",
+            size=data["size"],
+            duration=data["duration"],
+            emotion_data=data["emotion_data"],
+        )
+        if data["target"] == "mock":
+            exists = MockResponse.objects.filter(
+                session_id=data["session_id"],
+                session__candidate=request.user,
+                question_id=data["question_id"],
+            ).exists()
+            if not exists:
+                return Response(
+                    {"error": "Question not found in this mock session."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            upload.mock_session_id = data["session_id"]
+        else:
+            session = CandidateSession.objects.filter(
+                id=data["session_id"], candidate=request.user
+            ).select_related("interview").first()
+            if session is None:
+                return Response(
+                    {"error": "Session not found."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            # Refuse before any bytes are sent, not when the upload completes.
+            if not session.interview.questions.filter(id=data["question_id"]).exists():
+                return Response(
+                    {"error": "Question not found in this interview."},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            upload.candidate_session = session
+        upload.save()
+
+        return Response(ChunkedUploadSerializer(upload).data, status=status.HTTP_201_CREATED)
+
+
+class ChunkedUploadView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def _get_upload(self, request, upload_id):
+        return ChunkedUpload.objects.filter(id=upload_id, user=request.user).first()
+
+    def get(self, request, upload_id):
+        upload = self._get_upload(request, upload_id)
+        if upload is None:
+            return Response({"error": "Upload not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(ChunkedUploadSerializer(upload).data)
+
+    def put(self, request, upload_id):
+        upload = self._get_upload(request, upload_id)
+        if upload is None:
+            return Response({"error": "Upload not found."}, status=status.HTTP_404_NOT_FOUND)
+        if upload.status != "uploading":
+            return Response({"error": "Upload is already complete."}, status=status.HTTP_409_CONFLICT)
+
+        try:
+            offset = int(request.headers["Upload-Offset"])
+            length = int(request.headers["Content-Length"])
+        except (KeyError, ValueError):
+            return Response(
+                {"error": "Upload-Offset and Content-Length headers are required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if offset != upload.offset:
+            return Response(
+                {"error": "Chunk does not start at the current offset.", "offset": upload.offset},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if length <= 0 or length > settings.CHUNKED_UPLOAD_CHUNK_SIZE or offset + length > upload.size:
+            return Response(
+                {"error": f"Chunks must be 1-{settings.CHUNKED_UPLOAD_CHUNK_SIZE} bytes and end within the upload."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # The body is read straight off the socket; request.data is never touched.
+        received = write_chunk(upload, offset, request.stream, length)
+        if offset == 0 and not _starts_like_video(upload):
+            # Refuse the rest of a file that is not a recording at all.
+            if ChunkedUpload.objects.filter(id=upload.id, offset=0, status="uploading").delete()[0]:
+                discard_part(upload)
+            return Response(
+                {"error": UNSUPPORTED_FORMAT},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            )
+        advanced = ChunkedUpload.objects.filter(id=upload.id, offset=offset, status="uploading").update(
+            offset=offset + received, updated_at=timezone.now()
+        )
+        if not advanced:
+            upload.refresh_from_db(fields=["offset"])
+            return Response(
+                {"error": "Another request already wrote this chunk.", "offset": upload.offset},
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response({"upload_id": str(upload.id), "offset": offset + received, "size": upload.size})
+
+
+def _starts_like_video(upload) -> bool:
+    with open(part_path(upload), "rb") as f:
+        header = f.read(SNIFF_BYTES)
+    return len(header) < SNIFF_BYTES or sniff_container(header) in SUPPORTED_CONTAINERS
+
+
+class ChunkedUploadCompleteView(APIView):
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request, upload_id):
+        upload = ChunkedUpload.objects.filter(id=upload_id, user=request.user).first()
+        if upload is None:
+            return Response({"error": "Upload not found."}, status=status.HTTP_404_NOT_FOUND)
+
+        with transaction.atomic():
+            finalized = ChunkedUpload.objects.filter(id=upload.id, status="uploading", offset=upload.size).update(
+                status="complete", completed_at=timezone.now()
+            )
+            if not finalized:
+                upload.refresh_from_db(fields=["offset", "status"])
+                return Response(
+                    {
+                        "error": "Upload is incomplete." if upload.status == "uploading" else "Upload is already complete.",
+                        "offset": upload.offset,
+                    },
+                    status=status.HTTP_409_CONFLICT,
+                )
+
+            video = assemble(upload)
+            try:
+                info = probe_media(video)
+            except InvalidMedia as e:
+                video.close()
+                discard_part(upload)
+                upload.delete()
+                return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+            duration = upload.duration if info.duration is None else round(info.duration)
+            try:
+                if upload.target == "mock":
+                    try:
+                        response = MockResponse.objects.defer("emotion_timeline").get(
+                            session_id=upload.mock_session_id, question_id=upload.question_id
+                        )
+                    except MockResponse.DoesNotExist:
+                        # The session was deleted while the upload was in progress.
+                        discard_part(upload)
+                        upload.delete()
+                        return Response(
+                            {"error": "Question not found in this mock session."},
+                            status=status.HTTP_404_NOT_FOUND,
+                        )
+                    _attach_mock_video(response, video, duration, upload.emotion_data)
+                else:
+                    response = _attach_interview_video(
+                        upload.candidate_session, upload.question_id, video, duration
+                    )
+            finally:
+                video.close()
+        # Usually already gone: local storage moves the part file into place.
+        discard_part(upload)
+
+        return Response(
+            {"id": str(response.id), "message": "Video uploaded successfully."},
+            status=status.HTTP_201_CREATED,
+        )
+
+
+class ResponseVideoView(APIView):
+    """Serve an answer's video with Range, ETag and Last-Modified support.
+
+    Access is granted by the signed ``token`` from serializer output, or by
+    a JWT for the candidate (or, for interviews, the recruiter) it belongs to.
+    """
+
+    permission_classes = [permissions.AllowAny]
+    MODELS = {"interview": QuestionResponse, "mock": MockResponse}
+
+    def perform_content_negotiation(self, request, force=False):
+        # Media elements send Accept headers like "video/webm,video/*"; the
+        # body here is never rendered, so don't 406 on them.
+        return super().perform_content_negotiation(request, force=True)
+
+    def _user_may_view(self, user, kind, response_id) -> bool:
+        if not user.is_authenticated:
+            return False
+        if kind == "mock":
+            return MockResponse.objects.filter(id=response_id, session__candidate=user).exists()
+        return QuestionResponse.objects.filter(id=response_id).filter(
+            Q(session__candidate=user) | Q(session__interview__recruiter=user)
+        ).exists()
+
+    def get(self, request, kind, response_id):
+        model = self.MODELS.get(kind)
+        token = request.query_params.get("token", "")
+        allowed = model is not None and (
+            (token and check_video_token(token, kind, response_id))
+            or self._user_may_view(request.user, kind, response_id)
+        )
+        answer = model.objects.filter(id=response_id).only("video_file", "content_hash").first() if allowed else None
+        if answer is None or not answer.video_file:
+            return Response({"error": "Video not found."}, status=status.HTTP_404_NOT_FOUND)
+        return serve_video(request, answer.video_file, answer.content_hash)
@@ -0,0 +1,28 @@
+"""Version stamp of the question bank.
+
+Anything derived from the questions and categories (the sampling index, cached
+listings) is cached under the current version. Saving or deleting a question
+or category stores a new version (see ``signals``), so those entries are
+never read again and expire on their own. Bulk ``update()`` and
+``bulk_create()`` send no signals; call ``bump_bank_version()`` after them.
+"""
+import uuid
+
+from django.core.cache import cache
+
+VERSION_KEY = "questions:bank-version"
+
+
+def bank_version() -> str:
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Unknown (first use, or evicted): start a fresh one rather than guess,
+        # unless another request just did.
+        version = uuid.uuid4().hex
+        if not cache.add(VERSION_KEY, version, timeout=None):
+            version = cache.get(VERSION_KEY, version)
+    return version
+
+
+def bump_bank_version() -> None:
+    cache.set(VERSION_KEY, uuid.uuid4().hex, timeout=None)
@@ -0,0 +1,70 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from questions.bank import bump_bank_version
+from questions.models import Question, QuestionCategory
+from questions.sampling import SESSION_TYPE_CATEGORIES, sample_questions
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark picking mock session questions from a large bank: ORDER BY RANDOM() against the sampling "
+        "index. Questions are created inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--questions", type=int, nargs="+", default=[100, 10000, 100000])
+        parser.add_argument("--count", type=int, default=5, help="Questions per session")
+
+    def handle(self, *args, **options):
+        categories = SESSION_TYPE_CATEGORIES["technical"]
+        for total in options["questions"]:
+            try:
+                with transaction.atomic():
+                    self._run(total, options["count"], categories)
+                    raise _Rollback
+            except _Rollback:
+                pass
+            bump_bank_version()
+
+    def _run(self, total: int, count: int, categories):
+        created = [QuestionCategory.objects.create(name=name) for name in categories]
+        difficulties = [value for value, _ in Question.DIFFICULTY_CHOICES]
+        Question.objects.bulk_create(
+            (
+                Question(category=created[i % len(created)], text=f"Benchmark question {i}", difficulty=difficulties[i % 3])
+                for i in range(total)
+            ),
+            batch_size=1000,
+        )
+        bump_bank_version()
+
+        def order_by_random():
+            return list(
+                Question.objects.filter(is_active=True, category__name__in=categories).order_by("?")[:count]
+            )
+
+        start = time.perf_counter()
+        sample_questions("technical", count)
+        first = time.perf_counter() - start
+
+        self.stdout.write(f"{total} questions")
+        self._report("order_by('?')", order_by_random)
+        self._report("index, first use (builds it)", lambda: None, first)
+        self._report("index", lambda: sample_questions("technical", count))
+        self._report("index, balanced difficulty", lambda: sample_questions("technical", count, balance_difficulty=True))
+
+    def _report(self, label: str, func, elapsed=None) -> None:
+        if elapsed is None:
+            elapsed = float("inf")
+            for _ in range(5):
+                start = time.perf_counter()
+                func()
+                elapsed = min(elapsed, time.perf_counter() - start)
+        self.stdout.write(f"  {label:<32} {elapsed * 1000:9.2f}ms")
@@ -0,0 +1,129 @@
+"""Random question selection for mock sessions without ``ORDER BY RANDOM()``.
+
+Sorting the bank by random on every session creation scans and sorts every
+active question. Instead the ids of the active questions are indexed once per
+bank version, per session type and difficulty; a session's questions are
+sampled from that index in memory and only the chosen rows are fetched.
+"""
+import random
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .bank import bank_version
+from .models import Question
+
+# Categories each mock session type draws from; None means every category.
+SESSION_TYPE_CATEGORIES = {
+    "behavioral": ("Behavioral", "Communication"),
+    "technical": ("Technical", "Problem Solving", "System Design"),
+    "mixed": None,
+}
+
+DIFFICULTIES = tuple(value for value, _ in Question.DIFFICULTY_CHOICES)
+
+# The index as last used by this process, so a warm request costs one cache
+# read of the version rather than unpickling the whole index.
+_local = {"version": None, "built": 0.0, "index": None}
+
+
+def _build_index() -> dict:
+    """``{session_type: {"all": ids, difficulty: ids, ...}}`` over the active questions."""
+    index = {session_type: {"all": []} for session_type in SESSION_TYPE_CATEGORIES}
+    for entry in index.values():
+        entry.update((difficulty, []) for difficulty in DIFFICULTIES)
+
+    rows = Question.objects.filter(is_active=True).order_by().values_list("id", "difficulty", "category__name")
+    for question_id, difficulty, category in rows.iterator():
+        for session_type, categories in SESSION_TYPE_CATEGORIES.items():
+            if categories is None or category in categories:
+                entry = index[session_type]
+                entry["all"].append(question_id)
+                entry.setdefault(difficulty, []).append(question_id)
+
+    return {
+        session_type: {key: tuple(ids) for key, ids in entry.items()}
+        for session_type, entry in index.items()
+    }
+
+
+def question_index(refresh: bool = False) -> dict:
+    """The sampling index for the current bank version, built on first use.
+
+    Besides the version, entries expire after QUESTION_BANK_CACHE_TTL seconds,
+    which bounds how long another process with its own local cache can keep
+    using an index from before a change.
+    """
+    version = bank_version()
+    now = time.monotonic()
+    if not refresh and _local["version"] == version and now - _local["built"] < settings.QUESTION_BANK_CACHE_TTL:
+        return _local["index"]
+
+    key = f"questions:sampling-index:{version}"
+    index = None if refresh else cache.get(key)
+    if index is None:
+        index = _build_index()
+        cache.set(key, index, settings.QUESTION_BANK_CACHE_TTL)
+    _local.update(version=version, built=now, index=index)
+    return index
+
+
+def _draw(ids: tuple, count: int, avoid: set) -> list:
+    """``count`` distinct ids at random, taking ids in ``avoid`` only when there are too few others.
+
+    Drawing ``count + len(avoid)`` ids guarantees at least ``count`` that are
+    not avoided whenever the pool has that many, so the cost stays
+    proportional to the draw rather than to the pool.
+    """
+    drawn = random.sample(ids, min(len(ids), count + len(avoid)))
+    fresh = [question_id for question_id in drawn if question_id not in avoid]
+    if len(fresh) >= count:
+        return fresh[:count]
+    return fresh + [question_id for question_id in drawn if question_id in avoid][:count - len(fresh)]
+
+
+def _quotas(sizes: dict, count: int) -> dict:
+    """Split ``count`` over the difficulties as evenly as their sizes allow."""
+    quotas = dict.fromkeys(sizes, 0)
+    remaining = min(count, sum(sizes.values()))
+    while remaining:
+        open_difficulties = [difficulty for difficulty, size in sizes.items() if quotas[difficulty] < size]
+        random.shuffle(open_difficulties)
+        for difficulty in open_difficulties[:remaining]:
+            quotas[difficulty] += 1
+        remaining -= min(remaining, len(open_difficulties))
+    return quotas
+
+
+def _sample_ids(entry: dict, count: int, balance_difficulty: bool, avoid: set) -> list:
+    if not balance_difficulty:
+        return _draw(entry["all"], count, avoid)
+
+    buckets = {key: ids for key, ids in entry.items() if key != "all"}
+    quotas = _quotas({difficulty: len(ids) for difficulty, ids in buckets.items()}, count)
+    ids = [
+        question_id
+        for difficulty, quota in quotas.items() if quota
+        for question_id in _draw(buckets[difficulty], quota, avoid)
+    ]
+    random.shuffle(ids)
+    return ids
+
+
+def sample_questions(session_type: str, count: int, balance_difficulty: bool = False, avoid=()) -> list:
+    """Up to ``count`` distinct active questions for ``session_type``, in random order.
+
+    Questions whose ids are in ``avoid`` (say, ones the candidate answered
+    recently) are only picked when there are not enough others. With
+    ``balance_difficulty`` the picks are spread as evenly over easy, medium and
+    hard as the bank allows.
+    """
+    avoid = set(avoid)
+    for refresh in (False, True):
+        ids = _sample_ids(question_index(refresh)[session_type], count, balance_difficulty, avoid)
+        found = Question.objects.filter(is_active=True).select_related("category").in_bulk(ids)
+        if len(found) == len(ids):
+            break
+        # The index predates a change made in another process; rebuild it and draw again.
+    return [found[question_id] for question_id in ids if question_id in found]
@@ -12,7 +12,8 @@ class QuestionSerializer(serializers.ModelSerializer):
 
 class QuestionCategorySerializer(serializers.ModelSerializer):
     questions = QuestionSerializer(many=True, read_only=True)
-    question_count = serializers.IntegerField(source="questions.count", read_only=True)
+    # Annotated by the view's queryset.
+    question_count = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = QuestionCategory
@@ -1,3 +1,113 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from accounts.models import User
+
+from .models import Question, QuestionCategory
+from .sampling import _quotas, sample_questions
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "questions-tests"}}
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class QuestionBankETagTests(TestCase):
+    url = "/api/questions/"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.category = QuestionCategory.objects.create(name="Behavioral")
+        cls.question = Question.objects.create(category=cls.category, text="Tell me about yourself.")
+        cls.user = User.objects.create_user(
+            email="candidate@example.com", username="candidate", password="unused-password"
+        )
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_unchanged_listing_is_not_modified(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        self.assertIn("ETag", first)
+
+        again = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again["ETag"], first["ETag"])
+
+    def test_detail_is_revalidated_too(self):
+        url = f"{self.url}{self.question.id}/"
+        etag = self.client.get(url)["ETag"]
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+    def test_editing_a_question_changes_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        self.question.text = "Walk me through your resume."
+        self.question.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertContains(response, "Walk me through your resume.")
+
+    def test_cached_listing_still_requires_authentication(self):
+        self.client.get(self.url)
+
+        self.assertEqual(APIClient().get(self.url).status_code, 401)
+
+
+class DifficultyQuotaTests(SimpleTestCase):
+    def test_count_is_split_evenly(self):
+        for _ in range(20):
+            quotas = _quotas({"easy": 5, "medium": 5, "hard": 5}, 7)
+            self.assertEqual(sorted(quotas.values()), [2, 2, 3])
+
+    def test_small_difficulties_give_their_share_to_the_others(self):
+        self.assertEqual(_quotas({"easy": 1, "medium": 5, "hard": 5}, 7), {"easy": 1, "medium": 3, "hard": 3})
+
+    def test_count_is_capped_by_the_bank(self):
+        self.assertEqual(_quotas({"easy": 1, "medium": 2, "hard": 0}, 10), {"easy": 1, "medium": 2, "hard": 0})
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class SampleQuestionsTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        behavioral = QuestionCategory.objects.create(name="Behavioral")
+        technical = QuestionCategory.objects.create(name="Technical")
+        cls.behavioral = [
+            Question.objects.create(category=behavioral, text=f"{difficulty} {n}", difficulty=difficulty)
+            for difficulty in ("easy", "medium", "hard")
+            for n in range(3)
+        ]
+        cls.technical = Question.objects.create(category=technical, text="Design a cache.")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_balanced_session_mixes_difficulties(self):
+        for _ in range(10):
+            questions = sample_questions("behavioral", 6, balance_difficulty=True)
+            self.assertEqual(len({q.id for q in questions}), 6)
+            self.assertEqual(sorted(q.difficulty for q in questions), ["easy"] * 2 + ["hard"] * 2 + ["medium"] * 2)
+
+    def test_session_type_limits_the_categories(self):
+        self.assertEqual(sample_questions("technical", 5), [self.technical])
+        self.assertNotIn(self.technical, sample_questions("behavioral", 20))
+
+    def test_avoided_questions_are_used_only_when_needed(self):
+        avoid = {q.id for q in self.behavioral[:6]}
+        for _ in range(10):
+            self.assertFalse(avoid & {q.id for q in sample_questions("behavioral", 3, avoid=avoid)})
+        self.assertEqual(len(avoid & {q.id for q in sample_questions("behavioral", 5, avoid=avoid)}), 2)
+
+    def test_question_deactivated_behind_the_index_is_not_sampled(self):
+        sample_questions("behavioral", 1)
+        # update() sends no signal, so the cached index still lists the question.
+        Question.objects.filter(id=self.behavioral[0].id).update(is_active=False)
+
+        questions = sample_questions("behavioral", 9)
+        self.assertEqual(len(questions), 8)
+        self.assertNotIn(self.behavioral[0], questions)
@@ -1,15 +1,59 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Prefetch
+from django.utils.cache import get_conditional_response, patch_cache_control
 from rest_framework import viewsets, permissions
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+from .bank import bank_version
 from .models import QuestionCategory, Question
 from .serializers import QuestionCategorySerializer, QuestionSerializer
 
 
-class QuestionCategoryViewSet(viewsets.ReadOnlyModelViewSet):
-    queryset = QuestionCategory.objects.prefetch_related("questions")
+class BankCachedResponseMixin:
+    """Serve list and detail responses from the cache until the question bank changes.
+
+    Entries are keyed by the bank version and the request path, so the first
+    request after an edit builds a fresh one. The ETag is a hash of the
+    content, which lets clients revalidate with ``If-None-Match`` across
+    versions and processes. Only the body is cached: every request still
+    authenticates normally, so deactivated or deleted users are refused.
+    """
+
+    def _cached(self, request, build):
+        key = f"questions:response:{bank_version()}:{request.get_full_path()}"
+        entry = cache.get(key)
+        if entry is None:
+            data = build()
+            digest = hashlib.sha256(JSONRenderer().render(data)).hexdigest()
+            entry = {"data": data, "etag": f'"{digest[:32]}"'}
+            cache.set(key, entry, settings.QUESTION_BANK_CACHE_TTL)
+
+        response = get_conditional_response(request, etag=entry["etag"]) or Response(entry["data"])
+        response["ETag"] = entry["etag"]
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    def list(self, request, *args, **kwargs):
+        build = super().list
+        return self._cached(request, lambda: build(request, *args, **kwargs).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        build = super().retrieve
+        return self._cached(request, lambda: build(request, *args, **kwargs).data)
+
+
+class QuestionCategoryViewSet(BankCachedResponseMixin, viewsets.ReadOnlyModelViewSet):
+    queryset = QuestionCategory.objects.annotate(question_count=Count("questions")).prefetch_related(
+        Prefetch("questions", queryset=Question.objects.select_related("category"))
+    )
     serializer_class = QuestionCategorySerializer
     permission_classes = [permissions.IsAuthenticated]
 
 
-class QuestionViewSet(viewsets.ReadOnlyModelViewSet):
+class QuestionViewSet(BankCachedResponseMixin, viewsets.ReadOnlyModelViewSet):
     queryset = Question.objects.filter(is_active=True).select_related("category")
     serializer_class = QuestionSerializer
     permission_classes = [permissions.IsAuthenticated]
@@ -0,0 +1,13 @@
+#!/usr/bin/env bash
+# Render start script for Django backend.
+# The analysis worker and media compaction run in the same service as gunicorn
+# because they read the uploaded recordings from this service's disk
+# (MEDIA_ROOT); a separate Render worker service would not see them.
+# Compaction is its own process so a long transcode never delays analysis jobs;
+# it exits at once when MEDIA_COMPACTION is off.
+set -o errexit
+
+python manage.py run_analysis_worker &
+python manage.py compact_media --watch &
+
+exec gunicorn interview_ai.wsgi:application --bind "0.0.0.0:$PORT"
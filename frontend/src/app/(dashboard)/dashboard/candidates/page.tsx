@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
-import api from "@/lib/api";
+import api, { fetchAllPages, mediaUrl } from "@/lib/api";
 import { CandidateSession } from "@/types";
 import GlassPanel from "@/components/GlassPanel";
 import { Badge } from "@/components/ui/badge";
@@ -31,8 +31,7 @@ export default function CandidatesPage() {
   useEffect(() => {
     const fetchSessions = async () => {
       try {
-        const res = await api.get("/sessions/");
-        setSessions(res.data);
+        setSessions(await fetchAllPages<CandidateSession>("/sessions/"));
       } catch {
         toast.error("Failed to load sessions");
       } finally {
@@ -196,7 +195,7 @@ export default function CandidatesPage() {
                       {response.video_file && (
                         <div className="mt-3">
                           <video
-                            src={`http://localhost:8000${response.video_file}`}
+                            src={mediaUrl(response.video_file)}
                             controls
                             className="w-full rounded-lg max-h-48 bg-black/40"
                           />
@@ -1,7 +1,7 @@
 "use client";
 
 import { useEffect, useState } from "react";
-import api from "@/lib/api";
+import api, { fetchAllPages } from "@/lib/api";
 import { Interview, QuestionCategory } from "@/types";
 import { useAuth } from "@/context/AuthContext";
 import GlassPanel from "@/components/GlassPanel";
@@ -53,11 +53,11 @@ export default function InterviewsPage() {
 
   const fetchData = async () => {
     try {
-      const [interviewRes, categoryRes] = await Promise.all([
-        api.get("/interviews/"),
+      const [interviewList, categoryRes] = await Promise.all([
+        fetchAllPages<Interview>("/interviews/", { omit: "recruiter" }),
         api.get("/questions/categories/"),
       ]);
-      setInterviews(interviewRes.data);
+      setInterviews(interviewList);
       setCategories(categoryRes.data);
     } catch {
       toast.error("Failed to load data");
@@ -304,12 +304,12 @@ function CandidateInterviewList() {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [interviewRes, sessionRes] = await Promise.all([
-          api.get("/interviews/"),
-          api.get("/sessions/"),
+        const [interviewList, sessionList] = await Promise.all([
+          fetchAllPages<Interview>("/interviews/", { omit: "recruiter" }),
+          fetchAllPages<import("@/types").CandidateSession>("/sessions/", { omit: "candidate" }),
         ]);
-        setInterviews(interviewRes.data);
-        setSessions(sessionRes.data);
+        setInterviews(interviewList);
+        setSessions(sessionList);
       } catch {
         toast.error("Failed to load interviews");
       } finally {
@@ -3,7 +3,8 @@
 import { useEffect, useState } from "react";
 import { useAuth } from "@/context/AuthContext";
 import api from "@/lib/api";
-import { Interview, CandidateSession, MockSession } from "@/types";
+import { usePagedList } from "@/hooks/usePagedList";
+import { Interview, CandidateSession, MockSession, DashboardSummary } from "@/types";
 import GlassPanel from "@/components/GlassPanel";
 import { Button } from "@/components/ui/button";
 import { Badge } from "@/components/ui/badge";
@@ -37,39 +38,58 @@ export default function DashboardPage() {
   return user.role === "recruiter" ? <RecruiterDashboard /> : <CandidateDashboard />;
 }
 
-function RecruiterDashboard() {
-  const [interviews, setInterviews] = useState<Interview[]>([]);
-  const [sessions, setSessions] = useState<CandidateSession[]>([]);
+/** Stat counts come from the summary endpoint, so the dashboard never pages through whole listings. */
+function useDashboardSummary(errorMessage: string) {
+  const [summary, setSummary] = useState<DashboardSummary | null>(null);
   const [isLoading, setIsLoading] = useState(true);
 
   useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const [interviewRes, sessionRes] = await Promise.all([
-          api.get("/interviews/"),
-          api.get("/sessions/"),
-        ]);
-        setInterviews(interviewRes.data);
-        setSessions(sessionRes.data);
-      } catch {
-        toast.error("Failed to load dashboard data");
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchData();
-  }, []);
-
-  const activeInterviews = interviews.filter((i) => i.status === "active").length;
-  const completedSessions = sessions.filter((s) => s.status === "completed" || s.status === "reviewed").length;
+    api
+      .get<DashboardSummary>("/dashboard/summary/")
+      .then((res) => setSummary(res.data))
+      .catch(() => toast.error(errorMessage))
+      .finally(() => setIsLoading(false));
+  }, [errorMessage]);
+
+  return { summary, isLoading };
+}
+
+function LoadMoreButton({ list }: { list: { hasMore: boolean; isLoadingMore: boolean; loadMore: () => Promise<void> } }) {
+  if (!list.hasMore) return null;
+  return (
+    <div className="flex justify-center mt-4">
+      <Button
+        onClick={list.loadMore}
+        disabled={list.isLoadingMore}
+        size="sm"
+        variant="outline"
+        className="border-white/10 text-white/60 text-xs"
+      >
+        {list.isLoadingMore ? "Loading..." : "Load more"}
+      </Button>
+    </div>
+  );
+}
+
+function RecruiterDashboard() {
+  const { summary, isLoading: summaryLoading } = useDashboardSummary("Failed to load dashboard data");
+  const interviewList = usePagedList<Interview>("/interviews/", { omit: "recruiter", page_size: 5 });
+  const sessionList = usePagedList<CandidateSession>("/sessions/", { page_size: 5 });
+  const interviews = interviewList.items;
+  const sessions = sessionList.items;
+
+  useEffect(() => {
+    if (interviewList.error || sessionList.error) toast.error("Failed to load dashboard data");
+  }, [interviewList.error, sessionList.error]);
+
   const stats = [
-    { label: "Total Interviews", value: interviews.length, icon: FileText, glow: "violet" as const },
-    { label: "Active Interviews", value: activeInterviews, icon: Video, glow: "cyan" as const },
-    { label: "Candidates", value: sessions.length, icon: Users, glow: "violet" as const },
-    { label: "Completed", value: completedSessions, icon: CheckCircle, glow: "cyan" as const },
+    { label: "Total Interviews", value: summary?.interviews.total ?? 0, icon: FileText, glow: "violet" as const },
+    { label: "Active Interviews", value: summary?.interviews.active ?? 0, icon: Video, glow: "cyan" as const },
+    { label: "Candidates", value: summary?.sessions.total ?? 0, icon: Users, glow: "violet" as const },
+    { label: "Completed", value: summary?.sessions.completed ?? 0, icon: CheckCircle, glow: "cyan" as const },
   ];
 
-  if (isLoading) return <DashboardSkeleton />;
+  if (summaryLoading || interviewList.isLoading || sessionList.isLoading) return <DashboardSkeleton />;
 
   return (
     <div className="space-y-6">
@@ -120,7 +140,7 @@ function RecruiterDashboard() {
           <p className="text-white/40 text-sm py-8 text-center">No interviews yet. Create your first one!</p>
         ) : (
           <div className="space-y-3">
-            {interviews.slice(0, 5).map((interview) => (
+            {interviews.map((interview) => (
               <Link key={interview.id} href="/dashboard/interviews">
                 <div className="flex items-center justify-between p-4 rounded-lg bg-white/[0.02] hover:bg-white/[0.04] transition-colors border border-white/5">
                   <div className="flex items-center gap-4">
@@ -163,7 +183,7 @@ function RecruiterDashboard() {
           <p className="text-white/40 text-sm py-8 text-center">No candidate sessions yet.</p>
         ) : (
           <div className="space-y-3">
-            {sessions.slice(0, 5).map((session) => (
+            {sessions.map((session) => (
               <Link key={session.id} href="/dashboard/candidates">
                 <div className="flex items-center justify-between p-4 rounded-lg bg-white/[0.02] hover:bg-white/[0.04] transition-colors border border-white/5">
                   <div className="flex items-center gap-4">
@@ -208,30 +228,18 @@ function RecruiterDashboard() {
 function CandidateDashboard() {
   const { user } = useAuth();
   const router = useRouter();
-  const [interviews, setInterviews] = useState<Interview[]>([]);
-  const [sessions, setSessions] = useState<CandidateSession[]>([]);
-  const [mockSessions, setMockSessions] = useState<MockSession[]>([]);
-  const [isLoading, setIsLoading] = useState(true);
+  const { summary, isLoading: summaryLoading } = useDashboardSummary("Failed to load data");
+  const interviewList = usePagedList<Interview>("/interviews/", { omit: "recruiter" });
+  const sessionList = usePagedList<CandidateSession>("/sessions/", { omit: "candidate" });
+  // A failed mock history just shows as empty.
+  const mockList = usePagedList<MockSession>("/mock/sessions/", { omit: "candidate", page_size: 5 });
+  const interviews = interviewList.items;
+  const sessions = sessionList.items;
+  const mockSessions = mockList.items;
 
   useEffect(() => {
-    const fetchData = async () => {
-      try {
-        const [interviewRes, sessionRes, mockRes] = await Promise.all([
-          api.get("/interviews/"),
-          api.get("/sessions/"),
-          api.get("/mock/sessions/").catch(() => ({ data: [] })),
-        ]);
-        setInterviews(interviewRes.data);
-        setSessions(sessionRes.data);
-        setMockSessions(mockRes.data);
-      } catch {
-        toast.error("Failed to load data");
-      } finally {
-        setIsLoading(false);
-      }
-    };
-    fetchData();
-  }, []);
+    if (interviewList.error || sessionList.error) toast.error("Failed to load data");
+  }, [interviewList.error, sessionList.error]);
 
   const handleStartInterview = async (interviewId: string) => {
     try {
@@ -242,10 +250,12 @@ function CandidateDashboard() {
     }
   };
 
-  const completedCount = sessions.filter((s) => s.status === "completed" || s.status === "reviewed").length;
-  const inProgressCount = sessions.filter((s) => s.status === "in_progress").length;
+  const completedCount = summary?.sessions.completed ?? 0;
+  const inProgressCount = summary?.sessions.in_progress ?? 0;
 
-  if (isLoading) return <DashboardSkeleton />;
+  if (summaryLoading || interviewList.isLoading || sessionList.isLoading || mockList.isLoading) {
+    return <DashboardSkeleton />;
+  }
 
   return (
     <div className="space-y-6">
@@ -261,7 +271,7 @@ function CandidateDashboard() {
         <motion.div variants={fadeInUp} initial="initial" animate="animate" transition={{ duration: 0.4 }}>
           <GlassPanel hover3d glow="violet" className="p-6">
             <Video className="w-5 h-5 text-violet-400 mb-3" />
-            <p className="text-2xl font-bold text-white">{interviews.length}</p>
+            <p className="text-2xl font-bold text-white">{summary?.interviews.total ?? 0}</p>
             <p className="text-sm text-white/40 mt-1">Available Interviews</p>
           </GlassPanel>
         </motion.div>
@@ -344,6 +354,7 @@ function CandidateDashboard() {
             })}
           </div>
         )}
+        <LoadMoreButton list={interviewList} />
       </GlassPanel>
 
       {/* My Sessions */}
@@ -394,6 +405,7 @@ function CandidateDashboard() {
               </div>
             ))}
           </div>
+          <LoadMoreButton list={sessionList} />
         </GlassPanel>
       )}
 
@@ -421,7 +433,7 @@ function CandidateDashboard() {
           </div>
         ) : (
           <div className="space-y-3">
-            {mockSessions.slice(0, 5).map((ms) => (
+            {mockSessions.map((ms) => (
               <Link
                 key={ms.id}
                 href={
@@ -3,6 +3,7 @@
 import { useEffect, useState, useCallback } from "react";
 import { useParams, useRouter } from "next/navigation";
 import api from "@/lib/api";
+import { uploadErrorMessage, uploadRecording } from "@/lib/upload";
 import { CandidateSession, Question } from "@/types";
 import AuthGuard from "@/components/AuthGuard";
 import GlassPanel from "@/components/GlassPanel";
@@ -79,14 +80,11 @@ export default function InterviewRoomPage() {
     setIsUploading(true);
 
     try {
-      const formData = new FormData();
-      formData.append("session_id", sessionId);
-      formData.append("question_id", currentQuestion.id);
-      formData.append("video", blob, `response_${currentQuestion.id}.webm`);
-      formData.append("duration", duration.toString());
-
-      await api.post("/upload-video/", formData, {
-        headers: { "Content-Type": "multipart/form-data" },
+      await uploadRecording(blob, `response_${currentQuestion.id}.webm`, {
+        target: "interview",
+        session_id: sessionId,
+        question_id: currentQuestion.id,
+        duration,
       });
 
       setAnsweredQuestions((prev) => new Set([...Array.from(prev), currentQuestion.id]));
@@ -95,8 +93,8 @@ export default function InterviewRoomPage() {
       if (currentIndex < questions.length - 1) {
         setCurrentIndex((prev) => prev + 1);
       }
-    } catch {
-      toast.error("Upload failed. Please try again.");
+    } catch (error) {
+      toast.error(uploadErrorMessage(error) ?? "Upload failed. Please try again.");
     } finally {
       setIsUploading(false);
     }
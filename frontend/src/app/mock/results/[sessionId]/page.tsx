@@ -24,6 +24,10 @@ import {
   BarChart3,
 } from "lucide-react";
 
+const PROGRESS_POLL_MS = 2000;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
 const fadeInUp = {
   initial: { opacity: 0, y: 20 },
   animate: { opacity: 1, y: 0 },
@@ -36,20 +40,64 @@ export default function MockResultsPage() {
 
   const [session, setSession] = useState<MockSession | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isAnalyzing, setIsAnalyzing] = useState(false);
+  const [analysisProgress, setAnalysisProgress] = useState({ done: 0, total: 0 });
 
   useEffect(() => {
+    let cancelled = false;
+
+    // Analysis runs in a background worker. Poll the progress endpoint, which
+    // answers 304 until something changes, until the session is analyzed.
+    const waitForAnalysis = async () => {
+      setIsAnalyzing(true);
+      let since = -1;
+      while (!cancelled) {
+        try {
+          const res = await api.get(`/mock/sessions/${sessionId}/progress/`, {
+            params: { since },
+            validateStatus: (status) => status === 200 || status === 304,
+          });
+          if (res.status === 200) {
+            since = res.data.version;
+            const responses: { analysis_status: string }[] = res.data.responses;
+            setAnalysisProgress({
+              done: responses.filter((r) => r.analysis_status === "completed").length,
+              total: responses.length,
+            });
+            const jobStatus = res.data.analysis_job?.status;
+            if (res.data.status === "analyzed" || res.data.status === "failed" || jobStatus === "failed") break;
+          }
+        } catch {
+          break;
+        }
+        await sleep(PROGRESS_POLL_MS);
+      }
+      setIsAnalyzing(false);
+    };
+
     const fetchResults = async () => {
       try {
-        const res = await api.get(`/mock/sessions/${sessionId}/results/`);
+        let res = await api.get(`/mock/sessions/${sessionId}/results/`);
+        if (res.data.status === "completed") {
+          await waitForAnalysis();
+          if (cancelled) return;
+          res = await api.get(`/mock/sessions/${sessionId}/results/`);
+        }
+        if (cancelled) return;
+        if (res.data.status === "failed") toast.error("AI analysis could not be completed.");
         setSession(res.data);
       } catch {
         toast.error("Failed to load results");
         router.push("/dashboard");
       } finally {
-        setIsLoading(false);
+        if (!cancelled) setIsLoading(false);
       }
     };
     fetchResults();
+
+    return () => {
+      cancelled = true;
+    };
   }, [sessionId, router]);
 
   if (isLoading) {
@@ -57,6 +105,13 @@ export default function MockResultsPage() {
       <AuthGuard>
         <div className="min-h-screen bg-grid p-6">
           <div className="max-w-4xl mx-auto space-y-6">
+            {isAnalyzing && (
+              <p className="text-white/50 text-sm">
+                Analyzing your interview. This can take a minute...
+                {analysisProgress.total > 0 &&
+                  ` (${analysisProgress.done} of ${analysisProgress.total} answers analyzed)`}
+              </p>
+            )}
             <Skeleton className="h-8 w-48 bg-white/5" />
             <Skeleton className="h-64 bg-white/5 rounded-xl" />
             <Skeleton className="h-48 bg-white/5 rounded-xl" />
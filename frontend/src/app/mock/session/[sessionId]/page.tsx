@@ -3,6 +3,7 @@
 import { useEffect, useState, useCallback, useRef } from "react";
 import { useParams, useRouter } from "next/navigation";
 import api from "@/lib/api";
+import { uploadErrorMessage, uploadRecording } from "@/lib/upload";
 import { MockSession, MockResponse } from "@/types";
 import { useVideoRecorder } from "@/hooks/useVideoRecorder";
 import { useFaceDetection } from "@/hooks/useFaceDetection";
@@ -154,15 +155,12 @@ export default function MockSessionPage() {
     setIsUploading(true);
 
     try {
-      const formData = new FormData();
-      formData.append("session_id", sessionId);
-      formData.append("question_id", currentResponse.question);
-      formData.append("video", recordedBlob, `mock_${currentResponse.question}.webm`);
-      formData.append("duration", duration.toString());
-      formData.append("emotion_data", JSON.stringify(emotionData));
-
-      await api.post("/mock/upload-video/", formData, {
-        headers: { "Content-Type": "multipart/form-data" },
+      await uploadRecording(recordedBlob, `mock_${currentResponse.question}.webm`, {
+        target: "mock",
+        session_id: sessionId,
+        question_id: currentResponse.question,
+        duration,
+        emotion_data: emotionData,
       });
 
       setAnsweredQuestions((prev) => new Set([...Array.from(prev), currentResponse.question]));
@@ -173,8 +171,8 @@ export default function MockSessionPage() {
       if (currentIndex < responses.length - 1) {
         setCurrentIndex((prev) => prev + 1);
       }
-    } catch {
-      toast.error("Upload failed. Please try again.");
+    } catch (error) {
+      toast.error(uploadErrorMessage(error) ?? "Upload failed. Please try again.");
     } finally {
       setIsUploading(false);
     }
@@ -184,7 +182,7 @@ export default function MockSessionPage() {
     setIsCompleting(true);
     try {
       await api.post(`/mock/sessions/${sessionId}/complete/`);
-      toast.success("Interview analyzed! Redirecting to results...");
+      toast.success("Interview submitted! Analyzing your responses...");
       router.push(`/mock/results/${sessionId}`);
     } catch {
       toast.error("Failed to complete session. Please try again.");
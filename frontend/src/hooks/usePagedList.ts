@@ -0,0 +1,55 @@
+"use client";
+
+import { useCallback, useEffect, useState } from "react";
+import { fetchPage } from "@/lib/api";
+
+interface UsePagedListReturn<T> {
+  items: T[];
+  hasMore: boolean;
+  isLoading: boolean;
+  isLoadingMore: boolean;
+  error: unknown;
+  loadMore: () => Promise<void>;
+}
+
+/** The first page of a cursor-paginated listing; `loadMore` follows its `next` link on demand. */
+export function usePagedList<T>(path: string, params: Record<string, string | number> = {}): UsePagedListReturn<T> {
+  const [items, setItems] = useState<T[]>([]);
+  const [next, setNext] = useState<string | null>(null);
+  const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [error, setError] = useState<unknown>(null);
+  const paramsKey = JSON.stringify(params);
+
+  useEffect(() => {
+    let cancelled = false;
+    setIsLoading(true);
+    fetchPage<T>(path, JSON.parse(paramsKey))
+      .then((page) => {
+        if (cancelled) return;
+        setItems(page.results);
+        setNext(page.next);
+      })
+      .catch((err) => !cancelled && setError(err))
+      .finally(() => !cancelled && setIsLoading(false));
+    return () => {
+      cancelled = true;
+    };
+  }, [path, paramsKey]);
+
+  const loadMore = useCallback(async () => {
+    if (!next || isLoadingMore) return;
+    setIsLoadingMore(true);
+    try {
+      const page = await fetchPage<T>(next);
+      setItems((current) => [...current, ...page.results]);
+      setNext(page.next);
+    } catch (err) {
+      setError(err);
+    } finally {
+      setIsLoadingMore(false);
+    }
+  }, [next, isLoadingMore]);
+
+  return { items, hasMore: next !== null, isLoading, isLoadingMore, error, loadMore };
+}
@@ -59,4 +59,31 @@ api.interceptors.response.use(
   }
 );
 
+/** One page of a cursor-paginated listing. */
+export interface Page<T> {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+}
+
+/** One page of a cursor-paginated listing; `path` may also be a page's `next` link. */
+export async function fetchPage<T>(path: string, params: Record<string, string | number> = {}): Promise<Page<T>> {
+  const res = await api.get<Page<T>>(path, { params });
+  return res.data;
+}
+
+/** Every item of a cursor-paginated listing, following its `next` links. */
+export async function fetchAllPages<T>(path: string, params: Record<string, string | number> = {}): Promise<T[]> {
+  let res = await api.get<Page<T>>(path, { params: { page_size: 100, ...params } });
+  const items = [...res.data.results];
+  while (res.data.next) {
+    res = await api.get<Page<T>>(res.data.next);
+    items.push(...res.data.results);
+  }
+  return items;
+}
+
+/** Absolute URL for a path returned by the API, such as a signed video URL. */
+export const mediaUrl = (path: string) => new URL(path, API_URL).toString();
+
 export default api;
@@ -0,0 +1,59 @@
+import axios from "axios";
+import api from "@/lib/api";
+
+interface UploadTarget {
+  target: "mock" | "interview";
+  session_id: string;
+  question_id: string;
+  duration: number;
+  emotion_data?: unknown;
+}
+
+const MAX_CHUNK_RETRIES = 5;
+
+const sleep = (ms: number) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function isRejection(error: unknown) {
+  const status = axios.isAxiosError(error) ? error.response?.status : undefined;
+  return status !== undefined && status >= 400 && status < 500 && status !== 409;
+}
+
+/** The server's reason for rejecting an upload, if it gave one. */
+export function uploadErrorMessage(error: unknown): string | undefined {
+  if (!isRejection(error) || !axios.isAxiosError(error)) return undefined;
+  const data = error.response?.data;
+  return data?.error ?? data?.video?.[0];
+}
+
+/**
+ * Upload a recording with the resumable chunked upload API.
+ *
+ * Each chunk is retried with backoff; after a failure the server's offset
+ * is re-read, so a dropped connection only resends the current chunk.
+ */
+export async function uploadRecording(blob: Blob, filename: string, target: UploadTarget) {
+  const created = await api.post("/uploads/", { ...target, filename, size: blob.size });
+  const uploadId: string = created.data.upload_id;
+  const chunkSize: number = created.data.chunk_size;
+  let offset: number = created.data.offset;
+  let failures = 0;
+
+  while (offset < blob.size) {
+    try {
+      const res = await api.put(`/uploads/${uploadId}/`, blob.slice(offset, offset + chunkSize), {
+        headers: { "Content-Type": "application/octet-stream", "Upload-Offset": String(offset) },
+      });
+      offset = res.data.offset;
+      failures = 0;
+    } catch (error) {
+      // The server refused the file itself (e.g. not a video); resending won't help.
+      if (isRejection(error)) throw error;
+      if (++failures > MAX_CHUNK_RETRIES) throw error;
+      await sleep(500 * 2 ** failures);
+      const status = await api.get(`/uploads/${uploadId}/`);
+      offset = status.data.offset;
+    }
+  }
+
+  return api.post(`/uploads/${uploadId}/complete/`);
+}
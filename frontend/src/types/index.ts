@@ -96,7 +96,7 @@ export interface MockSession {
   id: string;
   candidate: User;
   session_type: "behavioral" | "technical" | "mixed";
-  status: "in_progress" | "completed" | "analyzed";
+  status: "in_progress" | "completed" | "analyzed" | "failed";
   overall_score: number | null;
   overall_feedback: string;
   behavioral_insights: BehavioralInsights;
@@ -118,8 +118,14 @@ export interface MockResponse {
   transcript: string;
   ai_score: number | null;
   ai_feedback: string;
+  communication_score: number | null;
+  relevance_score: number | null;
+  structure_score: number | null;
+  strengths: string[];
+  improvements: string[];
   confidence_score: number | null;
   emotion_data: EmotionData;
+  emotion_timeline?: EmotionTimeline;
   duration: number;
   analysis_status: "pending" | "analyzing" | "completed" | "failed";
   created_at: string;
@@ -138,6 +144,48 @@ export interface EmotionData {
   averages?: Record<string, number>;
   dominant?: string;
   timeline?: Array<{ time: number; emotions: Record<string, number> }>;
+  metrics?: EmotionMetrics;
+}
+
+// Computed server-side from the timeline once the answer is analyzed.
+export interface EmotionMetrics {
+  frames: number;
+  duration: number;
+  averages: Record<string, number>;
+  variance: Record<string, number>;
+  dominant: string;
+  dominant_share: Record<string, number>;
+  transitions: number;
+  transitions_per_minute: number;
+  stability: number;
+  volatility: number;
+}
+
+// Only returned with `?include=timeline`; `values[i]` lines up with `time[i]` and holds one score per entry in `emotions`.
+export interface EmotionTimeline {
+  emotions: string[];
+  time: number[];
+  values: number[][];
+}
+
+export interface DashboardSummary {
+  interviews: { total: number; active: number };
+  sessions: { total: number; in_progress: number; completed: number };
+}
+
+export interface ScoreSummary {
+  count: number;
+  averages: Record<
+    "ai_score" | "communication_score" | "relevance_score" | "structure_score" | "confidence_score",
+    number | null
+  >;
+  distribution: { min: number; max: number; count: number }[];
+}
+
+export interface ScoreAnalytics {
+  overall: ScoreSummary;
+  users: (ScoreSummary & { id: string; email: string })[];
+  questions: (ScoreSummary & { id: string; text: string; category: string })[];
 }
 
 export interface AiFeedback {